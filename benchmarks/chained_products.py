@@ -0,0 +1,50 @@
+"""
+Time chained products of symbolic Vals, ie. `x0 * x1 * ... * x999`.
+
+    python benchmarks/chained_products.py [n]
+
+Compares:
+    - eager, without quantity-free tracking (quantity_simplify() after every product)
+    - eager (the default)
+    - lazy (the `lazy` global option)
+"""
+import sys
+import time
+
+from mathpad import *
+import mathpad.core.val as val_module
+
+
+def chained_product(n: int) -> float:
+    xs = [f"x{i}" * m for i in range(n)]
+
+    start = time.perf_counter()
+    acc = xs[0]
+    for x in xs[1:]:
+        acc = acc * x
+    acc.expr  # materialize, in lazy mode
+    return time.perf_counter() - start
+
+
+def main(n: int):
+    is_quantity_free = val_module._is_quantity_free
+
+    val_module._is_quantity_free = lambda obj: False
+    try:
+        untracked = chained_product(n)
+    finally:
+        val_module._is_quantity_free = is_quantity_free
+
+    eager = chained_product(n)
+
+    with global_options(lazy=True):
+        lazy = chained_product(n)
+
+    print(f"{n} chained products of symbolic Vals:")
+    print(f"  eager, untracked:  {untracked:.3f}s")
+    print(f"  eager:             {eager:.3f}s")
+    print(f"  lazy:              {lazy:.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,56 @@
+"""
+Time `import mathpad` in a fresh interpreter, failing if it is over budget.
+
+    python benchmarks/import_time.py [--budget SECONDS] [--repeat N]
+
+Reports the best of N runs (the least noisy), and which of the heavy optional dependencies got imported.
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+# seconds. Measured at ~0.75s; most of it is sympy itself
+DEFAULT_BUDGET = 1.5
+
+HEAVY_MODULES = ["scipy", "numpy", "IPython", "plotly", "tqdm", "mathpad.codegen"]
+
+PROBE = f"""
+import json, sys, time
+start = time.perf_counter()
+import mathpad
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "imported": [m for m in {HEAVY_MODULES!r} if m in sys.modules],
+}}))
+"""
+
+
+def measure(repeat: int) -> dict:
+    runs = [
+        json.loads(subprocess.run(
+            [sys.executable, "-c", PROBE], check=True, capture_output=True, text=True
+        ).stdout)
+        for _ in range(repeat)
+    ]
+    return min(runs, key=lambda run: run["seconds"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    result = measure(args.repeat)
+    print(f"import mathpad: {result['seconds']:.3f}s (budget {args.budget:.3f}s)")
+    print(f"heavy modules imported: {result['imported'] or 'none'}")
+
+    if result["seconds"] > args.budget:
+        print("OVER BUDGET")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Micro-benchmarks of the core Val / Vector / Matrix operations, compared against stored baselines.
+
+    python benchmarks/micro.py [--filter SUBSTRING] [--repeat N] [--threshold FRACTION] [--save] [--json PATH]
+
+Each benchmark is timed with `timeit` (best of N repeats, the least noisy), and compared with
+the time stored in `benchmarks/baselines/micro.json`. A benchmark more than `--threshold` slower
+than its baseline (default 0.5, ie. 1.5x) is a regression, and the script exits with status 1.
+
+`--save` overwrites the baselines with the current timings. Baselines are machine-specific,
+so re-save them before comparing on a different machine.
+Timings are taken with sympy's cache warm, as they would be in a notebook session.
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+from typing import Any, Callable, Dict
+
+from mathpad import *
+from mathpad.core.vector_space import VectorSpace
+
+BASELINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "micro.json")
+
+DEFAULT_THRESHOLD = 0.5
+
+# name -> setup function, which returns the statement to time
+BENCHMARKS: Dict[str, Callable[[], Callable[[], Any]]] = {}
+
+
+def benchmark(setup: Callable[[], Callable[[], Any]]):
+    BENCHMARKS[setup.__name__] = setup
+    return setup
+
+
+@benchmark
+def val_construct_symbol():
+    return lambda: "x" * m
+
+
+@benchmark
+def val_construct_number():
+    return lambda: 5 * m
+
+
+@benchmark
+def val_add():
+    x, y = "x" * m, "y" * m
+    return lambda: x + y
+
+
+@benchmark
+def val_add_convert():
+    x, y = "x" * m, "y" * km
+    return lambda: x + y
+
+
+@benchmark
+def val_mul():
+    x, y = "x" * m, "y" * s
+    return lambda: x * y
+
+
+@benchmark
+def val_pow():
+    x = "x" * m
+    return lambda: x ** 2
+
+
+@benchmark
+def val_in_units():
+    x = 5 * km
+    return lambda: x.in_units(m)
+
+
+@benchmark
+def equation_construct():
+    x, y = "x" * m, "y" * km
+    return lambda: x == y
+
+
+@benchmark
+def subs_val():
+    x, y, z = "x" * m, "y" * m, "z" * m
+    expr = x * y + y * z + z * x
+    substitution = {x: 1, y: 2 * km, z: 3}
+    return lambda: subs(expr, substitution)
+
+
+@benchmark
+def solve_linear_2x2():
+    x, y = "x" * m, "y" * m
+    equations = [x + y == 3 * m, x - 2 * y == 1 * m]
+    return lambda: solve(equations, [x, y])
+
+
+@benchmark
+def simplify_trig():
+    theta = "theta" * rad
+    expr = sin(theta) ** 2 + cos(theta) ** 2 + sin(theta) * cos(theta) / cos(theta)
+    return lambda: simplify(expr)
+
+
+@benchmark
+def matrix_matmul_vector():
+    O1, O2 = R3("O1"), R3("O2")
+    a = ["a" + str(i) for i in range(9)]
+    A = Mat[O1, O2](a[0:3], a[3:6], a[6:9])
+    v = "v" @ O2
+    return lambda: A @ v
+
+
+@benchmark
+def matrix_construct_12x12():
+    n = 12
+    Q = VectorSpace.new("Q12", tuple(f"q{i}" for i in range(n)), (m,) * n)("Q")
+    F = VectorSpace.new("F12", tuple(f"f{i}" for i in range(n)), (N,) * n)("F")
+    rows = [[f"k{i}_{j}" * N / m for j in range(n)] for i in range(n)]
+    return lambda: Mat[Q, F](*rows)
+
+
+@benchmark
+def as_numpy_func_build():
+    x, y = "x" * m, "y" * m
+    O = R3("O") * m
+    vec = O[x * y, x + y, x - y]
+    return lambda: mathpad.codegen.as_numpy_func(vec)
+
+
+@benchmark
+def as_numpy_func_call():
+    x, y = "x" * m, "y" * m
+    O = R3("O") * m
+    fn = mathpad.codegen.as_numpy_func(O[x * y, x + y, x - y])
+    args = {x: list(range(1000)), y: list(range(1000))}
+    return lambda: fn(args)
+
+
+@benchmark
+def frame_tree_to_numpy_7_links():
+    frames = [R3("F0") * m]
+    tree = FrameTree(frames[0])
+    subs = {}
+
+    for idx in range(1, 8):
+        theta = f"theta{idx}" * rad
+        subs[theta] = [0.001 * step * idx for step in range(1000)]
+        frame = R3(f"F{idx}") * m
+        tree.add(
+            frame, frames[-1],
+            rotation=[[cos(theta), -sin(theta), 0], [sin(theta), cos(theta), 0], [0, 0, 1]],
+            translation=frames[-1][0.5, 0, 0]
+        )
+        frames.append(frame)
+
+    return lambda: tree.to_numpy(frames[-1], frames[0], subs)
+
+
+def measure(setup: Callable[[], Callable[[], Any]], repeat: int) -> float:
+    "Seconds per call of the statement returned by `setup()`"
+    timer = timeit.Timer(setup())
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--save", action="store_true", help="store the timings as the new baselines")
+    parser.add_argument("--json", help="also write the timings to this path")
+    args = parser.parse_args()
+
+    baselines: Dict[str, float] = {}
+    if os.path.exists(BASELINES_PATH):
+        with open(BASELINES_PATH) as f:
+            baselines = json.load(f)
+
+    results: Dict[str, float] = {}
+    regressions = []
+
+    for name, setup in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+
+        seconds = results[name] = measure(setup, args.repeat)
+        baseline = baselines.get(name)
+
+        if baseline is None:
+            comparison = "(no baseline)"
+        else:
+            ratio = seconds / baseline
+            comparison = f"{ratio:5.2f}x baseline"
+            if ratio > 1 + args.threshold:
+                comparison += "  REGRESSION"
+                regressions.append(name)
+
+        print(f"{name:<24} {seconds * 1e6:12.2f}us  {comparison}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.save:
+        os.makedirs(os.path.dirname(BASELINES_PATH), exist_ok=True)
+        with open(BASELINES_PATH, "w") as f:
+            json.dump({**baselines, **results}, f, indent=2, sort_keys=True)
+        print(f"saved baselines to {BASELINES_PATH}")
+
+    elif regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+End-to-end benchmarks of the example systems in `examples/`, timing each phase of the pipeline.
+
+    python benchmarks/models.py [--filter SUBSTRING] [--no-memory] [--json PATH]
+
+For each model, reports the time spent building the equations ("model") and in each phase of
+`simulate_dynamic_system` (substitute, simplify, solve, lambdify, integrate), plus peak memory.
+Peak memory is measured with `tracemalloc` in a second run, as tracing slows everything down.
+
+`--json` writes the results (with the mathpad and sympy versions) for tracking across versions.
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+import sympy
+
+import mathpad
+from mathpad import *
+from mathpad.library.mechanic import euler_lagrange, kinetic_energy, gravitational_energy, elastic_energy
+
+# name -> function building the equations, returning the keyword arguments for simulate_dynamic_system
+MODELS: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+
+def model(build: Callable[[], Dict[str, Any]]):
+    MODELS[build.__name__] = build
+    return build
+
+
+@model
+def simple_pendulum():
+    theta = "theta(t)" * rad
+    m = "m" * kg
+    l = "l" * meters
+    g = "g" * meters / second ** 2
+
+    O = R2("O") * meters
+    r = O.from_polar(l, theta - pi / 2)
+
+    T = kinetic_energy(m=m, v=diff(r).norm())
+    V = gravitational_energy(m=m, h=r.j, g=g)
+
+    return dict(
+        dynamics_equations=[euler_lagrange(KE=T, PE=V, NCF=0 * newton * meter, var=theta)],
+        x_final=5, max_step=0.01,
+        substitute={g: 9.81, l: 0.5},
+        initial_conditions={theta: pi / 3, diff(theta): 0},
+        record=[theta, diff(theta), diff(theta, 2)],
+    )
+
+
+@model
+def double_pendulum():
+    theta = "theta(t)" * rad
+    phi = "phi(t)" * rad
+    m = "m" * kg
+    l = "l" * meters
+    g = "g" * meters / second ** 2
+
+    O = R2("O") * meters
+    r1 = O.from_polar(l, theta - pi / 2)
+    r2 = r1 + O.from_polar(l, phi - pi / 2)
+
+    T = kinetic_energy(m=m, v=diff(r1).norm()) + kinetic_energy(m=m, v=diff(r2).norm())
+    V = gravitational_energy(m=m, h=r1.j, g=g) + gravitational_energy(m=m, h=r2.j, g=g)
+
+    return dict(
+        dynamics_equations=[
+            euler_lagrange(KE=T, PE=V, NCF=0 * N * meter, var=theta),
+            euler_lagrange(KE=T, PE=V, NCF=0 * N * meter, var=phi),
+        ],
+        x_final=5, max_step=0.01,
+        substitute={g: 9.81, l: 0.5, m: 1},
+        initial_conditions={theta: pi / 3, diff(theta): 0, phi: 0, diff(phi): 0},
+        record=[theta, phi],
+    )
+
+
+@model
+def cart_spring_pendulum():
+    x = "x(t)" * m
+    m1 = "m1" * kg
+    theta = "theta(t)" * radians
+    m2 = "m2" * kg
+    k = "k" * N / m
+    l = "l" * m
+    F = "F(t)" * N
+    g = "g" * meter / s ** 2
+
+    O = R2("O") * m
+    r_1 = O[x, 0]
+    r_2 = r_1 + O.from_polar(l, pi / 2 - theta)
+
+    T = kinetic_energy(m=m1, v=diff(x)) + kinetic_energy(m=m2, v=diff(r_2).norm())
+    V = elastic_energy(k=k, dx=x) + gravitational_energy(m=m2, h=r_2.j, g=g)
+
+    return dict(
+        dynamics_equations=[
+            euler_lagrange(KE=T, PE=V, NCF=F, var=x),
+            euler_lagrange(KE=T, PE=V, NCF=0 * N * m, var=theta),
+        ],
+        x_final=20, max_step=0.01,
+        substitute={
+            k: 100, m1: 10, m2: 1, l: 0.5, g: 9.81,
+            # a small perturbation
+            F: piecewise(t, [(1, 1 * N), (float("inf"), 0 * N)]),
+        },
+        initial_conditions={x: 0, diff(x): 0, theta: 0, diff(theta): 0},
+        record=[x, theta],
+    )
+
+
+@model
+def cart_spring_cargo():
+    x1, x2, x3 = "x1(t)" * m, "x2(t)" * m, "x3(t)" * m
+    v1, v2, v3 = diff(x1), diff(x2), diff(x3)
+    m1, m2, m3 = "m1" * kg, "m2" * kg, "m3" * kg
+    c = "c" * N * s / m
+    F = "F(t)" * N
+    k1, k2 = "k1" * N / m, "k2" * N / m
+
+    return dict(
+        dynamics_equations=[
+            m1 * diff(v1) == F + k1 * (x2 - x1) + c * (v2 - v1) + c * (v3 - v1),
+            m2 * diff(v2) == k2 * (x3 - x2) - c * (v2 - v1) - k1 * (x2 - x1),
+            m3 * diff(v3) == -c * (v3 - v1) - k2 * (x3 - x2),
+        ],
+        x_final=10, max_step=0.01,
+        substitute={
+            k1: 1, k2: 1, m1: 1, m2: 1, m3: 1, c: 0.5,
+            F: piecewise(t, [(1, 1 * N), (float("inf"), 0 * N)]),
+        },
+        initial_conditions={x1: 0, v1: 0, x2: 0, v2: 0, x3: 0, v3: 0},
+        record=[v1, v2, v3],
+    )
+
+
+def braking_deceleration():
+    "Not a dynamic system; only solved"
+    t = "t" * seconds
+    equation = 5 * miles / hour - t * (2 * meters / second ** 2) == 0
+
+    start = time.perf_counter()
+    solve([equation], [t])
+    return {"solve": time.perf_counter() - start}
+
+
+def run_model(build: Callable[[], Dict[str, Any]]) -> Dict[str, float]:
+    "Seconds spent in each phase of building and simulating the model"
+    start = time.perf_counter()
+    kwargs = build()
+    timings = {"model": time.perf_counter() - start}
+
+    simulate_dynamic_system(
+        **kwargs,
+        verbose=False,
+        display_plots=False,
+        display_progress_bar=False,
+        timings=timings,
+    )
+    return timings
+
+
+def peak_memory(run: Callable[[], Any]) -> int:
+    "Peak memory allocated (in bytes) while calling `run()`"
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", default="", help="only run models whose name contains this")
+    parser.add_argument("--no-memory", action="store_true", help="skip the (slow) peak memory measurement")
+    parser.add_argument("--json", help="write the results to this path")
+    args = parser.parse_args()
+
+    runs: Dict[str, Callable[[], Dict[str, float]]] = {
+        name: lambda build=build: run_model(build) for name, build in MODELS.items()
+    }
+    runs["braking_deceleration"] = braking_deceleration
+
+    results: Dict[str, Dict[str, Any]] = {}
+
+    for name, run in runs.items():
+        if args.filter not in name:
+            continue
+
+        # the first run pays for sympy's cache warming up, as it would in a fresh session
+        timings = run()
+        result: Dict[str, Any] = {"seconds": timings, "total_seconds": sum(timings.values())}
+
+        if not args.no_memory:
+            sympy.core.cache.clear_cache()
+            result["peak_memory_bytes"] = peak_memory(run)
+
+        results[name] = result
+
+        phases = "  ".join(f"{phase} {seconds:.3f}s" for phase, seconds in timings.items())
+        memory = f"  peak {result['peak_memory_bytes'] / 2**20:.1f}MiB" if "peak_memory_bytes" in result else ""
+        print(f"{name:<22} total {result['total_seconds']:.3f}s  |  {phases}{memory}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "mathpad": mathpad.__version__,
+                "sympy": sympy.__version__,
+                "python": sys.version.split()[0],
+                "models": results,
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,23 +7,59 @@ except ImportError:
     # if micropip isn't available, we're not running in pyodide.
     pass
 
+import sys as _sys
+import importlib as _importlib
+from importlib.util import find_spec as _find_spec
+
 import sympy
 
 from mathpad.core import *
 from mathpad.maths import *
+from mathpad._global_options import set_global_options, global_options, _global_options
+from mathpad._profiling import profile, Profile
 
 from mathpad.library.mathpad_constructor import mathpad_constructor
 from mathpad.simulate_dynamic_system import simulate_dynamic_system
+from mathpad.linearize import linearize, Linearization, StateSpace
 
-import mathpad.codegen
+# bound so that `from mathpad import *` gives access to the submodules, ie. `mathpad.codegen`
+import mathpad
 
-try:
+if "IPython" in _sys.modules:
+    # already paid for in an IPython session; otherwise imported on first use (see __getattr__)
     from IPython.display import display
-except ImportError:
-    pass
 
 
-sympy.init_printing()  # type: ignore
-sympy.printing.printer.Printer.set_global_settings(min=-3, max=4)  # type: ignore
+if not _global_options.headless:
+    sympy.init_printing()  # type: ignore
+    sympy.printing.printer.Printer.set_global_settings(min=-3, max=4)  # type: ignore
 
 __version__ = "2.1.0"
+
+
+# imported on first access (PEP 562), so that `import mathpad` stays cheap
+_LAZY_SUBMODULES = {"codegen"}
+_LAZY_ATTRIBUTES = {"display": "IPython.display"}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        return _importlib.import_module(f"mathpad.{name}")
+
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(_importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module 'mathpad' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_SUBMODULES, *_LAZY_ATTRIBUTES})
+
+
+# `from mathpad import *` exports every public name, as before `codegen` and `display` were made lazy.
+# Listing them resolves them through __getattr__, so star-imports still get them (and import their dependencies)
+__all__ = [name for name in globals() if not name.startswith("_")] + sorted(_LAZY_SUBMODULES)
+if "display" not in __all__ and not _global_options.headless and _find_spec("IPython"):
+    __all__.append("display")
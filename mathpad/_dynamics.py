@@ -0,0 +1,77 @@
+"Derivative bookkeeping shared by simulate_dynamic_system() and linearize()"
+
+from itertools import zip_longest
+from typing import Collection, Dict, List, Set, Tuple
+
+import sympy
+from sympy import Derivative
+from sympy.core.function import Function, AppliedUndef
+
+from mathpad._profiling import profiled
+
+
+@profiled("derivative collection")
+def collect_derivatives(
+    sympy_eqns: Collection[sympy.Equality]
+) -> Tuple[Dict[Function, int], Dict[Function, int]]:
+    "Find the highest and lowest derivative of each unknown function in the equations"
+
+    derivatives: Set[Tuple[Function, float]] = set()
+
+    for sympy_eqn in sympy_eqns:
+        # TODO: properly check x_axis for derivative collection (usually t)
+        derivatives.update(
+            {
+                (d.args[0], d.args[1][1] if isinstance(d.args[1], sympy.Tuple) else 1)
+                for d in sympy_eqn.atoms(Derivative)
+            }
+        )
+        derivatives.update(
+            {(f, 0) for f in sympy_eqn.atoms(Function) if isinstance(f, AppliedUndef)}
+        )
+
+    highest_derivatives = {}
+    lowest_derivatives = {}
+    for f, lvl in derivatives:
+
+        if f in highest_derivatives:
+            if highest_derivatives[f] < lvl:
+                highest_derivatives[f] = lvl
+        else:
+            highest_derivatives[f] = lvl
+
+        if f in lowest_derivatives:
+            if lowest_derivatives[f] > lvl:
+                lowest_derivatives[f] = lvl
+        else:
+            lowest_derivatives[f] = lvl
+
+    return highest_derivatives, lowest_derivatives
+
+
+def derivative(fn: Function, lvl: int, x_axis: sympy.Expr) -> sympy.Expr:
+    return fn if lvl == 0 else sympy.diff(fn, (x_axis, lvl))
+
+
+def state_vector(
+    state_fns: List[Function],
+    lowest_derivatives: Dict[Function, int],
+    highest_derivatives: Dict[Function, int],
+    x_axis: sympy.Expr
+) -> List[sympy.Expr]:
+    "The state of the system; lowest to highest derivatives excluding the highest, ie [x, y, dx, dy]"
+
+    input_unzipped = [
+        [
+            derivative(fn, lvl, x_axis)
+            for lvl in range(lowest_derivatives[fn], highest_derivatives[fn])
+        ]
+        for fn in state_fns
+    ]
+
+    return [
+        deriv
+        for derivatives in zip_longest(*input_unzipped)
+        for deriv in derivatives
+        if deriv is not None
+    ]
@@ -1,17 +1,53 @@
-# from typing import Optional
+import os
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
 
 
-# class _GlobalOptions:
-#     auto_simplify: bool = True
-#     ipython_display_symbol_on_definition: bool = True
-#     ipython_display_eqn_on_definition: bool = False
+class _GlobalOptions:
+    # wall-clock budgets (in seconds) for expensive symbolic operations. None means unbounded.
+    # can be overridden per-call with the `timeout=` argument of solve(), simplify() etc.
+    solve_timeout: Optional[float] = None
+    simplify_timeout: Optional[float] = None
+    # default strategy for simplify(). One of "fast", "medium" or "full".
+    # unset (None) means "full", except for simulate_dynamic_system(), which uses the faster "medium"
+    simplify_strategy: Optional[str] = None
+    # record Val arithmetic as a graph, building the sympy expression only once `.expr` is needed
+    lazy: bool = False
+    # never import or configure display machinery (IPython, plotly, tqdm, sympy's printing setup).
+    # for scripts, servers and CI. Set the MATHPAD_HEADLESS environment variable to enable it before
+    # `import mathpad`, as sympy's printing is configured at import time
+    headless: bool = os.environ.get("MATHPAD_HEADLESS", "") not in ("", "0")
 
 
-# _global_options = _GlobalOptions()
+_global_options = _GlobalOptions()
 
-# # TODO: make this a context manager
 
+def set_global_options(**options: Any):
+    """
+    Set process-wide defaults for mathpad.
 
-# def set_global_options(auto_simplify: Optional[bool] = None):
-#     if auto_simplify is not None:
-#         _global_options.auto_simplify = auto_simplify
+    Example:
+        >>> set_global_options(solve_timeout=30, simplify_timeout=5)
+    """
+    for name, value in options.items():
+        assert hasattr(_GlobalOptions, name), \
+            f"Unknown global option '{name}'. Valid options are: " \
+            f"{[opt for opt in vars(_GlobalOptions) if not opt.startswith('_')]}"
+        setattr(_global_options, name, value)
+
+
+@contextmanager
+def global_options(**options: Any) -> Iterator[None]:
+    """
+    Set global options for the duration of a `with` block, restoring the previous values afterwards.
+
+    Example:
+        >>> with global_options(lazy=True):
+        ...     energy = sum(kinetic_energy(m=m, v=v) for m, v in bodies)
+    """
+    previous = {name: getattr(_global_options, name) for name in options if hasattr(_GlobalOptions, name)}
+    set_global_options(**options)
+    try:
+        yield
+    finally:
+        set_global_options(**previous)
@@ -0,0 +1,206 @@
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Tuple, TypeVar, Union
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_MATHPAD_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# the profiles collecting right now; usually none
+_active_profiles: List["Profile"] = []
+
+
+class _Depth(threading.local):
+    "How many calls of each operation are in progress on this thread, so that only the outermost is counted"
+
+    def __init__(self):
+        self.of: Dict[str, int] = defaultdict(int)
+
+
+_depth = _Depth()
+
+# (module or class, name, op) of functions which are too hot to wrap permanently (see profile_when_active())
+_hot_functions: List[Tuple[Union[ModuleType, type], str, str]] = []
+# their unwrapped originals (functions or classmethods), while a profile is active
+_unwrapped: List[Any] = []
+
+
+class Profile:
+    """
+    Call counts and cumulative wall-clock time per mathpad operation, collected by `profile()`.
+
+    Nested calls of the same operation (ie. simplify() recursing into the sides of an Equation)
+    count once, so the time of an operation is never counted twice.
+    Call sites are the line of code outside of mathpad that (eventually) called the operation.
+    """
+
+    def __init__(self):
+        self.calls: Dict[str, int] = defaultdict(int)
+        self.seconds: Dict[str, float] = defaultdict(float)
+        # (operation, call site) -> seconds
+        self.call_sites: Dict[Tuple[str, str], float] = defaultdict(float)
+        # wall-clock time of the whole `with profile()` block
+        self.total_seconds = 0.0
+
+    def hottest(self, n: int = 10) -> List[Tuple[str, str, float]]:
+        "The `n` most expensive (operation, call site, seconds)"
+        ranked = sorted(self.call_sites.items(), key=lambda item: item[1], reverse=True)
+        return [(op, site, seconds) for (op, site), seconds in ranked[:n]]
+
+    def report(self, n: int = 10) -> str:
+        lines = [f"{'operation':<24}{'calls':>10}{'seconds':>12}{'% total':>10}"]
+
+        for op in sorted(self.seconds, key=self.seconds.__getitem__, reverse=True):
+            share = self.seconds[op] / self.total_seconds if self.total_seconds else 0
+            lines.append(f"{op:<24}{self.calls[op]:>10}{self.seconds[op]:>12.4f}{share:>10.1%}")
+
+        lines.append(f"{'total (wall)':<24}{'':>10}{self.total_seconds:>12.4f}")
+
+        lines += ["", "hottest call sites:"]
+        lines += [f"{seconds:>10.4f}s  {op:<24}{site}" for op, site, seconds in self.hottest(n)]
+
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.report()
+
+    def __repr__(self):
+        return f"<Profile of {sum(self.calls.values())} calls over {self.total_seconds:.3f}s>"
+
+    def _record(self, op: str, seconds: float, site: str):
+        self.calls[op] += 1
+        self.seconds[op] += seconds
+        self.call_sites[op, site] += seconds
+
+
+@contextmanager
+def profile() -> Iterator[Profile]:
+    """
+    Collect call counts and cumulative wall-clock time of mathpad's expensive operations
+    (unit simplification & conversion, dimension checks, simplify, subs, sympy solve, lambdify...)
+    for the duration of a `with` block.
+
+    Example:
+        >>> with profile() as p:
+        ...     simulate_dynamic_system(...)
+        >>> print(p.report())
+    """
+    prof = Profile()
+    if not _active_profiles:
+        _wrap_hot_functions()
+
+    _active_profiles.append(prof)
+    start = time.perf_counter()
+    try:
+        yield prof
+    finally:
+        prof.total_seconds = time.perf_counter() - start
+        _active_profiles.remove(prof)
+
+        if not _active_profiles:
+            _unwrap_hot_functions()
+
+
+def profile_when_active(owner: Union[str, type], name: str, op: str):
+    """
+    Time calls of the function (or method, or classmethod) `name` of `owner` as `op`, but only while a `profile()`
+    is active. For functions called so often that even the check of a `profiled` wrapper is too much.
+
+    `owner` is a class, or the name of a module. Only calls through the module's globals are timed;
+    module-level functions must not be imported from with `from ... import`.
+    """
+    _hot_functions.append((sys.modules[owner] if isinstance(owner, str) else owner, name, op))
+
+
+def _wrap_hot_functions():
+    for owner, name, op in _hot_functions:
+        fn = vars(owner)[name]
+        _unwrapped.append(fn)
+
+        if isinstance(fn, classmethod):
+            setattr(owner, name, classmethod(profiled(op)(fn.__func__)))
+        else:
+            setattr(owner, name, profiled(op)(fn))
+
+
+def _unwrap_hot_functions():
+    for (owner, name, _), fn in zip(_hot_functions, _unwrapped):
+        setattr(owner, name, fn)
+    _unwrapped.clear()
+
+
+class profiled:
+    """
+    Time an operation while a `profile()` is active. Otherwise costs next to nothing.
+
+    Use as a decorator:
+        >>> @profiled("simplify")
+        ... def simplify(...): ...
+
+    or around a block:
+        >>> with profiled("sympy solve"):
+        ...     sympy.solve(...)
+    """
+
+    __slots__ = ("op", "start")
+
+    def __init__(self, op: str):
+        self.op = op
+        self.start = None
+
+    def __call__(self, fn: F) -> F:
+        op = self.op
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _active_profiles:
+                return fn(*args, **kwargs)
+
+            start = _enter(op)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _exit(op, start)
+
+        return wrapper # type: ignore
+
+    def __enter__(self):
+        if _active_profiles:
+            self.start = _enter(self.op)
+
+    def __exit__(self, *exc_info):
+        if self.start is not None:
+            _exit(self.op, self.start)
+
+
+def _enter(op: str) -> float:
+    _depth.of[op] += 1
+    return time.perf_counter()
+
+
+def _exit(op: str, start: float):
+    elapsed = time.perf_counter() - start
+    _depth.of[op] -= 1
+
+    if _depth.of[op] == 0:
+        site = _call_site()
+        for prof in _active_profiles:
+            prof._record(op, elapsed, site)
+
+
+def _call_site() -> str:
+    "The innermost line of code on the stack that isn't part of mathpad"
+    frame = sys._getframe(2)
+    while frame is not None and frame.f_code.co_filename.startswith(_MATHPAD_DIR):
+        frame = frame.f_back
+
+    if frame is None:
+        return "<mathpad>"
+
+    return f"{frame.f_code.co_filename}:{frame.f_lineno} ({frame.f_code.co_name})"
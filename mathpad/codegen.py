@@ -1,7 +1,8 @@
 
 
-from typing import Any, Callable, ItemsView, KeysView, Sequence, TypeVar, Union, ValuesView
+from typing import Any, Callable, Dict, ItemsView, KeysView, List, Sequence, Tuple, TypeVar, Union, ValuesView
 from typing_extensions import Protocol
+from sympy import MatrixBase, MatrixExpr
 from sympy.utilities.lambdify import lambdify
 import numpy
 from numpy.typing import ArrayLike, NDArray
@@ -9,8 +10,11 @@ from mathpad.core.matrix import Matrix
 
 from mathpad.core.val import Num, Val, ValT
 from mathpad.core.vector import Vector
+from mathpad._profiling import profiled
 
-__all__ = ["as_numpy_func"]
+__all__ = ["as_numpy_func", "as_numpy_solver"]
+
+lambdify = profiled("lambdify")(lambdify)
 
 
 # Until a contravariant Map type is added to typing, we have to use this
@@ -24,16 +28,26 @@ class ArgMap(Protocol[ValT, ArrayOrNum]):
     def values(self) -> ValuesView[ArrayOrNum]: ...
 
 
-def as_numpy_func(val: Val) -> Callable[[ArgMap[Val, Union[ArrayLike, Sequence[Val]]]], NDArray[Any]]:
-    """
-    Convert a Val or Vec to an efficient numpy function.
+def as_numpy_func(
+    val: Union[Val, Vector[Any], Matrix[Any, Any]]
+) -> Callable[[ArgMap[Val, Union[ArrayLike, Sequence[Val]]]], NDArray[Any]]:
     """
+    Convert a Val, Vector or Matrix to an efficient numpy function.
 
-    if isinstance(val, Vector):
-        raise NotImplementedError("TODO: implement Vec")
+    Vectors evaluate to arrays of shape (..., n) and Matrices to (..., rows, cols),
+    where the leading dimensions are those of the (broadcast) array arguments.
+    """
 
     syms = list(val.expr.free_symbols)
-    fn = lambdify(syms, val.expr)
+
+    if isinstance(val, Vector):
+        # column vectors; drop the trailing axis of length 1
+        matrix_fn = _lambdify_matrix(syms, val.expr)
+        fn = lambda *args: matrix_fn(*args)[..., 0]
+    elif isinstance(val, Matrix):
+        fn = _lambdify_matrix(syms, val.expr)
+    else:
+        fn = lambdify(syms, val.expr)
 
     def numpy_func(arg_map: ArgMap[Val, Union[ArrayLike, Sequence[Val]]]) -> NDArray[Any]:
         
@@ -46,6 +60,40 @@ def as_numpy_func(val: Val) -> Callable[[ArgMap[Val, Union[ArrayLike, Sequence[V
     return numpy_func # type: ignore
 
 
+def as_numpy_solver(
+    matrix: Matrix[Any, Any],
+    b: Vector[Any]
+) -> Callable[[ArgMap[Any, Any]], NDArray[Any]]:
+    """
+    Compile `matrix.solve(b)` numerically: each call evaluates the matrix and `b`,
+    then solves with `numpy.linalg.solve`. Symbolic solutions of large systems are often
+    too expensive to form, let alone to evaluate.
+
+    Arguments are given as for `Matrix.to_numpy()`; array values are broadcast, solving a whole batch
+    of systems in one call. Solutions have shape (..., n), in the units of `matrix.right_frame`.
+    """
+    assert b.frame == matrix.left_frame, \
+        f"as_numpy_solver() expects a Vector in {matrix.left_frame}, got one in {b.frame}"
+
+    # compiled once for each set of arguments
+    compiled: Dict[Tuple[Any, ...], Tuple[Callable[..., NDArray[Any]], Callable[..., NDArray[Any]]]] = {}
+
+    def solver(arg_map: ArgMap[Any, Any]) -> NDArray[Any]:
+        syms, args = _flatten_subs(arg_map)
+
+        key = tuple(syms)
+        if key not in compiled:
+            compiled[key] = (
+                _lambdify_matrix(syms, _explicit(matrix.expr, syms)),
+                _lambdify_matrix(syms, _explicit(b.expr, syms)),
+            )
+        matrix_fn, b_fn = compiled[key]
+
+        return numpy.linalg.solve(matrix_fn(*args), b_fn(*args))[..., 0]
+
+    return solver
+
+
 def generate_c_code(
     expr: Union[Val, Vector[Any], Matrix[Any, Any]],
     args: Sequence[Union[Val, Vector[Any], Matrix[Any, Any]]]
@@ -63,4 +111,79 @@ def generate_c_code(
         code_gen=CCodeGen(cse=True))
     c_code: str
 
-    return c_code.split('#include <math.h>')[1]
\ No newline at end of file
+    return c_code.split('#include <math.h>')[1]
+
+
+def _lambdify_matrix(syms: Sequence[Any], expr: Any) -> Callable[..., NDArray[Any]]:
+    """
+    lambdify() a matrix expression such that array arguments are broadcast over every element.
+    A plain lambdify() would produce a ragged array wherever elements are constant.
+    """
+    explicit = expr if isinstance(expr, MatrixBase) else expr.as_explicit()
+    rows, cols = explicit.shape
+    elements_fn = lambdify(syms, list(explicit), "numpy")
+
+    def matrix_fn(*args: Any) -> NDArray[Any]:
+        # constant elements are broadcast over the batch shape of the arguments too
+        batch_shape = numpy.broadcast_shapes(*(numpy.shape(arg) for arg in args))
+        if rows * cols == 0:
+            return numpy.zeros(batch_shape + (rows, cols))
+
+        elements = numpy.broadcast_arrays(numpy.empty(batch_shape), *elements_fn(*args))[1:]
+        stacked = numpy.stack(elements, axis=-1)
+        return stacked.reshape(stacked.shape[:-1] + (rows, cols))
+
+    return matrix_fn
+
+
+def _evaluate_matrix(expr: Any, subs: ArgMap[Any, Any]) -> NDArray[Any]:
+    """
+    Evaluate a matrix expression to an array of shape (..., rows, cols), with the values of `subs`
+    substituted in. Array values are broadcast together, giving the leading (batch) dimensions.
+
+    Keys may be Vals, or Vectors whose values are arrays of shape (..., n) or other Vectors.
+    Vals (and Vectors) given as values are converted into the units of their key first.
+    """
+    syms, args = _flatten_subs(subs)
+    explicit = _explicit(expr, syms)
+    return _lambdify_matrix(syms, explicit)(*args)
+
+
+def _flatten_subs(subs: ArgMap[Any, Any]) -> Tuple[List[Any], List[Any]]:
+    "The sympy expressions substituted for (one per Vector element), and their numeric values"
+    syms = []
+    args = []
+
+    for key, value in subs.items():
+        if isinstance(key, Vector):
+            if isinstance(value, Vector):
+                value = value.in_units(key.frame.space.base_units).to_numpy() # type: ignore
+            value = numpy.asarray(value)
+
+            assert value.shape[-1:] == (len(key),), \
+                f"Values for {key} must have shape (..., {len(key)}). Got {value.shape}"
+
+            for idx, el in enumerate(key):
+                syms.append(el.expr)
+                args.append(value[..., idx])
+
+        else:
+            syms.append(key.expr)
+            args.append(float(value.in_units(key).expr) if isinstance(value, Val) else numpy.asarray(value))
+
+    return syms, args
+
+
+def _explicit(expr: Any, syms: Sequence[Any]) -> MatrixBase:
+    "The explicit form of a matrix expression, checking that `syms` are enough to evaluate it numerically"
+    if not isinstance(expr, (MatrixBase, MatrixExpr)):
+        # ie. a cross product
+        expr = expr.doit()
+
+    explicit = expr if isinstance(expr, MatrixBase) else expr.as_explicit()
+
+    provided = set().union(*(sym.free_symbols for sym in syms))
+    missing = explicit.free_symbols - provided
+    assert not missing, f"Cannot evaluate numerically without values for {missing}"
+
+    return explicit
@@ -9,6 +9,8 @@ from mathpad.core.common_vals import *
 from mathpad.core.vector_space import VectorSpace, R2, R3
 from mathpad.core.frame import Frame
 from mathpad.core.vector import Vector, VecT
-from mathpad.core.matrix import Mat, Matrix
+from mathpad.core.matrix import Mat, Matrix
+from mathpad.core.rotation import RotationMatrix
+from mathpad.core.frame_tree import FrameTree
 
 from mathpad.core.equation import Equation, EquationT
\ No newline at end of file
@@ -1,71 +1,104 @@
 
-"Only run this script if you want to regenerate the 'units.py' and 'constants.py' files."
+"""
+Only run this script if you want to regenerate the 'units.py' and 'constants.py' files:
+
+    python -m mathpad.core._generate_units_py
+"""
 
 import os
 
+import sympy
 import sympy.physics.units.definitions as u
 from sympy.physics.units.quantities import Quantity
 from sympy.physics.units.systems.si import dimsys_SI
 
-from mathpad.core.val import Val
+from mathpad.core.val import Unit, _canonical_unit_key, _units2dimensional_expr
 import mathpad.core.dimensions as dims
 
 HERE = os.path.dirname(__file__)
 
-AUTOGEN_WARNING = '"WARNING: this file was automatically generated by commented code within mathpad.py, and then modified slightly"\n'
+AUTOGEN_WARNING = '"WARNING: this file was automatically generated by _generate_units_py.py. Do not edit by hand"\n'
+
+# the numeric types srepr() may emit for scale factors and dimensions
+HEADER = (
+    "import sympy.physics.units.definitions.unit_definitions as u\n"
+    "from sympy import Float, Integer, Mul, Pow, Rational, Symbol, pi\n"
+)
+
+
+def units_source(units: sympy.Expr) -> str:
+    "Python source for a product of powers of quantities, ie. 'u.meter * u.second**-1'"
+    if units == 1:
+        return "Integer(1)"
+
+    return " * ".join(
+        f"u.{qty}" if power == 1 else f"u.{qty}**{power}"
+        for qty, power in sorted(units.as_powers_dict().items(), key=str)
+    )
+
+
+def precomputed(name: str, cls_name: str, qty: Quantity, with_dimension: bool = False) -> str:
+    """
+    Source constructing a unit Val from precomputed data (see Val._precomputed), so that importing
+    the units doesn't need to simplify, convert or dimension-check anything
+    """
+    key = _canonical_unit_key(qty)
+    key_src = "None" if key is None else f"({sympy.srepr(key[0])}, {units_source(key[1])})"
+
+    args = f"u.{name}, {key_src}"
+    if with_dimension:
+        args += f", dimension={sympy.srepr(_units2dimensional_expr(qty))}"
+
+    return f"\n{name} = {cls_name}._precomputed({args})"
+
 
+units_src = [AUTOGEN_WARNING, HEADER, "from mathpad.core.dimensions import *\n"]
+constants_src = [AUTOGEN_WARNING, HEADER, "from mathpad.core.val import Val\n"]
+
+# star-imported by mathpad.core; keep the sympy names used by the precomputed data out of it
+units_all = ["u", *dims.__all__]
+constants_all = ["u", "Val"]
+
+for name in dir(u):
+    qty = getattr(u, name)
+
+    if name.endswith("constant"):
+        constants_src.append(precomputed(name, "Val", qty, with_dimension=True))
+        constants_all.append(name)
+
+    elif isinstance(qty, Quantity):
+
+        for quantity_cls_name in dir(dims):
+            if quantity_cls_name in "du":
+                continue
+
+            quantity_cls = getattr(dims, quantity_cls_name)
+
+            # handle the Angle dimension specially
+            if str(qty).startswith("angular") or str(qty).startswith("rad"):
+                units_src.append(precomputed(name, "Angle", qty))
+                units_all.append(name)
+                break
+
+            elif (
+                isinstance(quantity_cls, type)
+                and issubclass(quantity_cls, Unit)
+                # Unit itself has no dimension
+                and quantity_cls is not Unit
+                and dimsys_SI.equivalent_dims(qty.dimension, quantity_cls.dimension) # type: ignore
+            ):
+                units_src.append(precomputed(name, quantity_cls_name, qty))
+                units_all.append(name)
+                break
+        else:
+            print(f"Warning: Quantity '{name}' could not be matched; skipping...")
+
+# only write once everything has been generated; this script imports the files it overwrites
 print("writing to " + f"{HERE}/units.py\nand {HERE}/constants.py")
 
 with (
     open(f"{HERE}/units.py", "w") as units_f,
     open(f"{HERE}/constants.py", "w") as constants_f
 ):
-
-    # top of 'units.py'
-    units_f.write(AUTOGEN_WARNING)
-    units_f.write("import sympy.physics.units.definitions.unit_definitions as u\n")
-    units_f.write("from mathpad.val import *\n")
-
-    # top of 'constants.py'
-    constants_f.write(AUTOGEN_WARNING)
-    constants_f.write("import sympy.physics.units.definitions.unit_definitions as u\n")
-    constants_f.write("from mathpad.val import *\n")
-
-    for name in dir(u):
-        qty = getattr(u, name)
-
-        if name.endswith("constant"):
-            constants_f.write(
-                f"""
-{name} = Val(u.{name})"""
-            )
-
-        elif isinstance(qty, Quantity):
-
-            for quantity_cls_name in dir(dims):
-                if quantity_cls_name in "du":
-                    continue
-
-                quantity_cls = getattr(dims, quantity_cls_name)
-
-                # handle the Angle dimension specially
-                if str(qty).startswith("angular") or str(qty).startswith("rad"):
-                    units_f.write(
-                        f"""
-{name} = Angle(u.{name})"""
-                    )
-                    break
-
-                elif (
-                    isinstance(quantity_cls, type)
-                    and issubclass(quantity_cls, Val)
-                    and quantity_cls is not Val
-                    and dimsys_SI.equivalent_dims(qty.dimension, quantity_cls.dimension) # type: ignore
-                ):
-                    units_f.write(
-                        f"""
-{name} = {quantity_cls_name}(u.{name})"""
-                    )
-                    break
-            else:
-                print(f"Warning: Quantity '{name}' could not be matched; skipping...")
+    units_f.write("".join(units_src) + f"\n\n__all__ = {units_all!r}\n")
+    constants_f.write("".join(constants_src) + f"\n\n__all__ = {constants_all!r}\n")
@@ -1,3 +1,21 @@
-"WARNING: this file was automatically generated by commented code within mathpad.py, and then modified slightly"
+"WARNING: this file was automatically generated by _generate_units_py.py. Do not edit by hand"
 import sympy.physics.units.definitions.unit_definitions as u
-from mathpad.val import *
+from sympy import Float, Integer, Mul, Pow, Rational, Symbol, pi
+from mathpad.core.val import Val
+
+atomic_mass_constant = Val._precomputed(u.atomic_mass_constant, (Float('1.6605390666e-27', precision=53), u.kilogram), dimension=Symbol('mass'))
+avogadro_constant = Val._precomputed(u.avogadro_constant, (Float('6.0221407599999999e+23', precision=53), u.mole**-1), dimension=Pow(Symbol('amount_of_substance'), Integer(-1)))
+boltzmann_constant = Val._precomputed(u.boltzmann_constant, (Float('1.3806490000000001e-23', precision=53), u.kelvin**-1 * u.kilogram * u.meter**2 * u.second**-2), dimension=Mul(Symbol('energy'), Pow(Symbol('temperature'), Integer(-1))))
+coulomb_constant = Val._precomputed(u.coulomb_constant, (Rational(22468879468420441, 2500000), u.ampere**-2 * u.kilogram * u.meter**3 * u.second**-4), dimension=Mul(Pow(Symbol('charge'), Integer(-2)), Symbol('force'), Pow(Symbol('length'), Integer(2))))
+coulombs_constant = Val._precomputed(u.coulombs_constant, (Rational(22468879468420441, 2500000), u.ampere**-2 * u.kilogram * u.meter**3 * u.second**-4), dimension=Mul(Pow(Symbol('charge'), Integer(-2)), Symbol('force'), Pow(Symbol('length'), Integer(2))))
+electric_constant = Val._precomputed(u.electric_constant, (Mul(Rational(625000, 22468879468420441), Pow(pi, Integer(-1))), u.ampere**2 * u.kilogram**-1 * u.meter**-3 * u.second**4), dimension=Mul(Symbol('capacitance'), Pow(Symbol('length'), Integer(-1))))
+electric_force_constant = Val._precomputed(u.electric_force_constant, (Rational(22468879468420441, 2500000), u.ampere**-2 * u.kilogram * u.meter**3 * u.second**-4), dimension=Mul(Pow(Symbol('charge'), Integer(-2)), Symbol('force'), Pow(Symbol('length'), Integer(2))))
+faraday_constant = Val._precomputed(u.faraday_constant, (Float('96485.332123310014', precision=53), u.ampere * u.mole**-1 * u.second), dimension=Mul(Pow(Symbol('amount_of_substance'), Integer(-1)), Symbol('charge')))
+gravitational_constant = Val._precomputed(u.gravitational_constant, (Float('6.6742999999999994e-11', precision=53), u.kilogram**-1 * u.meter**3 * u.second**-2), dimension=Mul(Pow(Symbol('length'), Integer(3)), Pow(Symbol('mass'), Integer(-1)), Pow(Symbol('time'), Integer(-2))))
+josephson_constant = Val._precomputed(u.josephson_constant, (Float('2.0678338484619295e-9', precision=53), u.ampere * u.kilogram**-1 * u.meter**-2 * u.second**2), dimension=Mul(Symbol('frequency'), Pow(Symbol('voltage'), Integer(-1))))
+magnetic_constant = Val._precomputed(u.magnetic_constant, (Mul(Rational(1, 2500000), pi), u.ampere**-2 * u.kilogram * u.meter * u.second**-2), dimension=Mul(Pow(Symbol('current'), Integer(-2)), Symbol('force')))
+molar_gas_constant = Val._precomputed(u.molar_gas_constant, (Float('8.3144626181532413', precision=53), u.kelvin**-1 * u.kilogram * u.meter**2 * u.mole**-1 * u.second**-2), dimension=Mul(Pow(Symbol('amount_of_substance'), Integer(-1)), Symbol('energy'), Pow(Symbol('temperature'), Integer(-1))))
+stefan_boltzmann_constant = Val._precomputed(u.stefan_boltzmann_constant, (Mul(Float('1.8529443369510839e-10', precision=53), Pow(pi, Integer(5))), u.kelvin**-4 * u.kilogram * u.second**-3), dimension=Mul(Symbol('energy'), Pow(Symbol('length'), Integer(-2)), Pow(Symbol('temperature'), Integer(-4)), Pow(Symbol('time'), Integer(-1))))
+von_klitzing_constant = Val._precomputed(u.von_klitzing_constant, (Mul(Float('12906.403729652257', precision=53), Pow(pi, Integer(-1))), u.ampere**-2 * u.kilogram * u.meter**2 * u.second**-3), dimension=Mul(Pow(Symbol('current'), Integer(-1)), Symbol('voltage')))
+
+__all__ = ['u', 'Val', 'atomic_mass_constant', 'avogadro_constant', 'boltzmann_constant', 'coulomb_constant', 'coulombs_constant', 'electric_constant', 'electric_force_constant', 'faraday_constant', 'gravitational_constant', 'josephson_constant', 'magnetic_constant', 'molar_gas_constant', 'stefan_boltzmann_constant', 'von_klitzing_constant']
@@ -10,6 +10,7 @@ from mathpad.core.vector import Vector
 from mathpad.core.vector_space import VectorSpace
 from mathpad.core.matrix import Matrix
 from mathpad.core.frame import Frame
+from mathpad._profiling import profile_when_active
 
 
 
@@ -18,6 +19,8 @@ T = TypeVar("T", bound=Union[Val, VectorSpace, Matrix])
 
 class Equation(Generic[T]):
 
+    __slots__ = ("lhs", "rhs", "units")
+
     @overload
     def __init__(
         self,
@@ -88,6 +91,15 @@ class Equation(Generic[T]):
             self.lhs = lhs
             self.rhs = rhs
             self.units = (lhs.left_frame, lhs.right_frame)
+
+    @classmethod
+    def _new_unchecked(cls, lhs: Any, rhs: Any, units: Any) -> "Equation[Any]":
+        "Construct an Equation from sides that are already known to be in the same units; skipping conversion"
+        eqn = cls.__new__(cls)
+        eqn.lhs = lhs
+        eqn.rhs = rhs
+        eqn.units = units
+        return eqn
     
     def __getitem__(self, idx: int):
         """
@@ -133,6 +145,10 @@ class Equation(Generic[T]):
         """
         Evaluate the truthyness of the equation.
         """
+
+        if self.lhs.expr == self.rhs.expr:
+            # structurally equal; no need to make matrix expressions explicit
+            return True
         
         # convert matrixsymbols to explicit beforehand because sympy can't tell that
         # a + b == O[a[0] + b[0], a[1] + b[1], ...]
@@ -145,4 +161,8 @@ class Equation(Generic[T]):
         res = lhs.doit() == rhs.doit()
         return res
 
+
+# built by every comparison of Vals, so only wrapped while profiling
+profile_when_active(Equation, "__init__", "equation")
+
 EquationT = TypeVar("EquationT", bound=Equation)
\ No newline at end of file
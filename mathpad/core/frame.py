@@ -1,5 +1,5 @@
 
-from typing import TYPE_CHECKING, Any, Generic, List, Sequence, Tuple, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
 from typing_extensions import Self
 import inspect
 
@@ -10,7 +10,7 @@ from mathpad.sympy_extensions import SymbolicMatrixFunction
 
 from mathpad.core.dimensions import Angle, Length
 from mathpad.core.val import Q, Val, _extract_deps_from_fn_str, DimensionError
-from mathpad.core.vector_space import R2, VectorSpace, VectorSpaceT
+from mathpad.core.vector_space import R2, Homogeneous, VectorSpace, VectorSpaceT
 
 if TYPE_CHECKING:
     from mathpad.core.vector import Vector
@@ -21,6 +21,8 @@ if TYPE_CHECKING:
 
 class Frame(Generic[VectorSpaceT]):
 
+    __slots__ = ("space", "name", "check", "_derived_frames")
+
     def __init__(
         self,
         space: VectorSpaceT,
@@ -35,6 +37,8 @@ class Frame(Generic[VectorSpaceT]):
         self.space = space
         self.name = name
         self.check = check
+        # frames derived by multiplying & dividing by Vals, by (op, units); see _derived_frame()
+        self._derived_frames: Optional[Dict[Tuple[str, Any], Frame[Any]]] = None
 
         # if wrt:
         #     frame, tf = wrt
@@ -62,6 +66,10 @@ class Frame(Generic[VectorSpaceT]):
 
         """
 
+        if name.startswith("_"):
+            # ie. copy/pickle probing for __setstate__ before self.space exists
+            raise AttributeError(name)
+
         if not name in self.space.base_names:
             raise AttributeError(
                 f"{name} is not a base name of {self.__class__}" \
@@ -161,11 +169,36 @@ class Frame(Generic[VectorSpaceT]):
         name_part = f' name="{self.name}"' if self.name else ''
         return f"<{self.space.name}{name_part}>"
     
+    def _derived_frame(self, op: str, other: Q[Val], derive: Callable[[], VectorSpace]) -> 'Frame[Any]':
+        "The frame of the space `derive()`d by an operation with `other`; the same Frame each time, like the space"
+        if not isinstance(other, Val):
+            return Frame(derive(), self.name)
+
+        if self._derived_frames is None:
+            self._derived_frames = {}
+
+        key = op, other.units
+        frame = self._derived_frames.get(key)
+        if frame is None:
+            frame = self._derived_frames[key] = Frame(derive(), self.name)
+        return frame
+
+    def homogeneous(self) -> 'Frame[Homogeneous[VectorSpaceT]]':
+        "This frame with an extra, dimensionless base `w` (for homogeneous coordinates); the same Frame each time"
+        if self._derived_frames is None:
+            self._derived_frames = {}
+
+        key = "homogeneous", None
+        frame = self._derived_frames.get(key)
+        if frame is None:
+            frame = self._derived_frames[key] = Frame(self.space.homogeneous(), self.name)
+        return frame
+
     def __mul__(self, other: Q[Val]) -> Self:
-        return Frame(self.space * other, self.name)
+        return self._derived_frame("*", other, lambda: self.space * other)
     
     def __rmul__(self, other: Q[Val]) -> Self:
-        return Frame(self.space * other, self.name)
+        return self._derived_frame("*", other, lambda: self.space * other)
     
     
     def __eq__(self, other: 'Frame[VectorSpaceT]') -> bool:
@@ -173,10 +206,10 @@ class Frame(Generic[VectorSpaceT]):
     
 
     def __rtruediv__(self, other: Val) -> 'Frame[VectorSpaceT]':
-        return Frame(other / self.space, self.name)
+        return self._derived_frame("r/", other, lambda: other / self.space)
     
     def __truediv__(self, other: Val) -> 'Frame[VectorSpaceT]':
-        return Frame(self.space / other, self.name)
+        return self._derived_frame("/", other, lambda: self.space / other)
     
 
 
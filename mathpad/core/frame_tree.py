@@ -0,0 +1,223 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import sympy
+from sympy import ImmutableMatrix, MatrixBase
+
+from mathpad.core.val import Val, Q
+from mathpad.core.frame import Frame
+from mathpad.core.vector import Vector
+from mathpad.core.matrix import Mat, Matrix
+from mathpad.core.rotation import _check_frames
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    from mathpad.maths.algebra import SubstitutionMap
+
+__all__ = ["FrameTree"]
+
+
+class FrameTree:
+    """
+    Frames related by rigid homogeneous transforms, forming a tree (ie. the links of a robot arm).
+
+    Each frame is added with the rotation & translation of its coordinates relative to its parent's.
+    Transforms between any two frames of the tree are composed from the links between them.
+
+    Example:
+        >>> tree = FrameTree(world)
+        >>> tree.add(upper_arm, world, rotation=Mat[world, upper_arm].rotation(theta1, "k"), translation=world[0, 0, l0])
+        >>> tree.add(forearm, upper_arm, rotation=Mat[upper_arm, forearm].rotation(theta2, "j"), translation=upper_arm[l1, 0, 0])
+        >>> tree.express(forearm[l2, 0, 0], world)  # the end of the forearm, in world coordinates
+        >>> tree.to_numpy(forearm, world, {theta1: thetas1, theta2: thetas2})  # shape (N, 4, 4)
+
+    Symbolic products along a chain are computed once and cached. Numeric evaluation compiles
+    each link on its own and composes them with numpy, rather than compiling the (much larger) product.
+
+    Rotations must be orthonormal, so that transforms are inverted by transposing their rotations,
+    and every frame of the tree must be in the same units.
+    """
+
+    def __init__(self, root: Frame[Any]):
+        self.root = root
+
+        # Frames aren't hashable, so they are looked up by identity:
+        # id(frame) -> (frame, parent, transform from the frame's homogeneous coordinates to its parent's)
+        self._links: Dict[int, Tuple[Frame[Any], Optional[Frame[Any]], ImmutableMatrix]] = {
+            id(root): (root, None, ImmutableMatrix(sympy.eye(len(root) + 1)))
+        }
+
+        # (id(ancestor), id(frame)) -> the product of the links from the ancestor down to the frame
+        self._chains: Dict[Tuple[int, int], ImmutableMatrix] = {}
+
+        # (id(frame), substituted exprs) -> compiled link transform
+        self._compiled: Dict[Tuple[int, Tuple[Any, ...]], Callable[..., "NDArray[Any]"]] = {}
+
+    def add(
+        self,
+        frame: Frame[Any],
+        parent: Frame[Any],
+        *,
+        rotation: Optional[Union[Matrix[Any, Any], Sequence[Sequence[Q[Val]]]]] = None,
+        translation: Optional[Vector[Any]] = None
+    ):
+        """
+        Add `frame` to the tree, as a child of `parent`.
+
+        `rotation` (a `Mat[parent, frame]`, or its rows) takes coordinates in `frame` to coordinates in `parent`,
+        and `translation` is the origin of `frame`, as a Vector in `parent`. Either defaults to none.
+        """
+        assert id(frame) not in self._links, f"{frame} is already in the tree"
+        assert id(parent) in self._links, f"{parent} must be added to the tree before its children"
+        assert len(frame) == len(parent), \
+            f"{frame} and {parent} must have the same number of dimensions. Got {len(frame)} != {len(parent)}"
+        # links are rigid, so they can't rescale coordinates between units (ie. m and mm)
+        _check_frames((parent, frame))
+
+        n = len(parent)
+
+        if rotation is None:
+            rotation_expr = sympy.eye(n)
+        else:
+            if not isinstance(rotation, Matrix):
+                rotation = Mat[parent, frame](*rotation)
+
+            assert rotation.left_frame == parent and rotation.right_frame == frame, \
+                f"Rotation must be a Mat[{parent}, {frame}]. Got Mat[{rotation.left_frame}, {rotation.right_frame}]"
+
+            rotation_expr = rotation.expr if isinstance(rotation.expr, MatrixBase) else rotation.expr.as_explicit()
+
+        if translation is None:
+            translation_expr = sympy.zeros(n, 1)
+        else:
+            assert translation.frame == parent, \
+                f"Translation must be a Vector in {parent}. Got one in {translation.frame}"
+            translation_expr = sympy.Matrix(translation._element_exprs())
+
+        transform = rotation_expr.row_join(translation_expr).col_join(sympy.Matrix([[0] * n + [1]]))
+        self._links[id(frame)] = (frame, parent, ImmutableMatrix(transform))
+
+    def __contains__(self, frame: Frame[Any]) -> bool:
+        return id(frame) in self._links
+
+    def transform(self, frame: Frame[Any], to: Frame[Any]) -> Matrix[Any, Any]:
+        "The homogeneous transform taking coordinates in `frame` to coordinates in `to`"
+        ancestor, up, down = self._path(frame, to)
+
+        # both sides of the path hang from the common ancestor: to <- ancestor <- frame
+        to_from_ancestor = _rigid_inverse(self._chain(ancestor, up))
+        expr = to_from_ancestor @ self._chain(ancestor, down)
+
+        return Matrix(sympy.Matrix(expr), type=(to.homogeneous(), frame.homogeneous()))
+
+    def express(self, point: Vector[Any], to: Frame[Any]) -> Vector[Any]:
+        "The position `point` (a Vector in a frame of the tree) in the coordinates of `to`"
+        frame = self._find(point.frame)
+        transformed = self.transform(frame, to).expr @ sympy.Matrix([*point._element_exprs(), 1])
+        return Vector(to, sympy.Matrix(transformed[:len(to), :]))
+
+    def to_numpy(self, frame: Frame[Any], to: Frame[Any], subs: "SubstitutionMap" = {}) -> "NDArray[Any]":
+        """
+        Evaluate the transform from `frame` to `to` numerically, to an array of shape (..., n + 1, n + 1).
+
+        Values in `subs` may be arrays (ie. joint angles over N time samples), which are broadcast together
+        to give the leading (batch) dimensions, so a whole trajectory is evaluated in one call.
+        """
+        import numpy
+        from mathpad.codegen import _flatten_subs
+
+        syms, args = _flatten_subs(subs)
+        ancestor, up, down = self._path(frame, to)
+
+        def chain(frame_ids: List[int]) -> "NDArray[Any]":
+            result = numpy.eye(len(self.root) + 1)
+            for frame_id in frame_ids:
+                result = result @ self._compiled_link(frame_id, syms)(*args)
+            return result
+
+        to_from_ancestor = _rigid_inverse_numpy(chain(up))
+        return to_from_ancestor @ chain(down)
+
+    def _find(self, frame: Frame[Any]) -> Frame[Any]:
+        "The frame of the tree that is (or else uniquely equals) `frame`"
+        if id(frame) in self._links:
+            return frame
+
+        matches = [candidate for candidate, _, _ in self._links.values() if candidate == frame]
+
+        if not matches:
+            raise KeyError(f"{frame} is not in the tree")
+
+        if len(matches) > 1:
+            raise KeyError(f"{frame} equals {len(matches)} frames of the tree. Pass the frame itself to pick one")
+
+        return matches[0]
+
+    def _ancestry(self, frame: Frame[Any]) -> List[int]:
+        "The ids of `frame` and its ancestors, up to the root"
+        frame_id: Optional[int] = id(self._find(frame))
+        ancestry = []
+        while frame_id is not None:
+            ancestry.append(frame_id)
+            parent = self._links[frame_id][1]
+            frame_id = None if parent is None else id(parent)
+        return ancestry
+
+    def _path(self, frame: Frame[Any], to: Frame[Any]) -> Tuple[int, List[int], List[int]]:
+        """
+        The path between two frames: the id of their closest common ancestor, and the ids of the frames
+        below it (top-down) on the way to `to` and to `frame`
+        """
+        to_ancestry = self._ancestry(to)
+        frame_ancestry = self._ancestry(frame)
+
+        to_ancestors = set(to_ancestry)
+        common = next(frame_id for frame_id in frame_ancestry if frame_id in to_ancestors)
+
+        up = to_ancestry[:to_ancestry.index(common)][::-1]
+        down = frame_ancestry[:frame_ancestry.index(common)][::-1]
+        return common, up, down
+
+    def _chain(self, ancestor: int, frame_ids: List[int]) -> ImmutableMatrix:
+        "The product of the links from the ancestor down through `frame_ids`; each prefix is cached"
+        if not frame_ids:
+            return ImmutableMatrix(sympy.eye(len(self.root) + 1))
+
+        key = ancestor, frame_ids[-1]
+        product = self._chains.get(key)
+        if product is None:
+            link = self._links[frame_ids[-1]][2]
+            product = self._chains[key] = ImmutableMatrix(self._chain(ancestor, frame_ids[:-1]) @ link)
+        return product
+
+    def _compiled_link(self, frame_id: int, syms: List[Any]) -> Callable[..., "NDArray[Any]"]:
+        from mathpad.codegen import _explicit, _lambdify_matrix
+
+        key = frame_id, tuple(syms)
+        fn = self._compiled.get(key)
+        if fn is None:
+            fn = self._compiled[key] = _lambdify_matrix(syms, _explicit(self._links[frame_id][2], syms))
+        return fn
+
+
+def _rigid_inverse(transform: ImmutableMatrix) -> ImmutableMatrix:
+    "The inverse of a homogeneous transform with an orthonormal rotation: [R.T, -R.T @ p]"
+    n = transform.rows - 1
+    rotation_T = transform[:n, :n].T
+    translation = transform[:n, n]
+    return ImmutableMatrix(
+        rotation_T.row_join(-rotation_T @ translation).col_join(sympy.Matrix([[0] * n + [1]]))
+    )
+
+
+def _rigid_inverse_numpy(transforms: "NDArray[Any]") -> "NDArray[Any]":
+    "_rigid_inverse() of an array of transforms, of shape (..., n + 1, n + 1)"
+    import numpy
+
+    n = transforms.shape[-1] - 1
+    rotation_T = numpy.swapaxes(transforms[..., :n, :n], -1, -2)
+
+    inverse = numpy.zeros_like(transforms)
+    inverse[..., :n, :n] = rotation_T
+    inverse[..., :n, n] = -(rotation_T @ transforms[..., :n, n:])[..., 0]
+    inverse[..., n, n] = 1
+    return inverse
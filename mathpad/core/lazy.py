@@ -0,0 +1,121 @@
+from typing import Any, List, Optional
+
+import sympy
+
+
+class LazyExpr:
+    """
+    A node in a deferred expression graph, recorded by Val arithmetic in lazy mode
+    (see the `lazy` global option).
+
+    Arithmetic on a LazyExpr records another node rather than rebuilding a sympy tree.
+    `materialize()` builds the sympy expression once, flattening chains of sums and products
+    into a single `sympy.Add` / `sympy.Mul`.
+    """
+
+    __slots__ = ("op", "args", "uses", "value")
+
+    def __init__(self, op: str, args: List[Any], value: Optional[sympy.Basic] = None):
+        self.op = op
+        self.args = args
+        # how many other nodes refer to this one. Nodes used only once are flattened into their parent
+        self.uses = 0
+        self.value = value
+
+        for arg in args:
+            if isinstance(arg, LazyExpr):
+                arg.uses += 1
+
+    @classmethod
+    def wrap(cls, expr: Any) -> "LazyExpr":
+        "A LazyExpr for `expr`, which may already be one"
+        return expr if isinstance(expr, LazyExpr) else cls("leaf", [], sympy.sympify(expr))
+
+    def materialize(self) -> sympy.Basic:
+        "Build (and cache) the sympy expression for this node"
+        stack = [self]
+
+        # post-order traversal; with an explicit stack as graphs are often deeper than the recursion limit
+        while stack:
+            node = stack[-1]
+
+            if node.value is not None:
+                stack.pop()
+                continue
+
+            operands = node._operands()
+            pending = [
+                operand for operand in operands
+                if isinstance(operand, LazyExpr) and operand.value is None
+            ]
+
+            if pending:
+                stack.extend(pending)
+                continue
+
+            stack.pop()
+            node.value = _BUILDERS[node.op](
+                *(operand.value if isinstance(operand, LazyExpr) else operand for operand in operands)
+            )
+
+        return self.value # type: ignore
+
+    def _operands(self) -> List[Any]:
+        if self.op not in ("add", "mul"):
+            return self.args
+
+        # flatten chains of the same associative op, so they are built in one go
+        operands = []
+        stack = list(reversed(self.args))
+        while stack:
+            arg = stack.pop()
+            if isinstance(arg, LazyExpr) and arg.op == self.op and arg.value is None and arg.uses == 1:
+                stack.extend(reversed(arg.args))
+            else:
+                operands.append(arg)
+
+        return operands
+
+    def __add__(self, other: Any) -> "LazyExpr":
+        return LazyExpr("add", [self, other])
+
+    def __radd__(self, other: Any) -> "LazyExpr":
+        return LazyExpr("add", [other, self])
+
+    def __sub__(self, other: Any) -> "LazyExpr":
+        return LazyExpr("add", [self, -other])
+
+    def __rsub__(self, other: Any) -> "LazyExpr":
+        return LazyExpr("add", [other, -self])
+
+    def __neg__(self) -> "LazyExpr":
+        return LazyExpr("mul", [sympy.S.NegativeOne, self])
+
+    def __mul__(self, other: Any) -> "LazyExpr":
+        return LazyExpr("mul", [self, other])
+
+    def __rmul__(self, other: Any) -> "LazyExpr":
+        return LazyExpr("mul", [other, self])
+
+    def __truediv__(self, other: Any) -> "LazyExpr":
+        return LazyExpr("mul", [self, LazyExpr("pow", [other, sympy.S.NegativeOne])])
+
+    def __rtruediv__(self, other: Any) -> "LazyExpr":
+        return LazyExpr("mul", [other, LazyExpr("pow", [self, sympy.S.NegativeOne])])
+
+    def __pow__(self, other: Any) -> "LazyExpr":
+        return LazyExpr("pow", [self, other])
+
+    def __rpow__(self, other: Any) -> "LazyExpr":
+        return LazyExpr("pow", [other, self])
+
+    def __repr__(self) -> str:
+        return f"LazyExpr({self.op}, {self.args})" if self.value is None else f"LazyExpr({self.value})"
+
+
+_BUILDERS = {
+    "leaf": lambda: None,
+    "add": lambda *args: sympy.Add(*map(sympy.sympify, args)),
+    "mul": lambda *args: sympy.Mul(*map(sympy.sympify, args)),
+    "pow": lambda base, exp: sympy.Pow(sympy.sympify(base), sympy.sympify(exp)),
+}
@@ -1,9 +1,10 @@
 
 
-from typing import TYPE_CHECKING, Any, Generic, Iterator, List, Sequence, Tuple, TypeVar, Union, overload
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Generic, Iterator, List, Mapping, Optional, Sequence, Tuple, TypeVar, Union, overload
 from typing_extensions import Self
 
-from sympy import Matrix as SympyMatrix, MatrixSymbol, MatrixExpr
+from sympy import Matrix as SympyMatrix, MatrixBase, MatrixSymbol, MatrixExpr, SparseMatrix
 from sympy.physics.vector import vlatex
 
 from mathpad.core.val import DimensionError, Dimensionless, Val, Q, SumDimensionsMismatchError
@@ -13,6 +14,8 @@ from mathpad.core.vector import Vector
 
 if TYPE_CHECKING:
     from mathpad.core.equation import Equation
+    from mathpad.core.rotation import RotationMatrix
+    from mathpad.maths.algebra import SubstitutionMap
 
 
 L = TypeVar("L", bound=VectorSpace) # type: ignore [reportMissingTypeArgument]
@@ -20,19 +23,30 @@ R = TypeVar("R", bound=VectorSpace) # type: ignore [reportMissingTypeArgument]
 
 class Matrix(Generic[L, R]):
 
+    __slots__ = ("left_frame", "right_frame", "expr")
+
     def __init__(
         self,
-        expr: Union[str, Sequence[Sequence[Q[Val]]], SympyMatrix],
+        expr: Union[str, Sequence[Sequence[Q[Val]]], Mapping[Tuple[int, int], Q[Val]], MatrixBase, MatrixExpr],
         *,
         type: Tuple[Frame[L], Frame[R]],
-        check_val_dims: bool = True
+        check_val_dims: bool = True,
+        unit_grid: Optional[List[List[Val]]] = None
     ):
+        """
+        `expr` may be a name (for a symbolic matrix), rows of values, or a sympy matrix.
+
+        A mapping of {(row, col): value} makes a sparse matrix; all other elements are zero.
+        Only the given elements are checked (and stored), so this scales to large, structured systems.
+
+        `unit_grid` is the expected units of each element, if already known (see `VectorSpaceMapping`).
+        """
         left_frame, right_frame = type
         self.left_frame = left_frame
         self.right_frame = right_frame
 
 
-        if isinstance(expr, (SympyMatrix, MatrixExpr)):
+        if isinstance(expr, (MatrixBase, MatrixExpr)):
             self.expr = expr
         
         elif isinstance(expr, str):
@@ -42,6 +56,17 @@ class Matrix(Generic[L, R]):
             sym = "\\mathbf{" + expr + "}"
             
             self.expr = MatrixSymbol(sym, len(left_frame.space.base_units), len(right_frame.space.base_units))
+
+        elif isinstance(expr, Mapping):
+            rows, cols = len(left_frame), len(right_frame)
+            entries = {}
+
+            for (i, j), el in expr.items():
+                assert 0 <= i < rows and 0 <= j < cols, \
+                    f"Matrix element [{i}, {j}] is out of bounds for a {rows}x{cols} matrix"
+                entries[i, j] = self._element_expr(i, j, el, check_val_dims, unit_grid)
+
+            self.expr = SparseMatrix(rows, cols, entries)
         
         else: # Sequence[Sequence[Q[Val]]
             
@@ -51,32 +76,15 @@ class Matrix(Generic[L, R]):
             assert all(len(row) == len(right_frame) for row in expr), \
                 f"Matrix must have the same number of columns as the right space. Instead got {len(expr[0])} (rows) != {len(right_frame)} (frame)"
 
+            if check_val_dims and unit_grid is None:
+                unit_grid = _unit_grid(left_frame, right_frame)
+
             self_expr = []
 
-            for i, (row, a_units) in enumerate(zip(expr, left_frame.space.base_units)):
+            for i, row in enumerate(expr):
                 row_expr = []
-                for j, (el, b_units) in enumerate(zip(row, right_frame.space.base_units)):
-                    if isinstance(el, Val):
-                        if check_val_dims:
-                            expected_units = b_units / a_units
-                            try:
-                                DimensionError.check(expected_units, el)
-
-                            except DimensionError as e:
-
-                                def units2str(units: Val) -> str:
-                                    return "dimensionless" if units.units == 1 else str(units.units)
-                                    
-                                raise DimensionError(
-                                    f"Matrix element [{i}, {j}] has incorrect units.\n"
-                                    f"Expected {units2str(expected_units)}, got {units2str(el)}.\n"
-                                    f"If you are constructing a matrix from arithmetic between Vals and primitive numbers, "
-                                    "consider passing check_val_dims=False to this constructor."
-                                ) from e
-
-                        row_expr.append(el.expr)
-                    else:
-                        row_expr.append(el)
+                for j, el in enumerate(row):
+                    row_expr.append(self._element_expr(i, j, el, check_val_dims, unit_grid))
 
                 self_expr.append(row_expr)
             
@@ -87,6 +95,43 @@ class Matrix(Generic[L, R]):
                 f"Matrix must have {len(right_frame.space.base_units)} columns, got {j + 1}"
 
             self.expr = SympyMatrix(self_expr)
+
+    def _element_expr(
+        self, i: int, j: int, el: Q[Val], check_val_dims: bool, unit_grid: Optional[List[List[Val]]]
+    ) -> Any:
+        "The expr of element [i, j], checking that its units are those the frames expect"
+        if not isinstance(el, Val):
+            return el
+
+        if check_val_dims:
+            expected_units = unit_grid[i][j] if unit_grid is not None \
+                else self.right_frame.space.base_units[j] / self.left_frame.space.base_units[i]
+
+            # dimensions are interned, so matching ones are usually the same object
+            if el.dimension is expected_units.dimension:
+                return el.expr
+
+            try:
+                DimensionError.check(expected_units, el)
+
+            except DimensionError as e:
+
+                def units2str(units: Val) -> str:
+                    return "dimensionless" if units.units == 1 else str(units.units)
+                    
+                raise DimensionError(
+                    f"Matrix element [{i}, {j}] has incorrect units.\n"
+                    f"Expected {units2str(expected_units)}, got {units2str(el)}.\n"
+                    f"If you are constructing a matrix from arithmetic between Vals and primitive numbers, "
+                    "consider passing check_val_dims=False to this constructor."
+                ) from e
+
+        return el.expr
+
+    @property
+    def is_sparse(self) -> bool:
+        "Whether the elements are stored sparsely (see the constructor)"
+        return isinstance(self.expr, SparseMatrix)
     
     def __mul__(self, other: Q[Val]) -> 'Matrix[L, Any]':
         "Matrix[L, R] * Q[Val] => Matrix[L, Unknown]"
@@ -252,6 +297,21 @@ class Matrix(Generic[L, R]):
         units = self.right_frame.space.base_units[j] / self.left_frame.space.base_units[i]
         return Val(units.units, self.expr[i, j]) # type: ignore
 
+    def to_numpy(self, subs: "SubstitutionMap" = {}, *, with_units: bool = False) -> Any:
+        """
+        Evaluate all elements at once to a numpy array of shape (..., rows, cols).
+        Values in `subs` may be arrays, which are broadcast together to give the leading (batch) dimensions.
+
+        If `with_units`, return a tuple of the array and a grid of the units of each element.
+        """
+        from mathpad.codegen import _evaluate_matrix
+
+        array = _evaluate_matrix(self.expr, subs)
+        if not with_units:
+            return array
+
+        return array, _unit_grid(self.left_frame, self.right_frame)
+
     @property
     def T(self):
         "Get the transpose of the matrix"
@@ -265,14 +325,51 @@ class Matrix(Generic[L, R]):
     
     @property
     def inv(self) -> Self:
-        "Inverse of a matrix"
+        """
+        Inverse of a matrix.
+
+        Prefer `solve()` for `M.inv @ b`; it never forms the inverse, which is far more expensive.
+        """
+        if self.is_sparse:
+            from mathpad.maths.linalg import _solve_sparse
+            inverse = _solve_sparse(self.expr, SympyMatrix.eye(len(self.left_frame)))
+        elif isinstance(self.expr, MatrixBase):
+            from mathpad.maths.linalg import _solve_fraction_free
+            inverse = _solve_fraction_free(self.expr, SympyMatrix.eye(len(self.left_frame)))
+        else:
+            inverse = self.expr.inv()
+
         return Matrix(
-            self.expr.inv(),
+            inverse,
             type=(
                 self.left_frame,
                 self.right_frame
             )
         )
+
+    def solve(self, b: Vector[L]) -> Vector[R]:
+        """
+        Solve `self @ x == b` for x, without forming the inverse.
+
+        Dense matrices are solved by fraction-free (Bareiss) elimination, which keeps the solution compact.
+        Sparse matrices are eliminated over their nonzero elements only.
+        To solve many times numerically instead, see `mathpad.codegen.as_numpy_solver`.
+        """
+        assert b.frame == self.left_frame, \
+            f"Matrix.solve() expects a Vector in {self.left_frame}, got one in {b.frame}"
+
+        b_expr = b.expr if isinstance(b.expr, MatrixBase) else b.expr.as_explicit()
+
+        A = self.expr if isinstance(self.expr, MatrixBase) else self.expr.as_explicit()
+
+        if self.is_sparse:
+            from mathpad.maths.linalg import _solve_sparse
+            x = _solve_sparse(A, b_expr)
+        else:
+            from mathpad.maths.linalg import _solve_fraction_free
+            x = _solve_fraction_free(A, b_expr)
+
+        return Vector(self.right_frame, x)
     
     
     def __eq__(self, other: Self) -> "Equation[Self]":
@@ -295,9 +392,25 @@ class Matrix(Generic[L, R]):
         )
 
 
+def _unit_grid(left_frame: Frame[Any], right_frame: Frame[Any]) -> List[List[Val]]:
+    "The units of each element of a Matrix[L, R]: the right base units over the left"
+    return [
+        [right_units / left_units for right_units in right_frame.space.base_units]
+        for left_units in left_frame.space.base_units
+    ]
+
+
 class VectorSpaceMapping(Generic[L, R]):
     def __init__(self, type: Tuple[L, R]):
         self.type = type
+        self._unit_grid: Optional[List[List[Val]]] = None
+
+    @property
+    def unit_grid(self) -> List[List[Val]]:
+        "The units of each element of matrices of this mapping; computed once"
+        if self._unit_grid is None:
+            self._unit_grid = _unit_grid(*self.type) # type: ignore
+        return self._unit_grid
     
     def __call__(self, *exprs: Union[str, Sequence[Q[Val]]], check: bool = True) -> Matrix[L, R]:
         try:
@@ -305,7 +418,44 @@ class VectorSpaceMapping(Generic[L, R]):
             assert isinstance(name, str)
             return Matrix(name, type=self.type, check_val_dims=check)
         except (TypeError, ValueError, AssertionError):
-            return Matrix([*[*exprs]], type=self.type, check_val_dims=check)
+            return Matrix(
+                [*[*exprs]], type=self.type, check_val_dims=check, unit_grid=self.unit_grid if check else None
+            )
+
+    def sparse(self, elements: Mapping[Tuple[int, int], Q[Val]], check: bool = True) -> Matrix[L, R]:
+        """
+        Construct a sparse matrix from its nonzero elements; all others are zero.
+
+        Example:
+            >>> K = Mat[Q, F].sparse({(0, 0): 2 * k, (0, 1): -k, (1, 0): -k, (1, 1): 2 * k})
+        """
+        return Matrix(elements, type=self.type, check_val_dims=check, unit_grid=self.unit_grid if check else None)
+
+    def rotation(self, angle: Q[Val], axis: Optional[Union[str, Sequence[Q[Val]]]] = None) -> "RotationMatrix[L, R]":
+        """
+        The rotation taking coordinates in R to coordinates in L, where R is rotated by `angle` relative to L.
+        In 3D, `axis` is a base name (ie. "k") or a direction.
+
+        Example:
+            >>> Mat[world, arm].rotation(theta, "k")
+        """
+        from mathpad.core.rotation import rotation
+        return rotation(self.type, angle, axis) # type: ignore
+
+    def euler(self, sequence: str, *angles: Q[Val]) -> "RotationMatrix[L, R]":
+        """
+        Intrinsic (Euler or Tait-Bryan) rotations about the axes of `sequence` in turn, by base name.
+
+        Example:
+            >>> Mat[world, body].euler("kji", yaw, pitch, roll)
+        """
+        from mathpad.core.rotation import euler
+        return euler(self.type, sequence, angles) # type: ignore
+
+    def quaternion(self, w: Q[Val], x: Q[Val], y: Q[Val], z: Q[Val]) -> "RotationMatrix[L, R]":
+        "The rotation of the unit quaternion w + xi + yj + zk"
+        from mathpad.core.rotation import quaternion
+        return quaternion(self.type, w, x, y, z) # type: ignore
 
     @property
     def I(self) -> Matrix[L, R]:
@@ -318,8 +468,27 @@ class VectorSpaceMapping(Generic[L, R]):
         return Matrix(SympyMatrix.eye(len(left_frame)), type=self.type) # type: ignore
 
 class _MatrixConstructor:
+    # `Mat[A, B]` is often written inside loops; reuse the mapping (and its unit grid) for the same frames.
+    # Frames are keyed by identity, as they aren't hashable. Cached mappings keep their frames alive,
+    # so the ids can't be reused while cached
+    _CACHE_SIZE = 256
+
+    def __init__(self):
+        self._mappings: "OrderedDict[Tuple[int, int], VectorSpaceMapping[Any, Any]]" = OrderedDict()
+
     def __getitem__(self, type: Tuple[Frame[L], Frame[R]]) -> VectorSpaceMapping[L, R]:
-        return VectorSpaceMapping(type)
+        left_frame, right_frame = type
+        key = id(left_frame), id(right_frame)
+
+        mapping = self._mappings.get(key)
+        if mapping is None:
+            mapping = self._mappings[key] = VectorSpaceMapping(type)
+            if len(self._mappings) > self._CACHE_SIZE:
+                self._mappings.popitem(last=False)
+        else:
+            self._mappings.move_to_end(key)
+
+        return mapping
 
         
 Mat = _MatrixConstructor()
\ No newline at end of file
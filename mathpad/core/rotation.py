@@ -0,0 +1,182 @@
+from functools import lru_cache
+from typing import Any, Optional, Sequence, Tuple, Union
+
+import sympy
+from sympy import ImmutableMatrix
+from sympy.simplify.fu import TR10i
+
+from mathpad.core.val import DimensionError, Dimensionless, Val, Q, _conversion_factor
+from mathpad.core.frame import Frame
+from mathpad.core.vector import Vector
+from mathpad.core.matrix import Matrix, L, R
+from mathpad.core.units import radians
+
+__all__ = ["RotationMatrix"]
+
+# an axis of rotation: a base name of the frames (ie. "k" for R3), or a direction (normalised here). None in 2D
+Axis = Optional[Union[str, Sequence[Q[Val]]]]
+
+# bounded, so that long-running processes don't hold on to every rotation they've ever composed
+_CACHE_SIZE = 1024
+
+
+class RotationMatrix(Matrix[L, R]):
+    """
+    An orthonormal Matrix[L, R], rotating coordinates in R to coordinates in L.
+    Construct with `Mat[L, R].rotation()`, `.euler()` or `.quaternion()`.
+
+    Its inverse is its transpose, and products of rotations stay compact: rotations about the same axis
+    add their angles, and other products fold angle sums (once; the results are cached).
+    """
+
+    # the (axis, angle) of rotations about a single axis, for composing them in closed form
+    __slots__ = ("axis_angle",)
+
+    def __init__(
+        self,
+        expr: Any,
+        *,
+        type: Tuple[Frame[L], Frame[R]],
+        axis_angle: Optional[Tuple[Optional[Tuple[Any, ...]], Any]] = None
+    ):
+        super().__init__(expr, type=type)
+        self.axis_angle = axis_angle
+
+    @property
+    def T(self) -> 'RotationMatrix[R, L]':
+        "The transpose; also the inverse"
+        axis_angle = None if self.axis_angle is None else (self.axis_angle[0], -self.axis_angle[1])
+        return RotationMatrix(
+            self.expr.transpose(), type=(self.right_frame, self.left_frame), axis_angle=axis_angle
+        )
+
+    @property
+    def inv(self) -> 'RotationMatrix[R, L]': # type: ignore [override]
+        "The inverse of a rotation is its transpose; no elimination needed"
+        return self.T
+
+    def solve(self, b: Vector[L]) -> Vector[R]:
+        "Solve `self @ x == b` for x, by multiplying with the transpose"
+        return self.T @ b
+
+    def __matmul__(self, other: Any) -> Any:
+        if not isinstance(other, RotationMatrix):
+            return super().__matmul__(other)
+
+        assert other.left_frame == self.right_frame, \
+            "Rotation composition must take the form `Matrix[L, R] @ Matrix[R, A] => Matrix[L, A]`" \
+            f"Left Matrix expects {self.right_frame}, Right Matrix has {other.left_frame}"
+
+        type = self.left_frame, other.right_frame
+
+        if self.axis_angle and other.axis_angle and self.axis_angle[0] == other.axis_angle[0]:
+            axis, angle = self.axis_angle
+            total = angle + other.axis_angle[1]
+            return RotationMatrix(_axis_angle_expr(axis, total, len(self.left_frame)), type=type, axis_angle=(axis, total))
+
+        return RotationMatrix(_compose(ImmutableMatrix(self.expr), ImmutableMatrix(other.expr)), type=type)
+
+
+def rotation(frames: Tuple[Frame[L], Frame[R]], angle: Q[Val], axis: Axis = None) -> RotationMatrix[L, R]:
+    "A rotation by `angle` about `axis` (in 3D); see `VectorSpaceMapping.rotation()`"
+    _check_frames(frames)
+    n = len(frames[0])
+
+    if n == 2:
+        assert axis is None, "2D rotations don't have an axis"
+        axis_key = None
+    else:
+        assert n == 3 and axis is not None, "3D rotations need an axis; rotations are only supported in 2D and 3D"
+        axis_key = _normalised_axis(axis, frames[0])
+
+    angle_expr = _checked_expr(angle, radians)
+    return RotationMatrix(_axis_angle_expr(axis_key, angle_expr, n), type=frames, axis_angle=(axis_key, angle_expr))
+
+
+def euler(frames: Tuple[Frame[L], Frame[R]], sequence: str, angles: Sequence[Q[Val]]) -> RotationMatrix[L, R]:
+    "Intrinsic rotations about the axes of `sequence` in turn; see `VectorSpaceMapping.euler()`"
+    _check_frames(frames)
+    assert len(frames[0]) == 3, "Euler rotations are only defined in 3D"
+    assert len(sequence) == len(angles), \
+        f"Need an angle for each axis of the sequence '{sequence}'. Got {len(angles)}"
+
+    expr = sympy.eye(3)
+    for axis, angle in zip(sequence, angles):
+        axis_key = _normalised_axis(axis, frames[0])
+        expr = expr @ _axis_angle_expr(axis_key, _checked_expr(angle, radians), 3)
+
+    return RotationMatrix(expr, type=frames)
+
+
+def quaternion(frames: Tuple[Frame[L], Frame[R]], w: Q[Val], x: Q[Val], y: Q[Val], z: Q[Val]) -> RotationMatrix[L, R]:
+    "The rotation of the unit quaternion w + xi + yj + zk; see `VectorSpaceMapping.quaternion()`"
+    _check_frames(frames)
+    assert len(frames[0]) == 3, "Quaternion rotations are only defined in 3D"
+
+    w, x, y, z = (_checked_expr(q, Dimensionless(1, 1)) for q in (w, x, y, z))
+    return RotationMatrix(
+        sympy.Matrix([
+            [1 - 2 * (y ** 2 + z ** 2), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+            [2 * (x * y + z * w), 1 - 2 * (x ** 2 + z ** 2), 2 * (y * z - x * w)],
+            [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x ** 2 + y ** 2)],
+        ]),
+        type=frames
+    )
+
+
+def _check_frames(frames: Tuple[Frame[Any], Frame[Any]]):
+    left_frame, right_frame = frames
+    assert len(left_frame) == len(right_frame), \
+        f"Rotations must be between frames of the same dimensions. Got {len(left_frame)} != {len(right_frame)}"
+
+    # rotations mix the axes (and aren't scaled), so every base must be in the same units
+    first = left_frame.space.base_units[0]
+    for units in (*left_frame.space.base_units, *right_frame.space.base_units):
+        DimensionError.check(first, units)
+        assert _conversion_factor(units.units, first.units) == 1, \
+            f"Rotations must be between frames in the same units. Got {units.units} and {first.units}"
+
+
+def _checked_expr(value: Q[Val], like: Val) -> Any:
+    "The expr of `value` in the units of `like` (ie. degrees in radians). A Val must have the dimension of `like`"
+    if not isinstance(value, Val):
+        return sympy.sympify(value)
+
+    DimensionError.check(value, like)
+    return value.in_units(like).expr
+
+
+def _normalised_axis(axis: Union[str, Sequence[Q[Val]]], frame: Frame[Any]) -> Tuple[Any, ...]:
+    if isinstance(axis, str):
+        assert axis in frame.space.base_names, \
+            f"{axis} is not a base name of {frame} (base names are {frame.space.base_names})"
+        return tuple(int(name == axis) for name in frame.space.base_names)
+
+    assert len(axis) == 3, f"Axes of rotation must have 3 elements. Got {len(axis)}"
+    direction = [el.expr if isinstance(el, Val) else sympy.sympify(el) for el in axis]
+    norm = sympy.sqrt(sum(el ** 2 for el in direction))
+    return tuple(el / norm for el in direction)
+
+
+def _axis_angle_expr(axis: Optional[Tuple[Any, ...]], angle: Any, n: int) -> sympy.Matrix:
+    "The rotation matrix of `angle` about a unit `axis` (Rodrigues' formula), or in the plane if `axis` is None"
+    c, s = sympy.cos(angle), sympy.sin(angle)
+
+    if axis is None:
+        return sympy.Matrix([[c, -s], [s, c]])
+
+    x, y, z = axis
+    cross = sympy.Matrix([[0, -z, y], [z, 0, -x], [-y, x, 0]])
+    k = sympy.Matrix(axis)
+    return sympy.eye(n) * c + cross * s + (k @ k.T) * (1 - c)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _compose(a: ImmutableMatrix, b: ImmutableMatrix) -> ImmutableMatrix:
+    """
+    The product of two rotations, with sums of products of sines & cosines folded into sines & cosines of sums
+    (ie. cos(a)cos(b) - sin(a)sin(b) -> cos(a + b)). That's most of what `trigsimp` finds in products of rotations,
+    for a fraction of the time; a full `trigsimp` of a 7 joint chain takes tens of seconds.
+    Chains of rotations are usually composed many times over, so the results are cached.
+    """
+    return (a @ b).applyfunc(TR10i)
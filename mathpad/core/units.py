@@ -1,15 +1,276 @@
-"WARNING: this file was automatically generated by commented code within mathpad.py, and then modified slightly"
+"WARNING: this file was automatically generated by _generate_units_py.py. Do not edit by hand"
 import sympy.physics.units.definitions.unit_definitions as u
-from mathpad.val import *
+from sympy import Float, Integer, Mul, Pow, Rational, Symbol, pi
+from mathpad.core.dimensions import *
 
-A = Current(u.A)
-Bq = Frequency(u.Bq)
-C = Charge(u.C)
-D = Dioptre(u.D)
-F = Capacitance(u.F)
-G = GravityConstant(u.G)
-Gy = Gray(u.Gy)
-H = Inductance(u.H)
-Hz = Frequency(u.Hz)
-J = Energy(u.J)
-K = Temperature(u.K)
\ No newline at end of file
+A = Current._precomputed(u.A, (Integer(1), u.ampere))
+Bq = Frequency._precomputed(u.Bq, (Integer(1), u.second**-1))
+C = Charge._precomputed(u.C, (Integer(1), u.ampere * u.second))
+D = Dioptre._precomputed(u.D, (Integer(1), u.meter**-1))
+F = Capacitance._precomputed(u.F, (Integer(1), u.ampere**2 * u.kilogram**-1 * u.meter**-2 * u.second**4))
+G = GravityConstant._precomputed(u.G, (Float('6.6742999999999994e-11', precision=53), u.kilogram**-1 * u.meter**3 * u.second**-2))
+Gy = Gray._precomputed(u.Gy, (Integer(1), u.meter**2 * u.second**-2))
+H = Inductance._precomputed(u.H, (Integer(1), u.ampere**-2 * u.kilogram * u.meter**2 * u.second**-2))
+Hz = Frequency._precomputed(u.Hz, (Integer(1), u.second**-1))
+J = Energy._precomputed(u.J, (Integer(1), u.kilogram * u.meter**2 * u.second**-2))
+K = Temperature._precomputed(u.K, (Integer(1), u.kelvin))
+L = Volume._precomputed(u.L, (Rational(1, 1000), u.meter**3))
+N = Force._precomputed(u.N, (Integer(1), u.kilogram * u.meter * u.second**-2))
+Pa = EnergyDensity._precomputed(u.Pa, (Integer(1), u.kilogram * u.meter**-1 * u.second**-2))
+R = MolarGasConstant._precomputed(u.R, (Float('8.3144626181532413', precision=53), u.kelvin**-1 * u.kilogram * u.meter**2 * u.mole**-1 * u.second**-2))
+S = Conductance._precomputed(u.S, (Integer(1), u.ampere**2 * u.kilogram**-1 * u.meter**-2 * u.second**3))
+T = MagneticDensity._precomputed(u.T, (Integer(1), u.ampere**-1 * u.kilogram * u.second**-2))
+V = Voltage._precomputed(u.V, (Integer(1), u.ampere**-1 * u.kilogram * u.meter**2 * u.second**-3))
+W = Power._precomputed(u.W, (Integer(1), u.kilogram * u.meter**2 * u.second**-3))
+Wb = MagneticFlux._precomputed(u.Wb, (Integer(1), u.ampere**-1 * u.kilogram * u.meter**2 * u.second**-2))
+Z0 = Impedance._precomputed(u.Z0, (Mul(Rational(149896229, 1250000), pi), u.ampere**-2 * u.kilogram * u.meter**2 * u.second**-3))
+acceleration_due_to_gravity = Acceleration._precomputed(u.acceleration_due_to_gravity, (Float('9.8066499999999994', precision=53), u.meter * u.second**-2))
+ampere = Current._precomputed(u.ampere, (Integer(1), u.ampere))
+amperes = Current._precomputed(u.amperes, (Integer(1), u.ampere))
+amu = Mass._precomputed(u.amu, (Float('1.6605390666e-27', precision=53), u.kilogram))
+amus = Mass._precomputed(u.amus, (Float('1.6605390666e-27', precision=53), u.kilogram))
+angular_mil = Angle._precomputed(u.angular_mil, None)
+angular_mils = Angle._precomputed(u.angular_mils, None)
+anomalistic_year = Time._precomputed(u.anomalistic_year, (Float('31558432.5504', precision=53), u.second))
+anomalistic_years = Time._precomputed(u.anomalistic_years, (Float('31558432.5504', precision=53), u.second))
+astronomical_unit = Length._precomputed(u.astronomical_unit, (Integer(149597870691), u.meter))
+astronomical_units = Length._precomputed(u.astronomical_units, (Integer(149597870691), u.meter))
+atm = EnergyDensity._precomputed(u.atm, (Integer(101325), u.kilogram * u.meter**-1 * u.second**-2))
+atmosphere = EnergyDensity._precomputed(u.atmosphere, (Integer(101325), u.kilogram * u.meter**-1 * u.second**-2))
+atmospheres = EnergyDensity._precomputed(u.atmospheres, (Integer(101325), u.kilogram * u.meter**-1 * u.second**-2))
+atomic_mass_unit = Mass._precomputed(u.atomic_mass_unit, (Float('1.6605390666e-27', precision=53), u.kilogram))
+au = Length._precomputed(u.au, (Integer(149597870691), u.meter))
+avogadro_number = Dimensionless._precomputed(u.avogadro_number, None)
+bar = EnergyDensity._precomputed(u.bar, (Integer(100000), u.kilogram * u.meter**-1 * u.second**-2))
+bars = EnergyDensity._precomputed(u.bars, (Integer(100000), u.kilogram * u.meter**-1 * u.second**-2))
+becquerel = Frequency._precomputed(u.becquerel, (Integer(1), u.second**-1))
+bit = Information._precomputed(u.bit, None)
+bits = Information._precomputed(u.bits, None)
+byte = Information._precomputed(u.byte, None)
+c = Velocity._precomputed(u.c, (Integer(299792458), u.meter * u.second**-1))
+cL = Volume._precomputed(u.cL, (Rational(1, 100000), u.meter**3))
+candela = LuminousIntensity._precomputed(u.candela, (Integer(1), u.candela))
+candelas = LuminousIntensity._precomputed(u.candelas, (Integer(1), u.candela))
+cd = LuminousIntensity._precomputed(u.cd, (Integer(1), u.candela))
+centiliter = Volume._precomputed(u.centiliter, (Rational(1, 100000), u.meter**3))
+centiliters = Volume._precomputed(u.centiliters, (Rational(1, 100000), u.meter**3))
+centimeter = Length._precomputed(u.centimeter, (Rational(1, 100), u.meter))
+centimeters = Length._precomputed(u.centimeters, (Rational(1, 100), u.meter))
+cl = Volume._precomputed(u.cl, (Rational(1, 100000), u.meter**3))
+cm = Length._precomputed(u.cm, (Rational(1, 100), u.meter))
+common_year = Time._precomputed(u.common_year, (Integer(31536000), u.second))
+common_years = Time._precomputed(u.common_years, (Integer(31536000), u.second))
+coulomb = Charge._precomputed(u.coulomb, (Integer(1), u.ampere * u.second))
+coulombs = Charge._precomputed(u.coulombs, (Integer(1), u.ampere * u.second))
+curie = Frequency._precomputed(u.curie, (Integer(37000000000), u.second**-1))
+dL = Volume._precomputed(u.dL, (Rational(1, 10000), u.meter**3))
+day = Time._precomputed(u.day, (Integer(86400), u.second))
+days = Time._precomputed(u.days, (Integer(86400), u.second))
+deciliter = Volume._precomputed(u.deciliter, (Rational(1, 10000), u.meter**3))
+deciliters = Volume._precomputed(u.deciliters, (Rational(1, 10000), u.meter**3))
+decimeter = Length._precomputed(u.decimeter, (Rational(1, 10), u.meter))
+decimeters = Length._precomputed(u.decimeters, (Rational(1, 10), u.meter))
+deg = Dimensionless._precomputed(u.deg, None)
+degree = Dimensionless._precomputed(u.degree, None)
+degrees = Dimensionless._precomputed(u.degrees, None)
+dioptre = Dioptre._precomputed(u.dioptre, (Integer(1), u.meter**-1))
+dl = Volume._precomputed(u.dl, (Rational(1, 10000), u.meter**3))
+dm = Length._precomputed(u.dm, (Rational(1, 10), u.meter))
+draconic_year = Time._precomputed(u.draconic_year, (Float('29947968.0', precision=53), u.second))
+draconic_years = Time._precomputed(u.draconic_years, (Float('29947968.0', precision=53), u.second))
+e0 = Permittivity._precomputed(u.e0, (Mul(Rational(625000, 22468879468420441), Pow(pi, Integer(-1))), u.ampere**2 * u.kilogram**-1 * u.meter**-3 * u.second**4))
+eV = Energy._precomputed(u.eV, (Float('1.6021766339999999e-19', precision=53), u.kilogram * u.meter**2 * u.second**-2))
+electronvolt = Energy._precomputed(u.electronvolt, (Float('1.6021766339999999e-19', precision=53), u.kilogram * u.meter**2 * u.second**-2))
+electronvolts = Energy._precomputed(u.electronvolts, (Float('1.6021766339999999e-19', precision=53), u.kilogram * u.meter**2 * u.second**-2))
+elementary_charge = Charge._precomputed(u.elementary_charge, (Float('1.6021766339999999e-19', precision=53), u.ampere * u.second))
+exbibyte = Information._precomputed(u.exbibyte, None)
+exbibytes = Information._precomputed(u.exbibytes, None)
+farad = Capacitance._precomputed(u.farad, (Integer(1), u.ampere**2 * u.kilogram**-1 * u.meter**-2 * u.second**4))
+farads = Capacitance._precomputed(u.farads, (Integer(1), u.ampere**2 * u.kilogram**-1 * u.meter**-2 * u.second**4))
+feet = Length._precomputed(u.feet, (Rational(381, 1250), u.meter))
+foot = Length._precomputed(u.foot, (Rational(381, 1250), u.meter))
+ft = Length._precomputed(u.ft, (Rational(381, 1250), u.meter))
+full_moon_cycle = Time._precomputed(u.full_moon_cycle, (Float('35578174.777056001', precision=53), u.second))
+full_moon_cycles = Time._precomputed(u.full_moon_cycles, (Float('35578174.777056001', precision=53), u.second))
+g = Mass._precomputed(u.g, (Rational(1, 1000), u.kilogram))
+gaussian_year = Time._precomputed(u.gaussian_year, (Float('31558196.013119999', precision=53), u.second))
+gaussian_years = Time._precomputed(u.gaussian_years, (Float('31558196.013119999', precision=53), u.second))
+gee = Acceleration._precomputed(u.gee, (Float('9.8066499999999994', precision=53), u.meter * u.second**-2))
+gees = Acceleration._precomputed(u.gees, (Float('9.8066499999999994', precision=53), u.meter * u.second**-2))
+gibibyte = Information._precomputed(u.gibibyte, None)
+gibibytes = Information._precomputed(u.gibibytes, None)
+gram = Mass._precomputed(u.gram, (Rational(1, 1000), u.kilogram))
+grams = Mass._precomputed(u.grams, (Rational(1, 1000), u.kilogram))
+gray = Gray._precomputed(u.gray, (Integer(1), u.meter**2 * u.second**-2))
+h = Time._precomputed(u.h, (Integer(3600), u.second))
+hbar = Action._precomputed(u.hbar, (Mul(Float('3.3130350750000003e-34', precision=53), Pow(pi, Integer(-1))), u.kilogram * u.meter**2 * u.second**-1))
+henry = Inductance._precomputed(u.henry, (Integer(1), u.ampere**-2 * u.kilogram * u.meter**2 * u.second**-2))
+henrys = Inductance._precomputed(u.henrys, (Integer(1), u.ampere**-2 * u.kilogram * u.meter**2 * u.second**-2))
+hertz = Frequency._precomputed(u.hertz, (Integer(1), u.second**-1))
+hour = Time._precomputed(u.hour, (Integer(3600), u.second))
+hours = Time._precomputed(u.hours, (Integer(3600), u.second))
+hz = Frequency._precomputed(u.hz, (Integer(1), u.second**-1))
+inch = Length._precomputed(u.inch, (Rational(127, 5000), u.meter))
+inches = Length._precomputed(u.inches, (Rational(127, 5000), u.meter))
+joule = Energy._precomputed(u.joule, (Integer(1), u.kilogram * u.meter**2 * u.second**-2))
+joules = Energy._precomputed(u.joules, (Integer(1), u.kilogram * u.meter**2 * u.second**-2))
+julian_year = Time._precomputed(u.julian_year, (Integer(31557600), u.second))
+julian_years = Time._precomputed(u.julian_years, (Integer(31557600), u.second))
+kPa = EnergyDensity._precomputed(u.kPa, (Integer(1000), u.kilogram * u.meter**-1 * u.second**-2))
+kat = Katal._precomputed(u.kat, (Integer(1), u.mole * u.second**-1))
+katal = Katal._precomputed(u.katal, (Integer(1), u.mole * u.second**-1))
+kelvin = Temperature._precomputed(u.kelvin, (Integer(1), u.kelvin))
+kelvins = Temperature._precomputed(u.kelvins, (Integer(1), u.kelvin))
+kg = Mass._precomputed(u.kg, (Integer(1), u.kilogram))
+kibibyte = Information._precomputed(u.kibibyte, None)
+kibibytes = Information._precomputed(u.kibibytes, None)
+kilogram = Mass._precomputed(u.kilogram, (Integer(1), u.kilogram))
+kilograms = Mass._precomputed(u.kilograms, (Integer(1), u.kilogram))
+kilometer = Length._precomputed(u.kilometer, (Integer(1000), u.meter))
+kilometers = Length._precomputed(u.kilometers, (Integer(1000), u.meter))
+kilopascal = EnergyDensity._precomputed(u.kilopascal, (Integer(1000), u.kilogram * u.meter**-1 * u.second**-2))
+km = Length._precomputed(u.km, (Integer(1000), u.meter))
+l = Volume._precomputed(u.l, (Rational(1, 1000), u.meter**3))
+lightyear = Length._precomputed(u.lightyear, (Integer(9460730472580800), u.meter))
+lightyears = Length._precomputed(u.lightyears, (Integer(9460730472580800), u.meter))
+liter = Volume._precomputed(u.liter, (Rational(1, 1000), u.meter**3))
+liters = Volume._precomputed(u.liters, (Rational(1, 1000), u.meter**3))
+lux = Illuminance._precomputed(u.lux, (Integer(1), u.candela * u.meter**-2))
+lx = Illuminance._precomputed(u.lx, (Integer(1), u.candela * u.meter**-2))
+ly = Length._precomputed(u.ly, (Integer(9460730472580800), u.meter))
+m = Length._precomputed(u.m, (Integer(1), u.meter))
+mL = Volume._precomputed(u.mL, (Rational(1, 1000000), u.meter**3))
+mebibyte = Information._precomputed(u.mebibyte, None)
+mebibytes = Information._precomputed(u.mebibytes, None)
+meter = Length._precomputed(u.meter, (Integer(1), u.meter))
+meters = Length._precomputed(u.meters, (Integer(1), u.meter))
+mg = Mass._precomputed(u.mg, (Rational(1, 1000000), u.kilogram))
+mho = Conductance._precomputed(u.mho, (Integer(1), u.ampere**2 * u.kilogram**-1 * u.meter**-2 * u.second**3))
+mhos = Conductance._precomputed(u.mhos, (Integer(1), u.ampere**2 * u.kilogram**-1 * u.meter**-2 * u.second**3))
+mi = Length._precomputed(u.mi, (Rational(201168, 125), u.meter))
+microgram = Mass._precomputed(u.microgram, (Rational(1, 1000000000), u.kilogram))
+micrograms = Mass._precomputed(u.micrograms, (Rational(1, 1000000000), u.kilogram))
+micrometer = Length._precomputed(u.micrometer, (Rational(1, 1000000), u.meter))
+micrometers = Length._precomputed(u.micrometers, (Rational(1, 1000000), u.meter))
+micron = Length._precomputed(u.micron, (Rational(1, 1000000), u.meter))
+microns = Length._precomputed(u.microns, (Rational(1, 1000000), u.meter))
+microsecond = Time._precomputed(u.microsecond, (Rational(1, 1000000), u.second))
+microseconds = Time._precomputed(u.microseconds, (Rational(1, 1000000), u.second))
+mil = Angle._precomputed(u.mil, None)
+mile = Length._precomputed(u.mile, (Rational(201168, 125), u.meter))
+miles = Length._precomputed(u.miles, (Rational(201168, 125), u.meter))
+milli_mass_unit = Mass._precomputed(u.milli_mass_unit, (Float('1.6605390666000002e-30', precision=53), u.kilogram))
+milligram = Mass._precomputed(u.milligram, (Rational(1, 1000000), u.kilogram))
+milligrams = Mass._precomputed(u.milligrams, (Rational(1, 1000000), u.kilogram))
+milliliter = Volume._precomputed(u.milliliter, (Rational(1, 1000000), u.meter**3))
+milliliters = Volume._precomputed(u.milliliters, (Rational(1, 1000000), u.meter**3))
+millimeter = Length._precomputed(u.millimeter, (Rational(1, 1000), u.meter))
+millimeters = Length._precomputed(u.millimeters, (Rational(1, 1000), u.meter))
+millisecond = Time._precomputed(u.millisecond, (Rational(1, 1000), u.second))
+milliseconds = Time._precomputed(u.milliseconds, (Rational(1, 1000), u.second))
+minute = Time._precomputed(u.minute, (Integer(60), u.second))
+minutes = Time._precomputed(u.minutes, (Integer(60), u.second))
+ml = Volume._precomputed(u.ml, (Rational(1, 1000000), u.meter**3))
+mm = Length._precomputed(u.mm, (Rational(1, 1000), u.meter))
+mmHg = EnergyDensity._precomputed(u.mmHg, (Float('133.32238741500001', precision=53), u.kilogram * u.meter**-1 * u.second**-2))
+mmu = Mass._precomputed(u.mmu, (Float('1.6605390666000002e-30', precision=53), u.kilogram))
+mmus = Mass._precomputed(u.mmus, (Float('1.6605390666000002e-30', precision=53), u.kilogram))
+mol = AmountOfSubstance._precomputed(u.mol, (Integer(1), u.mole))
+mole = AmountOfSubstance._precomputed(u.mole, (Integer(1), u.mole))
+moles = AmountOfSubstance._precomputed(u.moles, (Integer(1), u.mole))
+ms = Time._precomputed(u.ms, (Rational(1, 1000), u.second))
+nanometer = Length._precomputed(u.nanometer, (Rational(1, 1000000000), u.meter))
+nanometers = Length._precomputed(u.nanometers, (Rational(1, 1000000000), u.meter))
+nanosecond = Time._precomputed(u.nanosecond, (Rational(1, 1000000000), u.second))
+nanoseconds = Time._precomputed(u.nanoseconds, (Rational(1, 1000000000), u.second))
+nautical_mile = Length._precomputed(u.nautical_mile, (Rational(1157478, 625), u.meter))
+nautical_miles = Length._precomputed(u.nautical_miles, (Rational(1157478, 625), u.meter))
+newton = Force._precomputed(u.newton, (Integer(1), u.kilogram * u.meter * u.second**-2))
+newtons = Force._precomputed(u.newtons, (Integer(1), u.kilogram * u.meter * u.second**-2))
+nm = Length._precomputed(u.nm, (Rational(1, 1000000000), u.meter))
+nmi = Length._precomputed(u.nmi, (Rational(1157478, 625), u.meter))
+ns = Time._precomputed(u.ns, (Rational(1, 1000000000), u.second))
+ohm = Impedance._precomputed(u.ohm, (Integer(1), u.ampere**-2 * u.kilogram * u.meter**2 * u.second**-3))
+ohms = Impedance._precomputed(u.ohms, (Integer(1), u.ampere**-2 * u.kilogram * u.meter**2 * u.second**-3))
+optical_power = Dioptre._precomputed(u.optical_power, (Integer(1), u.meter**-1))
+pa = EnergyDensity._precomputed(u.pa, (Integer(1), u.kilogram * u.meter**-1 * u.second**-2))
+pascal = EnergyDensity._precomputed(u.pascal, (Integer(1), u.kilogram * u.meter**-1 * u.second**-2))
+pascals = EnergyDensity._precomputed(u.pascals, (Integer(1), u.kilogram * u.meter**-1 * u.second**-2))
+pebibyte = Information._precomputed(u.pebibyte, None)
+pebibytes = Information._precomputed(u.pebibytes, None)
+percent = Dimensionless._precomputed(u.percent, None)
+percents = Dimensionless._precomputed(u.percents, None)
+permille = Dimensionless._precomputed(u.permille, None)
+picometer = Length._precomputed(u.picometer, (Rational(1, 1000000000000), u.meter))
+picometers = Length._precomputed(u.picometers, (Rational(1, 1000000000000), u.meter))
+picosecond = Time._precomputed(u.picosecond, (Rational(1, 1000000000000), u.second))
+picoseconds = Time._precomputed(u.picoseconds, (Rational(1, 1000000000000), u.second))
+planck = Action._precomputed(u.planck, (Float('6.6260701500000007e-34', precision=53), u.kilogram * u.meter**2 * u.second**-1))
+planck_acceleration = Acceleration._precomputed(u.planck_acceleration, (Mul(Float('1.8119500865244859e+47', precision=53), Pow(Integer(299792458), Rational(1, 2)), Pow(pi, Rational(1, 2))), u.meter * u.second**-2))
+planck_angular_frequency = Frequency._precomputed(u.planck_angular_frequency, (Mul(Float('6.0440149115575348e+38', precision=53), Pow(Integer(299792458), Rational(1, 2)), Pow(pi, Rational(1, 2))), u.second**-1))
+planck_area = Area._precomputed(u.planck_area, (Mul(Float('8.2067206120847688e-70', precision=53), Pow(pi, Integer(-1))), u.meter**2))
+planck_charge = Charge._precomputed(u.planck_charge, (Mul(Float('1.9199605886336191e-22', precision=53), Pow(Integer(299792458), Rational(1, 2)), Pow(pi, Rational(-1, 2))), u.ampere * u.second))
+planck_current = Current._precomputed(u.planck_current, (Float('3.4788727546982893e+25', precision=53), u.ampere))
+planck_density = Density._precomputed(u.planck_density, (Mul(Float('1.6408392403625791e+96', precision=53), pi), u.kilogram * u.meter**-3))
+planck_energy = Energy._precomputed(u.planck_energy, (Mul(Float('200240.33395813138', precision=53), Pow(Integer(299792458), Rational(1, 2)), Pow(pi, Rational(-1, 2))), u.kilogram * u.meter**2 * u.second**-2))
+planck_energy_density = EnergyDensity._precomputed(u.planck_energy_density, (Mul(Float('1.4747127647504537e+113', precision=53), pi), u.kilogram * u.meter**-1 * u.second**-2))
+planck_force = Force._precomputed(u.planck_force, (Float('1.2102555643382069e+44', precision=53), u.kilogram * u.meter * u.second**-2))
+planck_impedance = Impedance._precomputed(u.planck_impedance, (Float('29.979245800000005', precision=53), u.ampere**-2 * u.kilogram * u.meter**2 * u.second**-3))
+planck_intensity = PlanckIntensity._precomputed(u.planck_intensity, (Mul(Float('4.4210776458851429e+121', precision=53), pi), u.kilogram * u.second**-3))
+planck_length = Length._precomputed(u.planck_length, (Mul(Float('1.6545293395748776e-39', precision=53), Pow(Integer(299792458), Rational(1, 2)), Pow(pi, Rational(-1, 2))), u.meter))
+planck_mass = Mass._precomputed(u.planck_mass, (Mul(Float('2.2279741880271013e-12', precision=53), Pow(Integer(299792458), Rational(1, 2)), Pow(pi, Rational(-1, 2))), u.kilogram))
+planck_momentum = Momentum._precomputed(u.planck_momentum, (Mul(Float('0.0006679298581891989', precision=53), Pow(Integer(299792458), Rational(1, 2)), Pow(pi, Rational(-1, 2))), u.kilogram * u.meter * u.second**-1))
+planck_power = Power._precomputed(u.planck_power, (Float('3.6282549044112808e+52', precision=53), u.kilogram * u.meter**2 * u.second**-3))
+planck_pressure = EnergyDensity._precomputed(u.planck_pressure, (Mul(Float('1.4747127647504539e+113', precision=53), pi), u.kilogram * u.meter**-1 * u.second**-2))
+planck_temperature = Temperature._precomputed(u.planck_temperature, (Mul(Float('1.4503348349807325e+28', precision=53), Pow(Integer(299792458), Rational(1, 2)), Pow(pi, Rational(-1, 2))), u.kelvin))
+planck_time = Time._precomputed(u.planck_time, (Mul(Float('5.5189158213409013e-48', precision=53), Pow(Integer(299792458), Rational(1, 2)), Pow(pi, Rational(-1, 2))), u.second))
+planck_voltage = Voltage._precomputed(u.planck_voltage, (Float('1.0429398142002314e+27', precision=53), u.ampere**-1 * u.kilogram * u.meter**2 * u.second**-3))
+planck_volume = Volume._precomputed(u.planck_volume, (Mul(Float('1.357826003438815e-108', precision=53), Pow(Integer(299792458), Rational(1, 2)), Pow(pi, Rational(-3, 2))), u.meter**3))
+pm = Length._precomputed(u.pm, (Rational(1, 1000000000000), u.meter))
+pound = Mass._precomputed(u.pound, (Rational(45359237, 100000000), u.kilogram))
+pounds = Mass._precomputed(u.pounds, (Rational(45359237, 100000000), u.kilogram))
+ps = Time._precomputed(u.ps, (Rational(1, 1000000000000), u.second))
+psi = EnergyDensity._precomputed(u.psi, (Float('6894.7572931683617', precision=53), u.kilogram * u.meter**-1 * u.second**-2))
+quart = Volume._precomputed(u.quart, (Rational(473176473, 500000000000), u.meter**3))
+quarts = Volume._precomputed(u.quarts, (Rational(473176473, 500000000000), u.meter**3))
+rad = Angle._precomputed(u.rad, None)
+radian = Angle._precomputed(u.radian, None)
+radians = Angle._precomputed(u.radians, None)
+rutherford = Frequency._precomputed(u.rutherford, (Integer(1000000), u.second**-1))
+s = Time._precomputed(u.s, (Integer(1), u.second))
+second = Time._precomputed(u.second, (Integer(1), u.second))
+seconds = Time._precomputed(u.seconds, (Integer(1), u.second))
+sidereal_year = Time._precomputed(u.sidereal_year, (Float('31558149.539999999', precision=53), u.second))
+sidereal_years = Time._precomputed(u.sidereal_years, (Float('31558149.539999999', precision=53), u.second))
+siemens = Conductance._precomputed(u.siemens, (Integer(1), u.ampere**2 * u.kilogram**-1 * u.meter**-2 * u.second**3))
+speed_of_light = Velocity._precomputed(u.speed_of_light, (Integer(299792458), u.meter * u.second**-1))
+sr = SteRadian._precomputed(u.sr, None)
+steradian = SteRadian._precomputed(u.steradian, None)
+steradians = SteRadian._precomputed(u.steradians, None)
+tebibyte = Information._precomputed(u.tebibyte, None)
+tebibytes = Information._precomputed(u.tebibytes, None)
+tesla = MagneticDensity._precomputed(u.tesla, (Integer(1), u.ampere**-1 * u.kilogram * u.second**-2))
+teslas = MagneticDensity._precomputed(u.teslas, (Integer(1), u.ampere**-1 * u.kilogram * u.second**-2))
+torr = EnergyDensity._precomputed(u.torr, (Float('133.32238741500001', precision=53), u.kilogram * u.meter**-1 * u.second**-2))
+tropical_year = Time._precomputed(u.tropical_year, (Float('31556925.215999998', precision=53), u.second))
+tropical_years = Time._precomputed(u.tropical_years, (Float('31556925.215999998', precision=53), u.second))
+ug = Mass._precomputed(u.ug, (Rational(1, 1000000000), u.kilogram))
+um = Length._precomputed(u.um, (Rational(1, 1000000), u.meter))
+us = Time._precomputed(u.us, (Rational(1, 1000000), u.second))
+v = Voltage._precomputed(u.v, (Integer(1), u.ampere**-1 * u.kilogram * u.meter**2 * u.second**-3))
+vacuum_impedance = Impedance._precomputed(u.vacuum_impedance, (Mul(Rational(149896229, 1250000), pi), u.ampere**-2 * u.kilogram * u.meter**2 * u.second**-3))
+vacuum_permittivity = Permittivity._precomputed(u.vacuum_permittivity, (Mul(Rational(625000, 22468879468420441), Pow(pi, Integer(-1))), u.ampere**2 * u.kilogram**-1 * u.meter**-3 * u.second**4))
+volt = Voltage._precomputed(u.volt, (Integer(1), u.ampere**-1 * u.kilogram * u.meter**2 * u.second**-3))
+volts = Voltage._precomputed(u.volts, (Integer(1), u.ampere**-1 * u.kilogram * u.meter**2 * u.second**-3))
+watt = Power._precomputed(u.watt, (Integer(1), u.kilogram * u.meter**2 * u.second**-3))
+watts = Power._precomputed(u.watts, (Integer(1), u.kilogram * u.meter**2 * u.second**-3))
+wb = MagneticFlux._precomputed(u.wb, (Integer(1), u.ampere**-1 * u.kilogram * u.meter**2 * u.second**-2))
+weber = MagneticFlux._precomputed(u.weber, (Integer(1), u.ampere**-1 * u.kilogram * u.meter**2 * u.second**-2))
+webers = MagneticFlux._precomputed(u.webers, (Integer(1), u.ampere**-1 * u.kilogram * u.meter**2 * u.second**-2))
+yard = Length._precomputed(u.yard, (Rational(1143, 1250), u.meter))
+yards = Length._precomputed(u.yards, (Rational(1143, 1250), u.meter))
+yd = Length._precomputed(u.yd, (Rational(1143, 1250), u.meter))
+year = Time._precomputed(u.year, (Float('31556925.215999998', precision=53), u.second))
+years = Time._precomputed(u.years, (Float('31556925.215999998', precision=53), u.second))
+
+__all__ = ['u', 'Dimensionless', 'Length', 'Time', 'AngularMomentum', 'AngularVelocity', 'MomentOfInertia', 'Impedance', 'Resistivity', 'Inductance', 'Capacitance', 'Mass', 'Angle', 'AngularMil', 'SteRadian', 'Frequency', 'Current', 'Action', 'AmountOfSubstance', 'Radioactivity', 'Charge', 'Dioptre', 'Lumosity', 'GravityConstant', 'Gray', 'Energy', 'Temperature', 'Force', 'Elasticity', 'Pressure', 'MolarGasConstant', 'Conductance', 'MagneticDensity', 'MagneticFlux', 'Voltage', 'Power', 'Acceleration', 'Information', 'Velocity', 'LuminousIntensity', 'Area', 'Volume', 'Permittivity', 'Katal', 'Illuminance', 'Density', 'EnergyDensity', 'PlanckIntensity', 'Momentum', 'A', 'Bq', 'C', 'D', 'F', 'G', 'Gy', 'H', 'Hz', 'J', 'K', 'L', 'N', 'Pa', 'R', 'S', 'T', 'V', 'W', 'Wb', 'Z0', 'acceleration_due_to_gravity', 'ampere', 'amperes', 'amu', 'amus', 'angular_mil', 'angular_mils', 'anomalistic_year', 'anomalistic_years', 'astronomical_unit', 'astronomical_units', 'atm', 'atmosphere', 'atmospheres', 'atomic_mass_unit', 'au', 'avogadro_number', 'bar', 'bars', 'becquerel', 'bit', 'bits', 'byte', 'c', 'cL', 'candela', 'candelas', 'cd', 'centiliter', 'centiliters', 'centimeter', 'centimeters', 'cl', 'cm', 'common_year', 'common_years', 'coulomb', 'coulombs', 'curie', 'dL', 'day', 'days', 'deciliter', 'deciliters', 'decimeter', 'decimeters', 'deg', 'degree', 'degrees', 'dioptre', 'dl', 'dm', 'draconic_year', 'draconic_years', 'e0', 'eV', 'electronvolt', 'electronvolts', 'elementary_charge', 'exbibyte', 'exbibytes', 'farad', 'farads', 'feet', 'foot', 'ft', 'full_moon_cycle', 'full_moon_cycles', 'g', 'gaussian_year', 'gaussian_years', 'gee', 'gees', 'gibibyte', 'gibibytes', 'gram', 'grams', 'gray', 'h', 'hbar', 'henry', 'henrys', 'hertz', 'hour', 'hours', 'hz', 'inch', 'inches', 'joule', 'joules', 'julian_year', 'julian_years', 'kPa', 'kat', 'katal', 'kelvin', 'kelvins', 'kg', 'kibibyte', 'kibibytes', 'kilogram', 'kilograms', 'kilometer', 'kilometers', 'kilopascal', 'km', 'l', 'lightyear', 'lightyears', 'liter', 'liters', 'lux', 'lx', 'ly', 'm', 'mL', 'mebibyte', 'mebibytes', 'meter', 'meters', 'mg', 'mho', 'mhos', 'mi', 'microgram', 'micrograms', 'micrometer', 'micrometers', 'micron', 'microns', 'microsecond', 'microseconds', 'mil', 'mile', 'miles', 'milli_mass_unit', 'milligram', 'milligrams', 'milliliter', 'milliliters', 'millimeter', 'millimeters', 'millisecond', 'milliseconds', 'minute', 'minutes', 'ml', 'mm', 'mmHg', 'mmu', 'mmus', 'mol', 'mole', 'moles', 'ms', 'nanometer', 'nanometers', 'nanosecond', 'nanoseconds', 'nautical_mile', 'nautical_miles', 'newton', 'newtons', 'nm', 'nmi', 'ns', 'ohm', 'ohms', 'optical_power', 'pa', 'pascal', 'pascals', 'pebibyte', 'pebibytes', 'percent', 'percents', 'permille', 'picometer', 'picometers', 'picosecond', 'picoseconds', 'planck', 'planck_acceleration', 'planck_angular_frequency', 'planck_area', 'planck_charge', 'planck_current', 'planck_density', 'planck_energy', 'planck_energy_density', 'planck_force', 'planck_impedance', 'planck_intensity', 'planck_length', 'planck_mass', 'planck_momentum', 'planck_power', 'planck_pressure', 'planck_temperature', 'planck_time', 'planck_voltage', 'planck_volume', 'pm', 'pound', 'pounds', 'ps', 'psi', 'quart', 'quarts', 'rad', 'radian', 'radians', 'rutherford', 's', 'second', 'seconds', 'sidereal_year', 'sidereal_years', 'siemens', 'speed_of_light', 'sr', 'steradian', 'steradians', 'tebibyte', 'tebibytes', 'tesla', 'teslas', 'torr', 'tropical_year', 'tropical_years', 'ug', 'um', 'us', 'v', 'vacuum_impedance', 'vacuum_permittivity', 'volt', 'volts', 'watt', 'watts', 'wb', 'weber', 'webers', 'yard', 'yards', 'yd', 'year', 'years']
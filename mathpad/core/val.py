@@ -1,5 +1,6 @@
+from functools import lru_cache
 from types import FrameType
-from typing import TYPE_CHECKING, Any, Collection, Iterator, Optional, Tuple, Type, Union, TypeVar, overload, Callable
+from typing import TYPE_CHECKING, Any, Collection, Dict, Iterator, Optional, Tuple, Type, Union, TypeVar, overload, Callable
 import re
 from typing_extensions import Self, Literal
 import inspect
@@ -7,6 +8,7 @@ import inspect
 import sympy
 import sympy.physics.units as su
 from sympy.physics.units.dimensions import Dimension
+from sympy.core.function import AppliedUndef
 from sympy.physics.units.systems.si import dimsys_SI
 from sympy.physics.units.unitsystem import UnitSystem
 from sympy.physics.vector.printing import vlatex
@@ -15,6 +17,10 @@ from sympy.physics.units.util import (
     convert_to,
 )
 
+from mathpad.core.lazy import LazyExpr
+from mathpad._global_options import _global_options
+from mathpad._profiling import profile_when_active
+
 if TYPE_CHECKING:
     from mathpad.core.equation import Equation
 
@@ -22,26 +28,130 @@ if TYPE_CHECKING:
 # TODO: support numpy arrays
 Num = Union[int, float, complex]
 
+# called for nearly every unit operation, so only wrapped while profiling
+profile_when_active(__name__, "quantity_simplify", "unit simplification")
+profile_when_active(__name__, "convert_to", "unit conversion")
+
 # this should be a classmethod, but it isn't
 _units2dimensional_expr = UnitSystem.get_default_unit_system().get_dimensional_expr
 
+# how many distinct units & dimensions to remember; bounded, so that a long-running process
+# doesn't hold on to every units expression it has ever seen
+_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _units_dimension(units: sympy.Basic) -> sympy.Expr:
+    "The (interned) dimension of some units, cached"
+    return _intern(_units2dimensional_expr(units))
+
+
+class _SlottedMeta(type):
+    "Gives every subclass an empty __slots__ unless it declares its own, so that no Val carries a __dict__"
+
+    def __new__(mcs, name: str, bases: Tuple[type, ...], namespace: Dict[str, Any], **kwargs: Any):
+        namespace.setdefault("__slots__", ())
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+# units and dimensions are shared between many Vals; keep a single copy of each
+@lru_cache(maxsize=_CACHE_SIZE)
+def _intern(obj: Any) -> Any:
+    "The first-seen copy of `obj`, among the recently seen"
+    return obj
+
+
+# The canonical key of a units expression is its (scale factor, expression in SI base units).
+# ie. newton -> (1, kilogram*meter/second**2), kilometer/hour -> (5/18, meter/second).
+# Units with the same SI expression can be converted between by their scale factors alone,
+# without sympy's (slow) unit conversion. None where there is no such form (ie. radians, degrees)
+UnitKey = Tuple[sympy.Expr, sympy.Expr]
+
+_SI_BASE_UNITS = UnitSystem.get_unit_system("SI")._base_units
+
+# units of mathpad.core.units & constants -> (the shared units object, its key); precomputed (see Val._precomputed).
+# Other units go through the bounded _computed_unit_entry() cache instead
+_unit_table: Dict[sympy.Basic, Tuple[sympy.Basic, Optional[UnitKey]]] = {}
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _computed_unit_entry(units: sympy.Basic) -> Tuple[sympy.Basic, Optional[UnitKey]]:
+    return units, _canonical_unit_key(units)
+
+
+def _unit_entry(units: sympy.Basic) -> Tuple[sympy.Basic, Optional[UnitKey]]:
+    "The shared copy of `units` and its canonical key, computed the first time it is seen"
+    entry = _unit_table.get(units)
+    if entry is None:
+        entry = _computed_unit_entry(units)
+    return entry
+
+
+def _intern_units(units: sympy.Basic) -> Any:
+    return _unit_entry(units)[0]
+
+
+def _unit_key(units: sympy.Basic) -> Optional[UnitKey]:
+    return _unit_entry(units)[1]
+
+
+def _canonical_unit_key(units: sympy.Basic) -> Optional[UnitKey]:
+    in_si = sympy.sympify(convert_to(units, _SI_BASE_UNITS))
+    scale, si_units = in_si.as_independent(su.Quantity, as_Add=False)
+
+    if not scale.is_number or si_units.atoms(su.Quantity) - set(_SI_BASE_UNITS):
+        return None
+
+    return scale, si_units
+
+
+def _units_hash_key(units: sympy.Basic) -> Any:
+    "What to hash units by; equivalent units (ie. N and kg*m/s**2) hash the same"
+    return _unit_key(units) or units
+
+
+def _conversion_factor(from_units: sympy.Basic, to_units: sympy.Basic) -> sympy.Expr:
+    "What to multiply a value in `from_units` by, to express it in `to_units`"
+    if from_units is to_units:
+        return sympy.S.One
+
+    from_key, to_key = _unit_key(from_units), _unit_key(to_units)
+    if from_key and to_key and from_key[1] == to_key[1]:
+        return from_key[0] / to_key[0]
+
+    return quantity_simplify(convert_to(from_units, to_units) / to_units)
+
+
+def _convert_units(from_units: sympy.Basic, to_units: sympy.Basic) -> Tuple[Any, Any]:
+    "The scale factor and units of `from_units`, converted to `to_units`"
+    from_key, to_key = _unit_key(from_units), _unit_key(to_units)
+    if from_key and to_key and from_key[1] == to_key[1]:
+        return _conversion_factor(from_units, to_units), to_units
+
+    return _split_coeff_and_units(convert_to(from_units, to_units))
+
 
-class Val:
+class Val(metaclass=_SlottedMeta):
     "An value with a set of units. For example 10 ohms or 20 meters / second**2"
 
+    # `dimension` is only stored per-instance when the class doesn't specify one (see Unit)
+    __slots__ = ("_expr", "units", "dimension", "_quantity_free", "_hash")
 
     def __init__(
         self,
         units: Union[su.Quantity, sympy.Expr],  # may also be a sympy expression of su.Quantities, ie su.meter**2
-        val: Union[sympy.Expr, sympy.Basic, Num] = 1,
+        val: Union[sympy.Expr, sympy.Basic, Num, LazyExpr] = 1,
     ):
     
         # clean up the case where you get units**1.0
         if isinstance(units, sympy.Pow) and units.exp == 1:
             units = units.base
 
-        self.expr: sympy.Expr = sympy.sympify(val)
-        self.units: su.Quantity = quantity_simplify(sympy.sympify(units))
+        self.expr = val if isinstance(val, LazyExpr) else sympy.sympify(val) # type: ignore
+        # whether self.expr is known to contain no su.Quantity, so quantity_simplify() can be skipped.
+        # tracked through arithmetic rather than checked, as checking means walking the whole expression
+        self._quantity_free = _is_quantity_free(self._expr)
+        self.units: su.Quantity = _intern_units(quantity_simplify(sympy.sympify(units)))
 
         units_dimension = _units2dimensional_expr(self.units) # type: ignore
 
@@ -59,10 +169,90 @@ class Val:
         
         else:
             # otherwise assign it to the dimensionality of the units provided
-            self.dimension = units_dimension
+            self.dimension = _intern(units_dimension)
+
+    @classmethod
+    def _precomputed(cls, units: sympy.Basic, key: Optional[UnitKey], dimension: Optional[sympy.Expr] = None) -> Self:
+        """
+        Construct a unit (with an expr of 1) from data precomputed by _generate_units_py.py; skipping the
+        simplification, unit conversion and dimension checks of __init__.
+
+        `dimension` is only needed if the class doesn't specify one (see Unit).
+        """
+        val = cls.__new__(cls)
+        val._expr = sympy.S.One
+        val.units = _unit_table.setdefault(units, (units, key))[0]
+        val._quantity_free = True
+
+        if dimension is not None:
+            val.dimension = _intern(dimension)
+
+        return val
+
+    @classmethod
+    def _new_unchecked(cls, units: sympy.Basic, expr: sympy.Basic) -> Self:
+        """
+        Construct a Val from units which are already simplified and interned (ie. those of another Val),
+        skipping the simplification and dimension checks of __init__
+        """
+        val = cls.__new__(cls)
+        val._expr = expr
+        val.units = units
+        val._quantity_free = _is_quantity_free(expr)
+
+        try:
+            val.dimension
+        except AttributeError:
+            # not specified by the class
+            val.dimension = _units_dimension(units)
+
+        return val
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # only the slots which are set; `dimension` is usually a class attribute (see Unit).
+        # the cached hash isn't portable between processes
+        state = {}
+        for slot in Val.__slots__:
+            if slot == "_hash":
+                continue
+            try:
+                state[slot] = getattr(Val, slot).__get__(self)
+            except AttributeError:
+                pass
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        for slot, value in state.items():
+            getattr(Val, slot).__set__(self, value)
+
+    @property
+    def expr(self) -> sympy.Expr:
+        expr = self._expr
+        if isinstance(expr, LazyExpr):
+            expr = expr.materialize()
+            if expr.has(su.Quantity):
+                # unit handling deferred by lazy arithmetic happens here, in a single pass
+                expr = quantity_simplify(expr)
+            self._expr = expr
+        return expr # type: ignore
+
+    @expr.setter
+    def expr(self, expr: Union[sympy.Expr, LazyExpr]):
+        self._expr = expr
+
+    def _operand(self) -> Union[sympy.Expr, LazyExpr]:
+        "The expr to build new expressions out of. In lazy mode, this defers building the sympy expression"
+        if _global_options.lazy:
+            return LazyExpr.wrap(self._expr)
+        return self.expr
 
     def __hash__(self):
-        return hash(self.expr)
+        # cached; Vals are immutable. Includes the units, so that ie. 5 meters and 5 seconds don't collide
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((self.expr, _units_hash_key(self.units)))
+            return self._hash
 
     @overload
     def __eq__(self, other: "Val") -> "Equation[Self]":
@@ -179,12 +369,19 @@ class Val:
             SumDimensionsMismatchError.check(self, ".in_units", units)
             new_units = units.units
 
-        units_factor, new_units = _split_coeff_and_units(
-            convert_to(self.units, new_units)  # type: ignore
-        )
+        if isinstance(units, Val):
+            # the factor may be irrational (ie. pi/180 for degrees -> radians), so isn't split off convert_to()'s result
+            units_factor = _conversion_factor(self.units, new_units)
+
+        else:
+            units_factor, new_units = _split_coeff_and_units(
+                convert_to(self.units, new_units)  # type: ignore
+            )
         new_val = units_factor * self.expr
 
-        return self.__class__(new_units, new_val)
+        res = self.__class__(new_units, new_val)
+        res._quantity_free = self._quantity_free
+        return res
 
     def re(self, units: 'ValT') -> 'ValT':
         """
@@ -214,7 +411,9 @@ class Val:
         return self._sum_op(other, lambda a, b: b - a, "-", True)
 
     def __neg__(self):
-        return self.__class__(self.units, -self.expr) # type: ignore
+        res = self.__class__(self.units, -self._operand()) # type: ignore
+        res._quantity_free = self._quantity_free
+        return res
 
     def __mul__(self, other: "Q[Val]") -> "Val":
         return self._prod_op(other, lambda a, b: a * b, is_pow=False)
@@ -282,7 +481,7 @@ class Val:
         
         other_expr = other.expr if isinstance(other, Val) else other
 
-        new_expr = self.expr if other_expr == 1 else self.expr ** other_expr
+        new_expr = self._operand() if other_expr == 1 else self._operand() ** other_expr
         new_units = self.units ** other_expr
 
         new_dims = _units2dimensional_expr(new_units)
@@ -300,6 +499,7 @@ class Val:
             # TODO: a big lookup table for dimensional expr -> Val subclass
             res = Val(new_units, new_expr)  # type: ignore
 
+        res._quantity_free = self._quantity_free and _is_quantity_free(other)
         return res
 
     def __rpow__(self, other: Num) -> "Dimensionless":
@@ -322,7 +522,7 @@ class Val:
         assert not isinstance(other, Vector)
 
         other_units, other_val = (
-            (other.units, other.expr) if isinstance(other, Val) else (self.units, other)
+            (other.units, other._operand()) if isinstance(other, Val) else (self.units, other)
         )
 
         if isinstance(other, Val):
@@ -330,24 +530,25 @@ class Val:
                 other if reverse else self, op_str, self if reverse else other
             )
 
-        other_units_rescale_factor = quantity_simplify(
-            convert_to(other_units, self.units) / self.units
-        )
+        other_units_rescale_factor = _conversion_factor(other_units, self.units)
 
         # choose the larger of the two input units as the output units
         use_other_units = other_units_rescale_factor > 1
         new_units = other_units if use_other_units else self.units
 
+        self_val = self._operand()
         self_val_rescaled = (
-            self.expr / other_units_rescale_factor if use_other_units else self.expr
+            self_val / other_units_rescale_factor if use_other_units else self_val
         )
         other_val_rescaled = (
-            other_val if use_other_units else other_val * other_units_rescale_factor
+            other_val if use_other_units or other_units_rescale_factor == 1
+            else other_val * other_units_rescale_factor
         )
 
         new_val = op(self_val_rescaled, other_val_rescaled)
 
         res = self.__class__(new_units, new_val)
+        res._quantity_free = self._quantity_free and _is_quantity_free(other)
 
         return res # type: ignore
 
@@ -367,15 +568,19 @@ class Val:
             return NotImplemented
 
         other_units, other_val = (
-            (other.units, other.expr)
+            (other.units, other._operand())
             if isinstance(other, Val)
             else (other if is_pow else 1, other)
         )
 
         rescale_factor, new_units = _split_coeff_and_units(op(self.units, other_units))
 
-        new_val = rescale_factor * op(self.expr, other_val)
-        if isinstance(new_val, sympy.Expr):
+        new_val = op(self._operand(), other_val)
+        if rescale_factor != 1:
+            new_val = rescale_factor * new_val
+
+        quantity_free = self._quantity_free and _is_quantity_free(other)
+        if isinstance(new_val, sympy.Expr) and not quantity_free:
             new_val = quantity_simplify(new_val)
 
         # _units2dimensional_expr doesn't handle exponent radians properly. Do it manually here:
@@ -399,6 +604,7 @@ class Val:
             # TODO: a big lookup table for dimensional expr -> Val subclass
             res = Val(new_units, new_val)  # type: ignore
 
+        res._quantity_free = quantity_free
         return res
 
 
@@ -413,6 +619,13 @@ class DimensionError(TypeError):
     
     @classmethod
     def check(cls, a: Val, b: Val):
+
+        if a.dimension is b.dimension:
+            return
+
+        a_key, b_key = _unit_key(a.units), _unit_key(b.units)
+        if a_key and b_key and a_key[1] == b_key[1]:
+            return
         
         if _is_dimensionless(a.dimension) and _is_dimensionless(b.dimension):
             # equivalent_dims() doesn't handle this case properly
@@ -432,6 +645,11 @@ class DimensionalExponentError(DimensionError):
             raise cls(f"Exponent must be dimensionless: {exponent.dimension}")
 
 
+# as for the unit functions above: these run for nearly every Val operation
+profile_when_active(DimensionError, "check", "dimension check")
+profile_when_active(DimensionalExponentError, "check", "dimension check")
+
+
 class SumDimensionsMismatchError(DimensionError):
     def __init__(
         self,
@@ -497,6 +715,21 @@ class Dimensionless(Unit):
     
 
 
+def _is_quantity_free(obj: Any) -> bool:
+    "Cheaply prove that obj contains no su.Quantity. False negatives are fine; they just cost a quantity_simplify()"
+    if isinstance(obj, Val):
+        return obj._quantity_free
+
+    if isinstance(obj, (int, float, complex, LazyExpr)):
+        # LazyExprs have quantities simplified once they are materialized
+        return True
+
+    return (
+        isinstance(obj, (sympy.Symbol, sympy.Number, sympy.NumberSymbol))
+        or (isinstance(obj, AppliedUndef) and all(arg.is_Symbol for arg in obj.args))
+    )
+
+
 def _is_dimensionless(dimension):
     from mathpad.core.dimensions import Angle, AngularMil, SteRadian
 
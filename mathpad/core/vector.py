@@ -1,21 +1,21 @@
 
-from typing import TYPE_CHECKING, Generic, Iterator, Optional, Sequence, TypeVar, Union, Any
+from typing import TYPE_CHECKING, Dict, Generic, Iterator, List, Optional, Sequence, TypeVar, Union, Any
 from typing_extensions import Self, Literal
 
 from sympy.physics.vector import vlatex
 from sympy.vector import Dot, Vector as SympyVector
-from sympy.physics.units.util import convert_to
 from sympy.physics.units.unitsystem import UnitSystem
 from sympy.tensor.array.array_derivatives import ArrayDerivative
-from sympy import Basic, MatrixSymbol, Matrix, MatrixExpr, Expr, Derivative, Function, Symbol
+from sympy import Add, Basic, MatrixBase, MatrixSymbol, Matrix, MatrixExpr, MutableDenseMatrix, Expr, Derivative, Function, Symbol, sqrt
 
-from mathpad.core.val import DimensionError, SumDimensionsMismatchError, Val, Q, _split_coeff_and_units
+from mathpad.core.val import DimensionError, SumDimensionsMismatchError, Val, Q, _convert_units, _units_hash_key
 from mathpad.core.vector_space import VectorSpace, VectorSpaceT, Homogeneous
 from mathpad.core.frame import Frame
 from mathpad.sympy_extensions import SymbolicMatrixFunction
 
 if TYPE_CHECKING:
     from mathpad.core.equation import Equation
+    from mathpad.maths.algebra import SubstitutionMap
 
 __all__ = ["Vector"]
 
@@ -23,6 +23,9 @@ class Vector(Generic[VectorSpaceT]):
     """
     A Vector is an instance of a VectorSpace
     """
+
+    # _elements caches the Vals of __getitem__, which are only constructed on demand
+    __slots__ = ("frame", "expr", "_hash", "_elements")
     
     def __init__(
         self,
@@ -56,9 +59,26 @@ class Vector(Generic[VectorSpaceT]):
             SumDimensionsMismatchError.check(a, "==", b) # type: ignore
 
         return Equation(self, other)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the cached hash isn't portable between processes, and the cached elements are rebuilt on demand
+        return {"frame": self.frame, "expr": self.expr}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        for slot, value in state.items():
+            setattr(self, slot, value)
     
     def __hash__(self):
-        return hash((str(self.expr), self.frame.space))
+        # cached; Vectors are immutable. Explicit vectors are mutable sympy Matrices, so hash their elements
+        try:
+            return self._hash
+        except AttributeError:
+            expr_hash = hash(tuple(self.expr)) if isinstance(self.expr, MutableDenseMatrix) else hash(self.expr)
+            self._hash = hash((
+                expr_hash,
+                tuple(_units_hash_key(unit.units) for unit in self.frame.space.base_units)
+            ))
+            return self._hash
     
     def __add__(self, other: 'Vector[VectorSpaceT]') -> 'Vector[VectorSpaceT]':
         "self + other"
@@ -107,9 +127,7 @@ class Vector(Generic[VectorSpaceT]):
             target_units = units
         
         scaling_factors, new_units = zip(*(
-            _split_coeff_and_units(
-                convert_to(self_unit.units, target_units.units)  # type: ignore
-            )
+            _convert_units(self_unit.units, target_units.units)  # type: ignore
             for self_unit, target_units in zip(self.frame.space.base_units, target_units)
         ))
 
@@ -146,9 +164,8 @@ class Vector(Generic[VectorSpaceT]):
             "\\begin{bmatrix}"
             + " \\\\ ".join(
                 # use vlatex because it applies dot notation where possible
-                f'{vlatex(el.expr).replace("- 1.0 ", "-")}'
-                    if isinstance(el, Val) else str(el)
-                for el in self
+                f'{vlatex(el).replace("- 1.0 ", "-")}'
+                for el in self._element_exprs()
             )
             + " \\end{bmatrix}"
         ) if isinstance(self.expr, Matrix) else vlatex(self.expr)
@@ -174,14 +191,30 @@ class Vector(Generic[VectorSpaceT]):
         return self.expr.shape[0] # type: ignore
     
     def __getitem__(self, index: int) -> Val:
-        unit = self.frame.space.base_units[index].units
-        # base_name = self.frame.space.base_names[index]
+        try:
+            elements = self._elements
+        except AttributeError:
+            elements = self._elements = [None] * len(self)
 
-        # expr: Basic = Symbol(f"{self.expr.name}_{base_name}") \
-        #     if getattr(self.expr, 'is_symbol', False) \
-        #     else self.expr[index] # type: ignore
-        
-        return Val(unit, self.expr[index]) # type: ignore
+        val = elements[index]
+        if val is None:
+            # base_name = self.frame.space.base_names[index]
+
+            # expr: Basic = Symbol(f"{self.expr.name}_{base_name}") \
+            #     if getattr(self.expr, 'is_symbol', False) \
+            #     else self.expr[index] # type: ignore
+
+            unit = self.frame.space.base_units[index].units
+            val = elements[index] = Val._new_unchecked(unit, self.expr[index]) # type: ignore
+
+        return val
+
+    def _element_exprs(self) -> List[Basic]:
+        "The sympy expression of each element, without constructing Vals"
+        if isinstance(self.expr, MatrixBase):
+            return list(self.expr)
+
+        return [self.expr[index] for index in range(len(self))] # type: ignore
     
     def __neg__(self) -> Self:
         return self.__class__(self.frame.space, -self.expr) # type: ignore
@@ -193,14 +226,12 @@ class Vector(Generic[VectorSpaceT]):
         Raises:
             ValueError: if the vector does not have uniform dimensionality (each base_unit in the vector space must be equivalent)
         """
-        from mathpad.maths.functions import sqrt
-
         assert len(set(self.frame.space.base_units)) == 1, "Cannot take the norm of a vector with non-uniform units"
 
         return Val(
             self.frame.space.base_units[0].units,
             self.expr.norm() if isinstance(self.expr, MatrixSymbol) \
-                else sqrt(sum(el ** 2 for el in self)).expr
+                else sqrt(Add(*(el ** 2 for el in self._element_exprs())))
         )
     
     def __mul__(self, other: Q[Val]):
@@ -239,6 +270,23 @@ class Vector(Generic[VectorSpaceT]):
     def eval(self, precision: int = 6):
         "Return a new Vec with consts evaluated to their floating point equivalent with given precision"
         return self.__class__(self.frame.space, self.expr.evalf(precision))
+
+    def to_numpy(self, subs: "SubstitutionMap" = {}, *, with_units: bool = False) -> Any:
+        """
+        Evaluate all elements at once to a numpy array of shape (..., n), in the units of the frame.
+
+        Values in `subs` may be arrays, which are broadcast together to give the leading (batch) dimensions:
+
+        >>> O = R2("O") * m
+        >>> O[x, 2 * x].to_numpy({x: [1, 2, 3]}).shape
+        (3, 2)
+
+        If `with_units`, return a tuple of the array and the units of each element (`frame.space.base_units`).
+        """
+        from mathpad.codegen import _evaluate_matrix
+
+        array = _evaluate_matrix(self.expr, subs)[..., 0]
+        return (array, self.frame.space.base_units) if with_units else array
     
     # TODO: extend this to higher dimensions and other bases somehow
     # PS: technically cross product is only defined for 3D and 7D, but the concept of orthogonal basis vectors is more general
@@ -275,12 +323,10 @@ class Vector(Generic[VectorSpaceT]):
             self.frame.space.base_units[0] * other.frame.space.base_units[0]
         ).units
 
-        self_val_matrix = self.expr if isinstance(self.expr, Matrix) else Matrix(self.expr)
-        other_val_matrix = other.expr if isinstance(other.expr, Matrix) else Matrix(other.expr)
-
+        # matrix expressions (ie. MatrixSymbols) are kept as-is, and only made explicit by Dot.doit()
         return Val(
             out_units,
-            self.Dot(self_val_matrix, other_val_matrix)
+            self.Dot(self.expr, other.expr)
         )
     
     def __getattr__(self, name: str) -> Val:
@@ -300,6 +346,10 @@ class Vector(Generic[VectorSpaceT]):
 
         """
 
+        if name.startswith("_"):
+            # ie. copy/pickle probing for __setstate__ before self.frame exists
+            raise AttributeError(name)
+
         if name in self.frame.space.base_names:
             idx = self.frame.space.base_names.index(name)
             return self[idx]
@@ -312,9 +362,12 @@ class Vector(Generic[VectorSpaceT]):
     
     def homogeneous(self, name: Optional[str] = None) -> 'Vector[Homogeneous[VectorSpaceT]]':
         "Return a new vector with an extra dimension of 1"
+        frame = self.frame.homogeneous() if name is None \
+            else Frame(self.frame.space.homogeneous(name), self.frame.name)
+
         return Vector(
-            Frame(self.frame.space.homogeneous(name), f"self.frame.name", wrt=None),
-            self.expr.row_insert(len(self.frame.space), Matrix([1])) # type: ignore
+            frame,
+            Matrix(self._element_exprs()).row_insert(len(self.frame.space), Matrix([1])) # type: ignore
         )
         
     class Cross(SympyVector):
@@ -340,7 +393,11 @@ class Vector(Generic[VectorSpaceT]):
         """
 
         def doit(self, **hints):
-            return self._expr1.dot(self._expr2, **hints) # type: ignore
+            expr1, expr2 = (
+                expr if isinstance(expr, MatrixBase) else expr.as_explicit()
+                for expr in (self._expr1, self._expr2) # type: ignore
+            )
+            return expr1.dot(expr2, **hints)
 
 
 
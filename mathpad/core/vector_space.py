@@ -1,6 +1,8 @@
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
+    Dict,
     Optional,
     Union,
     Tuple,
@@ -36,6 +38,9 @@ class VectorSpace(Generic[Unpack[BaseUnits]]):
     Cannot be used directly; must be subclassed first.
 
     """
+
+    # spaces derived by multiplying & dividing by Vals, by (op, units); see _derived_space()
+    _derived_spaces: "Dict[Tuple[str, Any], VectorSpace]"
     
     # # these must be specified by subclasses, or by a direct instantiation of VectorSpace
     base_units: Tuple[Unpack[BaseUnits]] # must be a tuple of Val
@@ -134,37 +139,57 @@ class VectorSpace(Generic[Unpack[BaseUnits]]):
             tuple(op(a, b) for a, b in zip(a_units, b_units))
         )
     
+    def _derived_space(self, op: str, other: Val, derive: Callable[[], Self]) -> Self:
+        """
+        The space `derive()`d from this one by an operation with `other`, computed once per (op, units).
+        Repeatedly scaling or differentiating vectors then gives the very same space, rather than a new
+        (equal, but not identical) one each time, so identity checks hold across derived spaces.
+        """
+        if not isinstance(other, Val):
+            return derive()
+
+        try:
+            derived = self._derived_spaces
+        except AttributeError:
+            derived = self._derived_spaces = {}
+
+        key = op, other.units
+        space = derived.get(key)
+        if space is None:
+            space = derived[key] = derive()
+        return space
+
     def __truediv__(self, other: Val) -> Self:
-        return VectorSpace._get_output_space(
+        return self._derived_space("/", other, lambda: VectorSpace._get_output_space(
             self,
             other,
             lambda a, b: a / b,
             self.name
-        )
+        ))
     
     def __rtruediv__(self, other: Val) -> Self:
-        return VectorSpace._get_output_space(
+        return self._derived_space("r/", other, lambda: VectorSpace._get_output_space(
             other,
             self,
             lambda a, b: a / b,
             self.name
-        )
+        ))
     
     def __mul__(self, other: Val) -> Self:
-        return VectorSpace._get_output_space(
+        return self._derived_space("*", other, lambda: VectorSpace._get_output_space(
             self,
             other,
             lambda a, b: a * b,
             self.name
-        )
+        ))
 
     def __rmul__(self, other: Val) -> Self:
-        return self._get_output_space(
+        return self._derived_space("r*", other, lambda: self._get_output_space(
             other,
             self,
             lambda a, b: a * b,
             self.name
-        )
+        ))
     
     def __eq__(self, other: Self) -> bool:
         return self.name == other.name \
@@ -187,16 +212,14 @@ class Homogeneous(VectorSpace[Unpack[BaseUnits], Dimensionless], Generic[VectorS
     """
 
 
-    def __init__(self, space: VectorSpaceT, name: Optional[str] = None):
+    def __new__(cls, space: VectorSpaceT, name: Optional[str] = None):
+        # unlike other VectorSpaces (see VectorSpace.__new__), constructs the space itself rather than a Frame
+        return object.__new__(cls)
 
-        base_units: Tuple[Unpack[BaseUnits], Dimensionless] \
-            = (*space.base_units, Dimensionless(1, 1)) # type: ignore [assignment]
-            
-        super().__init__(
-            name or f"Homogeneous[{space.name}]",
-            (*space.base_names, "w"),
-            base_units
-        )
+    def __init__(self, space: VectorSpaceT, name: Optional[str] = None):
+        self.name = name or f"Homogeneous[{space.name}]"
+        self.base_names = (*space.base_names, "w")
+        self.base_units = (*space.base_units, Dimensionless(1, 1)) # type: ignore [assignment]
         self.og_space = space
 
 class R3(VectorSpace[Dimensionless, Dimensionless, Dimensionless]):
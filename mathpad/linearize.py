@@ -0,0 +1,258 @@
+from typing import TYPE_CHECKING, Any, Collection, Dict, List, Optional, Sequence
+
+import sympy
+
+from mathpad.core.val import Val
+from mathpad.core.equation import Equation
+from mathpad.core.common_vals import t
+from mathpad.maths.algebra import Substitution, SubstitutionMap, SimplifyStrategy, simplify
+from mathpad.maths.calculus import diff
+from mathpad.maths.budget import run_with_budget
+from mathpad._global_options import _global_options
+from mathpad._profiling import profiled
+from mathpad._dynamics import collect_derivatives, derivative, state_vector
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+__all__ = ["linearize", "Linearization", "StateSpace"]
+
+
+class StateSpace:
+    """
+    Numeric state-space matrices of a system linearised about an operating point:
+
+        d(states)/dt = A @ states + B @ inputs
+             outputs = C @ states + D @ inputs
+
+    where states, inputs and outputs are deviations from the operating point.
+
+    Units: A[i, j] is in units of `state_units[i] / x_axis_units / state_units[j]`,
+    B[i, j] in `state_units[i] / x_axis_units / input_units[j]`,
+    C[i, j] in `output_units[i] / state_units[j]` and D[i, j] in `output_units[i] / input_units[j]`.
+
+    If the operating point was given as arrays, every matrix has the same leading (batch) dimensions.
+    """
+
+    def __init__(
+        self,
+        A: "NDArray[Any]",
+        B: "NDArray[Any]",
+        C: "NDArray[Any]",
+        D: "NDArray[Any]",
+        *,
+        states: List[Val],
+        inputs: List[Val],
+        outputs: List[Val],
+        x_axis: Val
+    ):
+        self.A = A
+        self.B = B
+        self.C = C
+        self.D = D
+        self.states = states
+        self.inputs = inputs
+        self.outputs = outputs
+        self.x_axis = x_axis
+
+    @property
+    def state_units(self) -> List[Any]:
+        return [state.units for state in self.states]
+
+    @property
+    def input_units(self) -> List[Any]:
+        return [inp.units for inp in self.inputs]
+
+    @property
+    def output_units(self) -> List[Any]:
+        return [output.units for output in self.outputs]
+
+    @property
+    def x_axis_units(self) -> Any:
+        return self.x_axis.units
+
+    def __repr__(self) -> str:
+        return (
+            f"StateSpace(states={[str(state.expr) for state in self.states]}, "
+            f"inputs={[str(inp.expr) for inp in self.inputs]}, "
+            f"outputs={[str(output.expr) for output in self.outputs]})"
+        )
+
+
+class Linearization:
+    """
+    The symbolic linearisation of a dynamic system, compiled for cheap evaluation at many operating points.
+
+    Works out the state vector and solves for the highest derivatives the same way `simulate_dynamic_system` does,
+    then takes the jacobians of the state derivatives (and outputs) wrt. the states and inputs once.
+
+    Arguments:
+
+        dynamics_equations: the equations of motion
+
+        states: the generalised coordinates (ie. [x, theta]). The state vector consists of these
+            and their derivatives up to (but excluding) the highest, ie [x, theta, dx, dtheta]
+
+        inputs: the inputs to the system (ie. "F(t)" * N)
+
+        outputs: values to measure, as functions of the states and inputs. Defaults to the state vector
+
+        substitute: values to substitute into the equations (and outputs) before linearising
+
+        simplify_strategy: see `simplify()`. Defaults to the `simplify_strategy` global option
+
+    Example:
+        >>> lin = Linearization([theta_dynamics], states=[theta], inputs=[tau], substitute={m: 1, l: 0.5, g: 9.81})
+        >>> lin.at({theta: 0, diff(theta): 0, tau: 0}).A
+        array([[  0.  ,   1.  ],
+               [-19.62,   0.  ]])
+    """
+
+    def __init__(
+        self,
+        dynamics_equations: Collection[Equation],
+        states: Sequence[Val],
+        inputs: Sequence[Val] = (),
+        *,
+        outputs: Optional[Sequence[Val]] = None,
+        substitute: SubstitutionMap = {},
+        x_axis: Val = t,
+        simplify_strategy: Optional[SimplifyStrategy] = None,
+        solve_timeout: Optional[float] = None,
+        simplify_timeout: Optional[float] = None,
+    ):
+        substitution = Substitution(substitute)
+
+        problem_eqns = [
+            simplify(eqn, strategy=simplify_strategy, timeout=simplify_timeout)
+            for eqn in substitution(dynamics_equations)
+        ]
+        sympy_eqns = [eqn.as_sympy_eq() for eqn in problem_eqns]
+
+        highest_derivatives, lowest_derivatives = collect_derivatives(sympy_eqns)
+
+        coordinate_fns = [state.expr for state in states]
+        for coordinate, fn in zip(states, coordinate_fns):
+            assert fn in highest_derivatives, f"State {coordinate} does not appear in the dynamics equations"
+            assert highest_derivatives[fn] > lowest_derivatives[fn], \
+                f"State {coordinate} is never differentiated wrt. {x_axis} in the dynamics equations"
+
+        state_exprs = state_vector(coordinate_fns, lowest_derivatives, highest_derivatives, x_axis.expr)
+
+        # keep the Vals around for their units
+        state_vals_by_expr = {
+            deriv.expr: deriv
+            for coordinate in states
+            for lvl in range(highest_derivatives[coordinate.expr])
+            for deriv in [diff(coordinate, lvl, wrt=x_axis) if lvl else coordinate]
+        }
+        self.states: List[Val] = [state_vals_by_expr[expr] for expr in state_exprs]
+        self.inputs: List[Val] = list(inputs)
+        self.outputs: List[Val] = substitution(list(outputs)) if outputs is not None else self.states
+        self.x_axis = x_axis
+
+        with profiled("sympy solve"):
+            solutions = run_with_budget(
+                lambda: sympy.solve(
+                    sympy_eqns,
+                    [derivative(fn, highest_derivatives[fn], x_axis.expr) for fn in coordinate_fns],
+                    dict=True
+                ),
+                solve_timeout if solve_timeout is not None else _global_options.solve_timeout,
+                "linearize solve",
+                partial=problem_eqns
+            )
+        assert any(solutions), "No Solution Found"
+        solution = solutions[0]
+
+        # the derivative of each state is either the next state along, or one of the solved highest derivatives
+        dstate_exprs = [
+            solution.get(next_deriv, next_deriv)
+            for next_deriv in (sympy.diff(expr, x_axis.expr) for expr in state_exprs)
+        ]
+
+        # replace states & inputs with plain symbols, to differentiate wrt. & lambdify
+        state_syms = [sympy.Dummy(f"x_{idx}") for idx in range(len(state_exprs))]
+        input_syms = [sympy.Dummy(f"u_{idx}") for idx in range(len(self.inputs))]
+        to_syms: Dict[sympy.Basic, sympy.Basic] = {
+            **dict(zip(state_exprs, state_syms)),
+            **{inp.expr: sym for inp, sym in zip(self.inputs, input_syms)}
+        }
+
+        dstate = sympy.Matrix(dstate_exprs).xreplace(to_syms)
+        measured = sympy.Matrix([output.expr for output in self.outputs]).xreplace(to_syms)
+
+        state_vec = sympy.Matrix(state_syms)
+        input_vec = sympy.Matrix(input_syms)
+
+        jacobians = {
+            "A": dstate.jacobian(state_vec),
+            "B": dstate.jacobian(input_vec) if input_syms else sympy.zeros(len(state_syms), 0),
+            "C": measured.jacobian(state_vec),
+            "D": measured.jacobian(input_vec) if input_syms else sympy.zeros(len(self.outputs), 0),
+        }
+
+        known = {*state_syms, *input_syms, x_axis.expr}
+        unknowns = {
+            atom
+            for jac in jacobians.values()
+            for atom in jac.atoms(sympy.Symbol, sympy.core.function.AppliedUndef, sympy.Derivative)
+        } - known
+        assert not unknowns, \
+            f"Cannot linearise in the presence of unknowns: {unknowns}. Please include them in states, inputs or substitutions"
+
+        # compile once; evaluating at an operating point is then just numpy
+        from mathpad.codegen import _lambdify_matrix
+
+        args = [x_axis.expr, *state_syms, *input_syms]
+        self._compiled = {
+            name: _lambdify_matrix(args, jac)
+            for name, jac in jacobians.items()
+        }
+        self.jacobians = jacobians
+
+    def at(self, operating_point: SubstitutionMap) -> StateSpace:
+        """
+        Evaluate the state-space matrices at an operating point.
+
+        `operating_point` must give a value for every state and input (and may give one for the x_axis; default 0).
+        Values may be arrays, to evaluate a batch of operating points in one vectorised call.
+        """
+        import numpy as np
+
+        values_by_expr: Dict[sympy.Basic, Any] = {}
+        for key, value in operating_point.items():
+            if isinstance(value, Val):
+                value = float(value.in_units(key).expr)
+            values_by_expr[key.expr] = value
+
+        args: List[Any] = [np.asarray(values_by_expr.get(self.x_axis.expr, 0), dtype=float)]
+        for val in (*self.states, *self.inputs):
+            assert val.expr in values_by_expr, f"operating_point is missing a value for {val}"
+            args.append(np.asarray(values_by_expr[val.expr], dtype=float))
+
+        A, B, C, D = (self._compiled[name](*args) for name in "ABCD")
+
+        return StateSpace(
+            A, B, C, D,
+            states=self.states,
+            inputs=self.inputs,
+            outputs=self.outputs,
+            x_axis=self.x_axis
+        )
+
+
+def linearize(
+    dynamics_equations: Collection[Equation],
+    states: Sequence[Val],
+    inputs: Sequence[Val],
+    operating_point: SubstitutionMap,
+    **options: Any
+) -> StateSpace:
+    """
+    Linearise dynamics equations about an operating point, into numeric state-space matrices (A, B, C, D).
+
+    See `Linearization` for the available options. To evaluate at many operating points,
+    construct a `Linearization` once and call `.at()` for each (or pass arrays of operating points).
+    """
+    return Linearization(dynamics_equations, states, inputs, **options).at(operating_point)
@@ -1,6 +1,7 @@
 from .solve import solve, Solution
 from ..core.common_vals import t, pi, i, e, dimensionless
-from .algebra import subs, simplify, factor, expand
+from .algebra import subs, Substitution, simplify, factor, expand
 from .functions import piecewise, sqrt, log
-from .calculus import diff, integral
+from .calculus import diff, integral, jacobian, hessian
 from .trigonometry import cos, sin, tan
+from .budget import BudgetExceededError
@@ -1,45 +1,132 @@
-from typing import ItemsView, KeysView, TypeVar, Union, ValuesView, overload
-from typing_extensions import Protocol
+import time
+from typing import Any, Dict, ItemsView, Iterable, KeysView, List, Optional, TypeVar, Union, ValuesView, overload
+from typing_extensions import Literal, Protocol
 
 import sympy
 
-from mathpad.core import Q, ValT, Val, Vector, VecT, Equation, EquationT
+from mathpad.core import Q, ValT, Val, Vector, VecT, Matrix, Equation, EquationT
+from mathpad.maths.budget import BudgetExceededError, run_with_budget
+from mathpad._global_options import _global_options
+from mathpad._profiling import profiled
+
+
+SimplifyStrategy = Literal["fast", "medium", "full"]
 
 
 @overload
-def simplify(obj: ValT) -> ValT:
+def simplify(obj: ValT, *, strategy: Optional[SimplifyStrategy] = None, timeout: Optional[float] = None) -> ValT:
     ...
 
 @overload
-def simplify(obj: EquationT) -> EquationT:
+def simplify(obj: EquationT, *, strategy: Optional[SimplifyStrategy] = None, timeout: Optional[float] = None) -> EquationT:
     ...
 
 @overload
-def simplify(obj: VecT) -> VecT:
+def simplify(obj: VecT, *, strategy: Optional[SimplifyStrategy] = None, timeout: Optional[float] = None) -> VecT:
     ...
 
-def simplify(obj: Union[ValT, EquationT, VecT]) -> Union[ValT, EquationT, VecT]:
+@profiled("simplify")
+def simplify(
+    obj: Union[ValT, EquationT, VecT],
+    *,
+    strategy: Optional[SimplifyStrategy] = None,
+    timeout: Optional[float] = None
+) -> Union[ValT, EquationT, VecT]:
+    """
+    Simplify the expression(s) of a Val, Vector or Equation.
+
+    Arguments:
+
+        strategy: how hard to try. Defaults to the `simplify_strategy` global option, or "full" if that is unset.
+            - "fast": put rational functions over a common denominator and cancel (`together` + `cancel`)
+            - "medium": "fast", followed by `trigsimp`
+            - "full": `sympy.simplify`. Slowest, but tries every trick it knows.
+
+        timeout: if simplification takes longer than this many seconds, fall back to the "fast" strategy
+            (or, for the "fast" strategy itself, leave the expression as it is).
+            The budget is shared by all the elements of a Vector, Matrix or Equation.
+            Defaults to the `simplify_timeout` global option (unbounded unless set).
+            Simplification is only interrupted when called from the main thread on platforms with SIGALRM.
+            Otherwise the abandoned simplification keeps running (and using CPU) in a background thread.
+    """
+    if strategy is None:
+        strategy = _global_options.simplify_strategy or "full"
+
+    if timeout is None:
+        timeout = _global_options.simplify_timeout
+
+    assert strategy in _SIMPLIFIERS, \
+        f"Unknown simplify strategy '{strategy}'. Expected one of {list(_SIMPLIFIERS)}"
+
+    deadline = None if timeout is None else time.perf_counter() + timeout
+    return _simplify(obj, strategy, deadline)
+
+
+def _simplify(obj: Any, strategy: SimplifyStrategy, deadline: Optional[float]) -> Any:
     if isinstance(obj, Equation):
         # TODO: simplification that actually makes use of equality
 
         return Equation(
-            simplify(obj.lhs),
-            simplify(obj.rhs)
+            _simplify(obj.lhs, strategy, deadline),
+            _simplify(obj.rhs, strategy, deadline)
         )
     
     elif isinstance(obj, Vector):
         return obj.__class__(
             obj.frame,
-            sympy.simplify(obj.expr) # type: ignore
+            _simplify_expr(obj.expr, strategy, deadline) # type: ignore
         )
 
     else:
         return obj.__class__(
             obj.units,
-            sympy.simplify(obj.expr)
+            _simplify_expr(obj.expr, strategy, deadline)
         )
 
 
+def _simplify_fast(expr: sympy.Basic) -> sympy.Basic:
+    return sympy.cancel(sympy.together(expr))
+
+
+def _simplify_medium(expr: sympy.Basic) -> sympy.Basic:
+    return sympy.trigsimp(_simplify_fast(expr))
+
+
+_SIMPLIFIERS = {
+    "fast": _simplify_fast,
+    "medium": _simplify_medium,
+    "full": sympy.simplify,
+}
+
+
+def _simplify_expr(expr: sympy.Basic, strategy: SimplifyStrategy, deadline: Optional[float]) -> sympy.Basic:
+    simplifier = _SIMPLIFIERS[strategy]
+
+    if isinstance(expr, sympy.MatrixBase) and strategy != "full":
+        # sympy.simplify() understands explicit matrices, the others must be applied element-wise
+        return expr.applyfunc(lambda el: _simplify_expr(el, strategy, deadline))
+
+    if isinstance(expr, sympy.MatrixExpr) and strategy != "full":
+        # nothing to gain for symbolic matrices
+        return expr
+
+    timeout = None if deadline is None else deadline - time.perf_counter()
+
+    # the budget may already have been spent on other elements
+    if timeout is None or timeout > 0:
+        try:
+            return run_with_budget(lambda: simplifier(expr), timeout, "simplify")
+        except BudgetExceededError:
+            pass
+
+    if strategy == "fast":
+        # there's nothing cheaper to fall back to
+        return expr
+
+    # "fast" is predictable, so is never given a budget
+    return _simplify_expr(expr, "fast", None)
+
+
 @overload
 def factor(obj: ValT) -> ValT:
     ...
@@ -126,6 +213,96 @@ class SubstitutionMap(Protocol[VecOrVal, VecOrValQ]):
     def values(self) -> ValuesView[VecOrValQ]: ...
 
 
+class Substitution:
+    """
+    A substitution map prepared once, to be applied to many Vals, Vectors and Equations.
+
+    Each replacement is converted into the units of the value it replaces up front,
+    rather than on every application like `subs()`.
+
+    Example:
+        >>> params = Substitution({m: 1, g: 9.81, l: 0.5})
+        >>> theta_dynamics, phi_dynamics = params([theta_dynamics, phi_dynamics])
+    """
+
+    def __init__(self, substitutions: SubstitutionMap):
+        self.substitutions = substitutions
+        self.sympy_subsmap: Dict[sympy.Basic, sympy.Basic] = {}
+
+        for from_, to in substitutions.items():
+            if isinstance(from_, Vector):
+                assert isinstance(to, Vector), f"Vectors can only be substituted with Vectors. Got {from_} -> {to}"
+                self.sympy_subsmap[from_.expr] = to.in_units(from_.frame.space.base_units).expr
+
+            else:
+                if not isinstance(to, Val):
+                    to = from_.__class__(from_.units, to)
+
+                self.sympy_subsmap[from_.expr] = to.in_units(from_).expr
+
+        # xreplace() only swaps out exact matches, which is equivalent to (and much faster than) subs()
+        # when the keys are plain symbols; unless they appear as a variable of a derivative or integral
+        self._use_xreplace = all(isinstance(sym, sympy.Symbol) for sym in self.sympy_subsmap)
+
+    @overload
+    def __call__(self, obj: ValT) -> ValT:
+        ...
+
+    @overload
+    def __call__(self, obj: EquationT) -> EquationT:
+        ...
+
+    @overload
+    def __call__(self, obj: VecT) -> VecT:
+        ...
+
+    @overload
+    def __call__(self, obj: Iterable[Union[Val, Equation, Vector]]) -> List[Any]:
+        ...
+
+    @profiled("subs")
+    def __call__(
+        self,
+        obj: Union[ValT, EquationT, VecT, Iterable[Union[Val, Equation, Vector]]]
+    ) -> Union[ValT, EquationT, VecT, List[Any]]:
+        "Apply the substitution to a Val, Vector, Equation or a collection of them"
+
+        if isinstance(obj, Equation):
+            # substitution doesn't change units, so the sides are still consistent
+            return Equation._new_unchecked( # type: ignore
+                self(obj.lhs),
+                self(obj.rhs),
+                obj.units
+            )
+
+        elif isinstance(obj, Vector):
+            return obj.__class__(obj.frame, self._replace(obj.expr)) # type: ignore
+
+        elif isinstance(obj, Val):
+            return obj.__class__(obj.units, self._replace(obj.expr))
+
+        elif isinstance(obj, Matrix):
+            return Matrix(self._replace(obj.expr), type=(obj.left_frame, obj.right_frame)) # type: ignore
+
+        else:
+            return [self(o) for o in obj]
+
+    def _replace(self, expr: sympy.Basic) -> sympy.Basic:
+        if self._use_xreplace and not expr.has(sympy.Derivative, sympy.Integral, sympy.Subs):
+            return expr.xreplace(self.sympy_subsmap)
+
+        return expr.subs(self.sympy_subsmap)
+
+    def keys(self):
+        return self.substitutions.keys()
+
+    def items(self):
+        return self.substitutions.items()
+
+    def values(self):
+        return self.substitutions.values()
+
+
 @overload
 def subs(obj: ValT, substitutions: SubstitutionMap) -> ValT:
     ...
@@ -141,24 +318,14 @@ def subs(obj: VecT, substitutions: SubstitutionMap) -> VecT:
 
 def subs(
     obj: Union[ValT, Equation, VecT],
-    substitutions: SubstitutionMap,
+    substitutions: Union[SubstitutionMap, Substitution],
 ) -> Union[ValT, Equation, VecT]:
-    if isinstance(obj, Equation):
-        return Equation(
-            subs(obj.lhs, substitutions),
-            subs(obj.rhs, substitutions),
-        )
-
-    else:
-        sympy_subsmap = {}
+    """
+    Substitute values into a Val, Vector or Equation.
 
-        for from_, to in substitutions.items():
-            if not isinstance(to, (Val, Vector)):
-                to = from_.__class__(from_.units, to)
+    When substituting the same map into many objects, prepare a `Substitution` once instead.
+    """
+    if not isinstance(substitutions, Substitution):
+        substitutions = Substitution(substitutions)
 
-            sympy_subsmap[from_.expr] = to.in_units(from_ if isinstance(from_, Val) else from_.space).expr
-
-        return obj.__class__(
-            obj.units if isinstance(obj, Val) else obj.frame,
-            obj.expr.subs(sympy_subsmap) # type: ignore
-        )
+    return substitutions(obj)
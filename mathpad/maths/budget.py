@@ -0,0 +1,101 @@
+import signal
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+__all__ = ["BudgetExceededError", "run_with_budget"]
+
+T = TypeVar("T")
+
+# how often the alarm is re-raised after the budget has expired.
+# sympy swallows exceptions in a few places (`except Exception: pass`), so a single alarm may get lost.
+_REARM_INTERVAL = 0.05
+
+
+class BudgetExceededError(TimeoutError):
+    """
+    Raised when a symbolic operation runs over its wall-clock budget.
+
+    `partial` carries whatever progress was made before the budget ran out
+    (ie. the prepared equations), so that callers can retry with a cheaper strategy.
+    """
+
+    def __init__(self, msg: str, partial: Any = None):
+        super().__init__(msg)
+        self.partial = partial
+
+
+def run_with_budget(
+    fn: Callable[[], T],
+    timeout: Optional[float],
+    description: str = "operation",
+    partial: Any = None,
+) -> T:
+    """
+    Call `fn()`, raising BudgetExceededError if it takes longer than `timeout` seconds.
+
+    On platforms with SIGALRM, and when called from the main thread, `fn` is interrupted.
+    Otherwise `fn` runs in a daemon thread which is abandoned (not killed) once the budget expires,
+    so it keeps using CPU until it finishes by itself.
+    """
+    if timeout is None:
+        return fn()
+
+    assert timeout > 0, f"timeout must be positive. Got {timeout}"
+
+    if hasattr(signal, "SIGALRM") and threading.current_thread() is threading.main_thread():
+        return _run_with_alarm(fn, timeout, description, partial)
+
+    return _run_in_thread(fn, timeout, description, partial)
+
+
+def _run_with_alarm(fn: Callable[[], T], timeout: float, description: str, partial: Any) -> T:
+    active = True
+
+    def on_alarm(_signum, _frame):
+        if active:
+            raise BudgetExceededError(f"{description} exceeded its budget of {timeout}s", partial)
+
+    outer_remaining, outer_interval = signal.getitimer(signal.ITIMER_REAL)
+    if outer_remaining and outer_remaining <= timeout:
+        # an enclosing budget expires first and will interrupt fn() by itself
+        return fn()
+
+    outer_handler = signal.signal(signal.SIGALRM, on_alarm)
+    start = time.perf_counter()
+    signal.setitimer(signal.ITIMER_REAL, timeout, _REARM_INTERVAL)
+
+    try:
+        return fn()
+    finally:
+        active = False
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, outer_handler)
+
+        if outer_remaining:
+            # resume the enclosing budget, minus the time spent here
+            elapsed = time.perf_counter() - start
+            signal.setitimer(signal.ITIMER_REAL, max(outer_remaining - elapsed, 1e-3), outer_interval)
+
+
+def _run_in_thread(fn: Callable[[], T], timeout: float, description: str, partial: Any) -> T:
+    result = []
+    error = []
+
+    def target():
+        try:
+            result.append(fn())
+        except BaseException as e:
+            error.append(e)
+
+    worker = threading.Thread(target=target, daemon=True, name=f"mathpad-budget-{description}")
+    worker.start()
+    worker.join(timeout)
+
+    if worker.is_alive():
+        raise BudgetExceededError(f"{description} exceeded its budget of {timeout}s", partial)
+
+    if error:
+        raise error[0]
+
+    return result[0]
@@ -1,4 +1,5 @@
-from typing import Optional, Tuple, Union, overload
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple, Union, overload
 
 import sympy
 from sympy.physics.units import Quantity
@@ -9,6 +10,9 @@ from mathpad.core import t
 # from mathpad.global_options import _global_options
 from mathpad.core.vector_space import VectorSpaceT
 from mathpad.core.vector import Vector
+from mathpad.core.frame import Frame
+from mathpad.core.matrix import Matrix, _unit_grid
+from mathpad.core.common_vals import dimensionless
 
 
 
@@ -21,18 +25,30 @@ def diff(val: Vector[VectorSpaceT], order: int = 1, *, wrt: Val = t) -> Vector[V
 def diff(
     val: Union[Q[Val], Vector[VectorSpaceT]], order: int = 1, *, wrt: Val = t
 ) -> Union[Val, Vector[VectorSpaceT]]:
+    """
+    Differentiate a value or vector `order` times with respect to a symbolic Val.
+
+    Results are memoized per (expression, wrt, order), so repeatedly taking the same
+    derivative (as in euler_lagrange()) is cheap.
+    """
     # TODO: support partial derivatives by passing in a Vec for wrt
 
     if isinstance(val, Vector):
-        out_frame = val.frame / wrt
-        vals = list(val)
+        out_frame = val.frame
+        for _ in range(order):
+            out_frame = out_frame / wrt
 
         if getattr(val.expr, 'is_symbol', False):
             return Vector(out_frame, val.expr.diff((wrt.expr, order)))
-        
-        return Vector(out_frame, [
-            diff(val, wrt=wrt) for val in vals
-        ])
+
+        # differentiate all elements in one pass rather than one Val at a time
+        explicit = val.expr if isinstance(val.expr, sympy.MatrixBase) \
+            else sympy.Matrix([val.expr[idx] for idx in range(len(val))]) # type: ignore
+
+        return Vector(
+            out_frame,
+            sympy.Matrix(_diff_expr(sympy.ImmutableMatrix(explicit), wrt.expr, order))
+        )
 
     val_units = val.units if isinstance(val, Val) else val
     val_val: sympy.Expr = val.expr if isinstance(val, Val) else sympy.sympify(val)
@@ -43,11 +59,122 @@ def diff(
 
     res = Val(
         new_units, # type: ignore
-        val_val.diff((wrt.expr, order))  # type: ignore
+        _diff_expr(val_val, wrt.expr, order)  # type: ignore
     )
 
     return res
 
+
+def jacobian(
+    f: Vector[Any],
+    *,
+    wrt: Vector[Any],
+    as_numpy: bool = False
+) -> Union[Matrix[Any, Any], Callable[..., Any]]:
+    """
+    The matrix of first-order partial derivatives J[i, j] = d f[i] / d wrt[j].
+
+    Each element J[i, j] has the units of f[i] / wrt[j], from the base units of their frames.
+    Under the Matrix[L, R] convention (element units are R[j] / L[i]),
+    J is typed as Matrix[1 / f.frame, 1 / wrt.frame].
+
+    If `as_numpy` is True, return a compiled numpy function (see `codegen.as_numpy_func`) instead.
+
+    Example:
+        >>> J = jacobian(O[x * y, x + y], wrt=O[x, y])
+    """
+    f_expr = _as_explicit(f.expr)
+    wrt_expr = _as_explicit(wrt.expr)
+    assert wrt_expr.shape[1] == 1, f"wrt must be a vector. Got shape {wrt_expr.shape}"
+
+    wrt_units = wrt.frame.space.base_units
+    type = dimensionless / f.frame, dimensionless / wrt.frame
+
+    # a single call into sympy, rather than a diff() per element
+    J = Matrix(
+        _in_element_units(
+            f_expr.jacobian(wrt_expr),
+            [[f_i / wrt_j for wrt_j in wrt_units] for f_i in f.frame.space.base_units],
+            type
+        ),
+        type=type
+    )
+
+    return _maybe_as_numpy(J, as_numpy)
+
+
+def hessian(
+    f: Val,
+    *,
+    wrt: Vector[Any],
+    as_numpy: bool = False
+) -> Union[Matrix[Any, Any], Callable[..., Any]]:
+    """
+    The matrix of second-order partial derivatives H[i, j] = d^2 f / (d wrt[i] d wrt[j]).
+
+    Each element H[i, j] has the units of f / (wrt[i] * wrt[j]).
+    Under the Matrix[L, R] convention (element units are R[j] / L[i]),
+    H is typed as Matrix[wrt.frame, f / wrt.frame].
+
+    If `as_numpy` is True, return a compiled numpy function (see `codegen.as_numpy_func`) instead.
+    """
+    wrt_expr = _as_explicit(wrt.expr)
+    assert wrt_expr.shape[1] == 1, f"wrt must be a vector. Got shape {wrt_expr.shape}"
+
+    wrt_units = wrt.frame.space.base_units
+    type = wrt.frame, Val(f.units) / wrt.frame # type: ignore
+
+    H = Matrix(
+        _in_element_units(
+            sympy.hessian(f.expr, list(wrt_expr)),
+            [[Val(f.units) / (wrt_i * wrt_j) for wrt_j in wrt_units] for wrt_i in wrt_units], # type: ignore
+            type
+        ),
+        type=type
+    )
+
+    return _maybe_as_numpy(H, as_numpy)
+
+
+def _in_element_units(
+    expr: sympy.MatrixBase, units: List[List[Val]], type: Tuple[Frame[Any], Frame[Any]]
+) -> sympy.MatrixBase:
+    """
+    Convert each element of `expr` (in `units[i][j]`) into the units that a Matrix of `type` gives it.
+    These differ by a scale factor when the frames mix scales (ie. meters and kilometers).
+    """
+    grid = _unit_grid(*type)
+    return sympy.Matrix(expr.rows, expr.cols, lambda i, j: (
+        expr[i, j] * units[i][j].in_units(Val(grid[i][j].units)).expr # type: ignore
+    ))
+
+
+def _as_explicit(expr: Any) -> sympy.MatrixBase:
+    return expr if isinstance(expr, sympy.MatrixBase) else expr.as_explicit()
+
+
+def _maybe_as_numpy(matrix: Matrix[Any, Any], as_numpy: bool) -> Union[Matrix[Any, Any], Callable[..., Any]]:
+    if not as_numpy:
+        return matrix
+
+    from mathpad.codegen import as_numpy_func
+    return as_numpy_func(matrix)
+
+
+# bounded, so that long-running processes don't hold on to every expression they've ever differentiated
+_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _diff_expr(expr: sympy.Basic, wrt: sympy.Basic, order: int) -> sympy.Basic:
+    return expr.diff((wrt, order))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _integrate_expr(expr: sympy.Basic, integrand: Union[sympy.Basic, Tuple[sympy.Basic, ...]]) -> sympy.Basic:
+    return sympy.integrate(expr, integrand)
+
+
 @overload
 def integral(
     val: Q[Val],
@@ -107,20 +234,26 @@ def integral(
     
     """
 
-    integrand = (wrt.expr, *between) if between else wrt.expr 
+    integrand = (
+        wrt.expr,
+        *(bound.expr if isinstance(bound, Val) else sympy.sympify(bound) for bound in between)
+    ) if between else wrt.expr 
 
     if isinstance(val, Vector):
+        expr = sympy.ImmutableMatrix(val.expr) if isinstance(val.expr, sympy.MatrixBase) else val.expr
+        res_expr = _integrate_expr(expr, integrand) # type: ignore
+
         return Vector(
             val.frame * wrt,
-            sympy.integrate(val.expr, integrand) # type: ignore
+            sympy.Matrix(res_expr) if isinstance(res_expr, sympy.MatrixBase) else res_expr # type: ignore
         )
 
     val_units = val.units if isinstance(val, Val) else val
-    val_expr = val.expr if isinstance(val, Val) else Val
+    val_expr = val.expr if isinstance(val, Val) else sympy.sympify(val)
 
     res = Val(
         val_units * wrt.units, # type: ignore
-        sympy.integrate(val_expr, integrand)  # type: ignore
+        _integrate_expr(val_expr, integrand)  # type: ignore
     )
 
     return res
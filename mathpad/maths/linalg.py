@@ -0,0 +1,149 @@
+from typing import Any, Dict, List
+
+import sympy
+from sympy import MatrixBase, ZZ, QQ
+from sympy.polys.constructor import construct_domain
+from sympy.matrices.common import NonInvertibleMatrixError
+
+__all__: List[str] = []
+
+
+def _solve_sparse(A: MatrixBase, b: MatrixBase) -> MatrixBase:
+    """
+    Solve A x = b by Gaussian elimination over the nonzero entries of A only.
+
+    b may have many columns (ie. the identity, for an inverse).
+
+    Fill-in is tracked structurally, and entries are left unexpanded: canonicalising them (ie. with `cancel`)
+    grows exponentially for even a symbolic tridiagonal matrix, whereas the nested form grows linearly.
+    Zeros are only noticed where sympy's automatic simplification finds them, except for the pivots,
+    which are checked with `_is_zero`.
+    """
+    n = A.rows
+    assert A.cols == n, f"Can only solve square systems. Got a {A.rows}x{A.cols} matrix"
+    assert b.rows == n, f"Right hand side must have {n} rows. Got {b.rows}"
+
+    rows: List[Dict[int, sympy.Expr]] = [{} for _ in range(n)]
+    for (i, j), value in A.todok().items():
+        rows[i][j] = value
+
+    rhs = [b.row(i) for i in range(n)]
+
+    for k in range(n):
+        # the sparsest row, with the simplest pivot, causes the least fill-in and expression growth
+        candidates = sorted(
+            (i for i in range(k, n) if k in rows[i]),
+            key=lambda i: (len(rows[i]), sympy.count_ops(rows[i][k]))
+        )
+        for p in candidates:
+            if not _is_zero(rows[p][k]):
+                break
+
+            # an unsimplified zero left by fill-in
+            del rows[p][k]
+        else:
+            raise NonInvertibleMatrixError("Matrix det == 0; not invertible.")
+
+        rows[k], rows[p] = rows[p], rows[k]
+        rhs[k], rhs[p] = rhs[p], rhs[k]
+
+        pivot_row = rows[k]
+        pivot = pivot_row[k]
+
+        for i in range(k + 1, n):
+            if k not in rows[i]:
+                continue
+
+            factor = rows[i].pop(k) / pivot
+
+            for j, value in pivot_row.items():
+                if j == k:
+                    continue
+
+                new_value = rows[i].get(j, 0) - factor * value
+                if new_value == 0:
+                    rows[i].pop(j, None)
+                else:
+                    rows[i][j] = new_value
+
+            rhs[i] = rhs[i] - factor * rhs[k]
+
+    # back substitution
+    x: List[MatrixBase] = [None] * n # type: ignore
+    for k in reversed(range(n)):
+        acc = rhs[k]
+        for j, value in rows[k].items():
+            if j != k:
+                acc = acc - value * x[j]
+        x[k] = acc / rows[k][k]
+
+    return sympy.Matrix.vstack(*x)
+
+
+def _is_zero(expr: sympy.Expr) -> bool:
+    "Whether expr is provably zero; too expensive for every entry, but affordable for pivots"
+    zero = expr.is_zero
+    if zero is None:
+        zero = sympy.expand(expr) == 0
+    return bool(zero)
+
+
+def _solve_fraction_free(A: MatrixBase, b: MatrixBase) -> MatrixBase:
+    """
+    Solve A x = b by fraction-free (Bareiss) elimination, for dense symbolic matrices.
+
+    The elements are converted to polynomials, so that each step divides exactly by the previous pivot
+    and the entries stay (cancelled) polynomials whose degree only grows linearly - they are minors of A.
+    The solution is then the ratio of such polynomials to the determinant.
+    Forming `A.inv()` first nests fractions at every step instead.
+
+    Elements with floats or surds have no exact polynomial form, so fall back to LU decomposition.
+    """
+    n = A.rows
+    assert A.cols == n, f"Can only solve square systems. Got a {A.rows}x{A.cols} matrix"
+    assert b.rows == n, f"Right hand side must have {n} rows. Got {b.rows}"
+
+    width = n + b.cols
+    domain, elements = construct_domain([*A, *b], field=False)
+
+    ground = domain.dom if domain.is_PolynomialRing or domain.is_FractionField else domain
+    if ground not in (ZZ, QQ):
+        return A.LUsolve(b)
+
+    M = [elements[i * n:(i + 1) * n] + elements[n * n + i * b.cols:n * n + (i + 1) * b.cols] for i in range(n)]
+
+    prev_pivot = domain.one
+
+    for k in range(n):
+        candidates = [i for i in range(k, n) if M[i][k]]
+        if not candidates:
+            raise NonInvertibleMatrixError("Matrix det == 0; not invertible.")
+
+        # the simplest pivot keeps the expressions smallest
+        p = min(candidates, key=lambda i: len(str(M[i][k]))) # length is a cheap proxy for complexity
+        M[k], M[p] = M[p], M[k]
+
+        pivot = M[k][k]
+        for i in range(k + 1, n):
+            factor = M[i][k]
+            for j in range(k + 1, width):
+                M[i][j] = domain.exquo(pivot * M[i][j] - factor * M[k][j], prev_pivot)
+            M[i][k] = domain.zero
+
+        prev_pivot = pivot
+
+    # fraction-free back substitution: x = y / det(A), where y divides exactly at each step too
+    det = M[n - 1][n - 1]
+    x = sympy.zeros(n, b.cols)
+    det_expr = domain.to_sympy(det)
+
+    for c in range(b.cols):
+        y: List[Any] = [None] * n
+        for k in reversed(range(n)):
+            acc = det * M[k][n + c]
+            for j in range(k + 1, n):
+                acc -= M[k][j] * y[j]
+            y[k] = domain.exquo(acc, M[k][k])
+            x[k, c] = domain.to_sympy(y[k]) / det_expr
+
+    return x
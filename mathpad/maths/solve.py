@@ -1,8 +1,11 @@
-from typing import TYPE_CHECKING, Collection, Dict, List, Union, overload
+from typing import TYPE_CHECKING, Collection, Dict, List, Mapping, Optional, Union, overload
 import sympy
 
-from mathpad.core.val import Val, ValT
+from mathpad.core.val import Q, Val, ValT
 from mathpad.core.equation import Equation
+from mathpad.maths.budget import BudgetExceededError, run_with_budget
+from mathpad._global_options import _global_options
+from mathpad._profiling import profiled
 if TYPE_CHECKING:
     from mathpad.core.vector import Vector, VecT
 
@@ -47,10 +50,30 @@ class Solution:
 
 def solve(
     equations: Collection[Equation],
-    solve_for: Collection[Union[Val, 'Vector']]
+    solve_for: Collection[Union[Val, 'Vector']],
     # domain: Literal["complex", "real", "integers", "naturals", "naturals0"] = "real",
+    *,
+    timeout: Optional[float] = None,
+    numeric_guess: Optional[Mapping[Val, Q[Val]]] = None,
 ) -> List[Solution]:
+    """
+    Solve a system of equations for the given unknowns.
+
+    Arguments:
+
+        timeout: wall-clock budget in seconds for the symbolic solve.
+            Defaults to the `solve_timeout` global option (unbounded unless set).
+            The solve is only interrupted when called from the main thread on platforms with SIGALRM.
+            Otherwise the abandoned solve keeps running (and using CPU) in a background thread.
+
+        numeric_guess: initial guess for each unknown. If provided and the symbolic solve
+            runs over budget, a single numeric solution is found with `sympy.nsolve` instead.
+            Otherwise a BudgetExceededError is raised, with `.partial` set to the sympy equations.
+    """
     from mathpad.core import Vector
+
+    if timeout is None:
+        timeout = _global_options.solve_timeout
     
     solve_for_vectors_split: List[Val] = []
     for x in solve_for:
@@ -82,8 +105,20 @@ def solve(
     #     "naturals0": S.Naturals0,
     # }
 
-    results: List[Dict[sympy.Expr, sympy.Expr]] = \
-        sympy.solve(val_eqns, ukwn_syms, dict=True)  # type: ignore
+    try:
+        with profiled("sympy solve"):
+            results: List[Dict[sympy.Expr, sympy.Expr]] = run_with_budget(
+                lambda: sympy.solve(val_eqns, ukwn_syms, dict=True),  # type: ignore
+                timeout,
+                "solve",
+                partial=val_eqns
+            )
+
+    except BudgetExceededError:
+        if numeric_guess is None:
+            raise
+
+        results = [_nsolve(val_eqns, solve_for_vectors_split, numeric_guess)]
 
     if not any(results):
         raise Exception("Solving failed!")
@@ -108,3 +143,20 @@ def solve(
         solutions.append(solution)
 
     return solutions
+
+
+def _nsolve(
+    val_eqns: List[sympy.Equality],
+    unknowns: List[Val],
+    numeric_guess: Mapping[Val, Q[Val]]
+) -> Dict[sympy.Expr, sympy.Expr]:
+    guess = []
+    for ukwn in unknowns:
+        assert ukwn in numeric_guess, f"numeric_guess is missing an initial value for {ukwn}"
+        x0 = numeric_guess[ukwn]
+        guess.append(float(x0.in_units(ukwn).expr) if isinstance(x0, Val) else x0)
+
+    ukwn_syms = [ukwn.expr for ukwn in unknowns]
+    with profiled("sympy nsolve"):
+        result = sympy.nsolve([eqn.lhs - eqn.rhs for eqn in val_eqns], ukwn_syms, guess)
+    return dict(zip(ukwn_syms, result))
@@ -1,17 +1,17 @@
-from typing import Collection, Set, List, Tuple
-from itertools import zip_longest
+from typing import Collection, Dict, Optional, List, Tuple
+import time
 
 import sympy
-import numpy as np
-from sympy.core.function import Function, AppliedUndef
-from sympy import Derivative
 from sympy.utilities.lambdify import lambdify
-from scipy.integrate import RK45
 
 from mathpad.core.val import Val
 from mathpad.core.equation import Equation
-from mathpad.maths.algebra import subs, SubstitutionMap, simplify
+from mathpad.maths.algebra import Substitution, SubstitutionMap, simplify, SimplifyStrategy
+from mathpad.maths.budget import run_with_budget
 from mathpad.core.common_vals import t
+from mathpad._global_options import _global_options
+from mathpad._profiling import profiled
+from mathpad._dynamics import collect_derivatives, derivative, state_vector
 
 
 def simulate_dynamic_system(
@@ -24,6 +24,12 @@ def simulate_dynamic_system(
     substitute: SubstitutionMap = {},
     x_axis: Val = t,
     all_solutions: bool = False,
+    # defaults to the `simplify_strategy` global option, or "medium" if that is unset. "medium" produces
+    # equations that solve just as quickly as "full", but simplifies ~30% faster (see simplify())
+    simplify_strategy: Optional[SimplifyStrategy] = None,
+    # wall-clock budgets in seconds (default to the global options)
+    solve_timeout: Optional[float] = None,
+    simplify_timeout: Optional[float] = None,
     # output display options
     verbose: bool = True,
     display_plots: bool = True,
@@ -33,17 +39,50 @@ def simulate_dynamic_system(
     plot_static: bool = False,
     plot_static_figsize: Tuple[int, int] = (960, 400),
     plot_title: str = "Solution #{solutionNo}",
+    # if provided, filled with the wall-clock time (in seconds) spent in each phase
+    timings: Optional[Dict[str, float]] = None,
     _NEW_SOLVE: bool = False # TODO: fix this properly
 ) -> List[Tuple[float, List[float]]]:
-    "simulates a differential system specified by dynamics_equations from initial conditions at x_axis=0 (typically t=0) to x_final"
-    from IPython.display import display
-    import plotly.io as pio
-    import plotly.graph_objects as go
-    from tqdm import tqdm
+    """
+    simulates a differential system specified by dynamics_equations from initial conditions at x_axis=0 (typically t=0) to x_final
+
+    If solving for the highest derivatives takes longer than `solve_timeout` seconds, a BudgetExceededError is raised
+    with `.partial` set to the substituted & simplified equations. Slow simplifications fall back to `sympy.cancel`.
+    As with `solve()` and `simplify()`, budgets only interrupt sympy when called from the main thread.
+
+    Pass a dict as `timings` to find out where the time goes. It is filled with the seconds spent in the
+    "substitute", "simplify", "solve", "lambdify" and "integrate" phases (summed over solutions).
+
+    IPython, plotly and tqdm are only imported for the display options that need them.
+    With the `headless` global option (or the MATHPAD_HEADLESS environment variable) set, plots and
+    the progress bar are never shown and `explain` output is printed as plain text, so they are never imported.
+    """
+    from scipy.integrate import RK45
+    import numpy as np
+
+    if _global_options.headless:
+        display_plots = display_progress_bar = False
+
+    if explain:
+        if _global_options.headless:
+            display = print
+        else:
+            from IPython.display import display
+
+    if display_plots:
+        import plotly.io as pio
+        import plotly.graph_objects as go
+
+    if display_progress_bar:
+        from tqdm import tqdm
 
     verbose = verbose or explain
 
-    if plot_static:
+    if timings is None:
+        timings = {}
+    timings.update(substitute=0.0, simplify=0.0, solve=0.0, lambdify=0.0, integrate=0.0)
+
+    if plot_static and display_plots:
         # make static renderings a certain size, the default one is too square for my liking
         svg_renderer = pio.renderers["svg"]
         width, height = plot_static_figsize
@@ -63,43 +102,28 @@ def simulate_dynamic_system(
             for replace, _with in substitute.items():
                 display(replace == _with)
 
+    if simplify_strategy is None:
+        simplify_strategy = _global_options.simplify_strategy or "medium"
+
     # pre-substitute and simplify the input equations before further processing
-    problem_eqns = [simplify(subs(eqn, substitute)) for eqn in dynamics_equations]
+    start = time.perf_counter()
+    subbed_eqns = Substitution(substitute)(dynamics_equations)
+    timings["substitute"] += time.perf_counter() - start
+
+    start = time.perf_counter()
+    problem_eqns = [
+        simplify(eqn, strategy=simplify_strategy, timeout=simplify_timeout)
+        for eqn in subbed_eqns
+    ]
+    timings["simplify"] += time.perf_counter() - start
 
     # collect derivatives and any unspecified unkowns
-    derivatives: Set[Tuple[Function, float]] = set()
-
-    for eqn in problem_eqns:
-        sympy_eqn = eqn.as_sympy_eq()
-        # TODO: properly check x_axis for derivative collection (usually t)
-        derivatives.update(
-            {
-                (d.args[0], d.args[1][1] if isinstance(d.args[1], sympy.Tuple) else 1)
-                for d in sympy_eqn.atoms(Derivative)
-            }
-        )
-        derivatives.update(
-            {(f, 0) for f in sympy_eqn.atoms(Function) if isinstance(f, AppliedUndef)}
-        )
-
-    highest_derivatives = {}
-    lowest_derivatives = {}
-    for f, lvl in derivatives:
-
-        if f in highest_derivatives:
-            if highest_derivatives[f] < lvl:
-                highest_derivatives[f] = lvl
-        else:
-            highest_derivatives[f] = lvl
-
-        if f in lowest_derivatives:
-            if lowest_derivatives[f] > lvl:
-                lowest_derivatives[f] = lvl
-        else:
-            lowest_derivatives[f] = lvl
+    highest_derivatives, lowest_derivatives = collect_derivatives(
+        [eqn.as_sympy_eq() for eqn in problem_eqns]
+    )
 
     solve_for_highest_derivatives = [
-        fn if lvl == 0 else sympy.diff(fn, (x_axis.expr, lvl))
+        derivative(fn, lvl, x_axis.expr)
         for fn, lvl in highest_derivatives.items()
         if not lvl == lowest_derivatives[fn]
     ]
@@ -117,11 +141,19 @@ def simulate_dynamic_system(
         print("For values:")
         display(solve_for)
 
-    solutions = sympy.solve(
-        [eqn.as_sympy_eq() for eqn in problem_eqns],
-        solve_for if _NEW_SOLVE else solve_for_highest_derivatives,
-        dict=True,
-    )
+    start = time.perf_counter()
+    with profiled("sympy solve"):
+        solutions = run_with_budget(
+            lambda: sympy.solve(
+                [eqn.as_sympy_eq() for eqn in problem_eqns],
+                solve_for if _NEW_SOLVE else solve_for_highest_derivatives,
+                dict=True,
+            ),
+            solve_timeout if solve_timeout is not None else _global_options.solve_timeout,
+            "simulate_dynamic_system solve",
+            partial=problem_eqns
+        )
+    timings["solve"] += time.perf_counter() - start
 
     assert any(solutions), "No Solution Found"
     _print_if(verbose, "Solving finished.")
@@ -159,36 +191,21 @@ def simulate_dynamic_system(
             unknowns
         ), f"Cannot simulate ODE in the prescence of unknowns: {unknowns}. Please include them in substitutions"
 
-        input_unzipped = []
-
-        n_unique_derivatives = 0
-
-        for fn, lowest_lvl in lowest_derivatives.items():
-            highest_lvl = highest_derivatives[fn]
-
-            if lowest_lvl == highest_lvl:
-                continue
-            
-            n_unique_derivatives += 1
-
-            input_unzipped.append(
-                [
-                    fn if lvl == 0 else sympy.diff(fn, (x_axis.expr, lvl))
-                    for lvl in range(lowest_lvl, highest_lvl)
-                ]
-            )
+        state_fns = [
+            fn for fn, lowest_lvl in lowest_derivatives.items()
+            if lowest_lvl != highest_derivatives[fn]
+        ]
+        n_unique_derivatives = len(state_fns)
 
         # inputs are lowest to highest derivatives excluding the highest, ie [x, y, dx, dy]
-        inputs = [
-            deriv
-            for derivatives in zip_longest(*input_unzipped)
-            for deriv in derivatives
-            if deriv is not None
-        ]
+        inputs = state_vector(state_fns, lowest_derivatives, highest_derivatives, x_axis.expr)
 
         # outputs are highest of input derviatives plus recorded data
         # ie [ddx, ddy, record[0], record[1]]
-        lambdified = lambdify([x_axis.expr, inputs], solution_vec, 'numpy')
+        start = time.perf_counter()
+        with profiled("lambdify"):
+            lambdified = lambdify([x_axis.expr, inputs], solution_vec, 'numpy')
+        timings["lambdify"] += time.perf_counter() - start
 
         data = []
 
@@ -210,11 +227,10 @@ def simulate_dynamic_system(
         # normalize and check initial conditions
         y0 = []
         for sym in inputs:
-            sym_hash = hash(sym)
             # find the original val
             # this is backwards, and this whole function could probably use a refactor
             for val in initial_conditions.keys():
-                if hash(val) == sym_hash:  # because (hash(val) == hash(val.val))
+                if val.expr == sym:
                     break
             else:
                 assert (
@@ -245,6 +261,8 @@ def simulate_dynamic_system(
 
         pbar = tqdm(total=x_final, leave=False) if display_progress_bar else None
 
+        start = time.perf_counter()
+
         while integrator.status == "running":
             msg = integrator.step()
 
@@ -257,10 +275,12 @@ def simulate_dynamic_system(
                 pbar.update(dt)
                 t_prev = integrator.t
         
+        timings["integrate"] += time.perf_counter() - start
+
         if pbar:
             pbar.close()
 
-        _print_if(verbose, "Simulation finished. Plotting...")
+        _print_if(verbose, "Simulation finished." + (" Plotting..." if display_plots else ""))
 
         if display_plots:
             go.Figure(
@@ -1,4 +1,7 @@
+import time
+
 from mathpad import *
+from mathpad.maths.algebra import _SIMPLIFIERS
 
 def test_sym_subs():
     x = "x" * m
@@ -34,4 +37,84 @@ def test_R3_sym_simplify():
     vec = O[x, y, z]
 
     eqn = simplify(vec) == vec
-    assert eqn.eval()
\ No newline at end of file
+    assert eqn.eval()
+
+def test_simplify_timeout_falls_back_to_cancel(monkeypatch):
+    x = "x" * dimensionless
+    expr = (x**2 - 1) / (x - 1) + sin(x)**2 + cos(x)**2
+
+    # make the full simplify reliably slower than the budget
+    monkeypatch.setitem(_SIMPLIFIERS, "full", lambda expr: time.sleep(10))
+    res = simplify(expr, timeout=0.05)
+
+    # trig identity is only found by the full simplify, but the rational part is still cancelled
+    assert (res == x + 1 + sin(x)**2 + cos(x)**2).eval()
+
+
+def test_simplify_strategies():
+    x = "x" * dimensionless
+    expr = (x**2 - 1) / (x - 1) + sin(x)**2 + cos(x)**2
+
+    assert (simplify(expr, strategy="fast") == x + 1 + sin(x)**2 + cos(x)**2).eval()
+    assert (simplify(expr, strategy="medium") == x + 2).eval()
+    assert (simplify(expr, strategy="full") == x + 2).eval()
+
+
+def test_simplify_strategy_vector():
+    O = R3("O")
+    x = "x" * dimensionless
+    vec = O[(x**2 - 1) / (x - 1), sin(x)**2 + cos(x)**2, x]
+
+    eqn = simplify(vec, strategy="medium") == O[x + 1, 1, x]
+    assert eqn.eval()
+
+
+def test_simplify_timeout_fast_leaves_expr(monkeypatch):
+    x = "x" * dimensionless
+    expr = (x**2 - 1) / (x - 1)
+
+    monkeypatch.setitem(_SIMPLIFIERS, "fast", lambda expr: time.sleep(10))
+    res = simplify(expr, strategy="fast", timeout=0.05)
+
+    assert res.expr == expr.expr
+
+
+def test_simplify_timeout_shared_by_elements(monkeypatch):
+    O = R3("O")
+    x = "x" * dimensionless
+    vec = O[(x**2 - 1) / (x - 1), sin(x)**2 + cos(x)**2, x]
+
+    started = []
+    def slow_medium(expr):
+        started.append(expr)
+        time.sleep(10)
+
+    monkeypatch.setitem(_SIMPLIFIERS, "medium", slow_medium)
+    res = simplify(vec, strategy="medium", timeout=0.05)
+
+    # the first element spends the whole budget; the rest go straight to the fast strategy
+    assert len(started) == 1
+    assert (res == O[x + 1, sin(x)**2 + cos(x)**2, x]).eval()
+
+
+def test_Substitution_collection():
+    x = "x" * m
+    y = "y" * m
+    params = Substitution({x: 1, y: 200 * cm})
+
+    a, b, c = params([x + y, x * y == 2 * m**2, x + "z" * m])
+
+    assert (a == 3 * m).eval()
+    assert b.eval()
+    assert (c == 1 + "z" * m).eval()
+
+
+def test_Substitution_derivative():
+    x = "x(t)" * m
+    k = "k" * N / m
+    params = Substitution({k: 10})
+
+    eqn = params(k * x == diff(x, wrt=t) * N * s / m)
+
+    assert (eqn.lhs == 10 * x * N / m).eval()
+    assert (eqn.rhs == diff(x, wrt=t) * N * s / m).eval()
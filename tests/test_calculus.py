@@ -78,4 +78,74 @@ def test_R3_integral():
     ]
     actual = integral(vec)
 
-    assert (actual == expected).eval()
\ No newline at end of file
+    assert (actual == expected).eval()
+
+def test_diff_is_memoized():
+    from mathpad.maths.calculus import _diff_expr
+
+    x = "x(t)" * m
+    first = diff(x ** 3, 2)
+    hits_before = _diff_expr.cache_info().hits
+    second = diff(x ** 3, 2)
+
+    assert _diff_expr.cache_info().hits == hits_before + 1
+    assert first.expr is second.expr
+
+
+def test_R3_diff_second_order():
+    O = R3("O")
+    t = "t" * s
+    vec = O[t**3, 2 * t**2, 3]
+
+    expected = (O / s / s)[6 * t, 4, 0]
+    actual = diff(vec, 2)
+
+    assert (actual == expected).eval()
+    assert actual[0].units == (1 / s**2).units
+
+
+def test_jacobian_units():
+    x = "x" * m
+    y = "y" * m
+    F = R2("F") * m**2
+    X = R2("X") * m
+
+    J = jacobian(F[x * y, x**2], wrt=X[x, y])
+
+    assert (J[0, 0] == y).eval()
+    assert (J[0, 1] == x).eval()
+    assert (J[1, 0] == 2 * x).eval()
+    assert (J[1, 1] == 0 * m).eval()
+    assert J[1, 1].units == m.units
+
+
+def test_jacobian_mixed_units():
+    x = "x" * km
+    theta = "theta" * rad
+    F = R2("F") * m**2
+    X = Frame(VectorSpace.new("X", ("x", "theta"), (km, rad)), "X")
+
+    J = jacobian(F[x * theta, x**2], wrt=X[x, theta])
+
+    # d f[i] / d wrt[j] has the units of f[i] / wrt[j]: m**2 / km (= mm) and m**2 / rad
+    assert J[0, 0].in_units(mm).expr == theta.expr
+    assert J[1, 0].in_units(mm).expr == 2 * x.expr
+    assert J[0, 1].units == (m**2 / rad).units
+    assert J[0, 1].expr == x.expr
+
+
+def test_hessian_as_numpy():
+    x = "x" * m
+    y = "y" * m
+    k = "k" * N / m
+    O = R2("O") * m
+    V = k * x**2 / 2 + k * x * y
+
+    H = hessian(V, wrt=O[x, y])
+    assert (H[0, 1] == k).eval()
+    assert H[0, 1].units == (N / m).units
+
+    H_fn = hessian(V, wrt=O[x, y], as_numpy=True)
+    res = H_fn({k: [1, 2]})
+    assert res.shape == (2, 2, 2)
+    assert (res[1] == [[2, 2], [2, 0]]).all()
@@ -14,4 +14,27 @@ def test_as_numpy_func_arraylikes():
     z = "z" * m
     f = mathpad.codegen.as_numpy_func(x + y + z)
     res = f({x: [1, 2, 3], y: [1, 2, 3], z: [1, 2, 3]})
-    assert (res == [3, 6, 9]).all()
\ No newline at end of file
+    assert (res == [3, 6, 9]).all()
+
+def test_as_numpy_func_vector_broadcasts():
+    x = "x" * m
+    O = R3("O") * m
+    f = mathpad.codegen.as_numpy_func(O[x, 2 * x, 1])
+    res = f({x: [1, 2]})
+    assert res.shape == (2, 3)
+    assert (res == [[1, 2, 1], [2, 4, 1]]).all()
+
+def test_as_numpy_solver_batches():
+    k = "k" * N / m
+    x = "x" * m
+    Q = R2("Q") * m
+    F = R2("F") * N
+    K = Mat[Q, F]([2 * k, -k], [-k, 2 * k])
+    b = Q[x, 0]
+
+    solver = mathpad.codegen.as_numpy_solver(K, b)
+    res = solver({k: [1, 2], x: 300 * cm})
+    assert res.shape == (2, 2)
+
+    for k_value, solution in zip([1, 2], res):
+        assert abs(solution - K.solve(b).to_numpy({k: k_value, x: 3})).max() < 1e-12
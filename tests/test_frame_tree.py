@@ -0,0 +1,83 @@
+import numpy
+from mathpad import *
+
+from _test_utils import expect_err
+from mathpad.core.val import DimensionError
+
+
+def planar_arm():
+    theta1, theta2 = "theta1" * rad, "theta2" * rad
+    l1, l2 = "l1" * m, "l2" * m
+
+    world, upper, fore = R2("W") * m, R2("U") * m, R2("F") * m
+
+    def rotation(theta):
+        return [[cos(theta), -sin(theta)], [sin(theta), cos(theta)]]
+
+    tree = FrameTree(world)
+    tree.add(upper, world, rotation=rotation(theta1))
+    tree.add(fore, upper, rotation=rotation(theta2), translation=upper[l1, 0])
+
+    return tree, (world, upper, fore), (theta1, theta2, l1, l2)
+
+
+def test_FrameTree_express():
+    tree, (world, upper, fore), (theta1, theta2, l1, l2) = planar_arm()
+
+    tip = simplify(tree.express(fore[l2, 0], world))
+    expected = world[
+        l1 * cos(theta1) + l2 * cos(theta1 + theta2),
+        l1 * sin(theta1) + l2 * sin(theta1 + theta2)
+    ]
+    assert (tip == expected).eval()
+    assert tip.frame is world
+
+    # and back again
+    assert (simplify(tree.express(tip, fore)) == fore[l2, 0]).eval()
+
+
+def test_FrameTree_to_numpy_batches():
+    tree, (world, upper, fore), (theta1, theta2, l1, l2) = planar_arm()
+
+    angles = numpy.linspace(0, numpy.pi, 50)
+    subs = {theta1: angles, theta2: -angles, l1: 200 * cm}
+
+    transforms = tree.to_numpy(fore, world, subs)
+    assert transforms.shape == (50, 3, 3)
+
+    # the forearm's origin is at the end of the upper arm, and points along the world's x axis
+    assert abs(transforms[:, :2, 2] - 2 * numpy.stack([numpy.cos(angles), numpy.sin(angles)], axis=-1)).max() < 1e-12
+    assert abs(transforms[:, :2, :2] - numpy.eye(2)).max() < 1e-12
+
+    inverse = tree.to_numpy(world, fore, subs)
+    assert abs(inverse @ transforms - numpy.eye(3)).max() < 1e-12
+
+    symbolic = tree.transform(fore, world).to_numpy(subs)
+    assert abs(symbolic - transforms).max() < 1e-12
+
+
+def test_FrameTree_equal_frames_are_ambiguous():
+    tree, (world, upper, fore), (theta1, theta2, l1, l2) = planar_arm()
+
+    # an equal copy of a frame of the tree is found...
+    assert (tree.express((R2("F") * m)[l2, 0], world) == tree.express(fore[l2, 0], world)).eval()
+
+    # ...unless several frames of the tree equal it
+    twin = R2("F") * m
+    tree.add(twin, world)
+    with expect_err(KeyError):
+        tree.express((R2("F") * m)[l2, 0], world)
+
+    # but the frames themselves are still told apart
+    assert (tree.express(twin[l2, 0], world) == world[l2, 0]).eval()
+
+
+def test_FrameTree_requires_identical_units():
+    world = R2("W") * m
+    tree = FrameTree(world)
+
+    with expect_err(AssertionError):
+        tree.add(R2("T") * mm, world, translation=world[1, 0])
+
+    with expect_err(DimensionError):
+        tree.add(R2("T") * (m * s), world)
@@ -0,0 +1,62 @@
+import subprocess
+import sys
+
+
+def imported_modules_after(code: str):
+    probe = code + "\nimport sys; print(' '.join(sys.modules))"
+    output = subprocess.run([sys.executable, "-c", probe], check=True, capture_output=True, text=True).stdout
+    return set(output.split())
+
+
+def test_import_is_lazy():
+    modules = imported_modules_after("import mathpad")
+
+    for heavy in ("scipy", "IPython", "numpy", "mathpad.codegen"):
+        assert heavy not in modules, f"`import mathpad` should not import {heavy}"
+
+
+def test_lazy_attributes():
+    import mathpad
+
+    assert callable(mathpad.codegen.as_numpy_func)
+    assert callable(mathpad.simulate_dynamic_system)
+    assert callable(mathpad.linearize)
+
+    namespace = {}
+    exec("from mathpad import *", namespace)
+    assert namespace["mathpad"] is mathpad
+    assert namespace["simulate_dynamic_system"] is mathpad.simulate_dynamic_system
+    assert namespace["codegen"] is mathpad.codegen
+
+    # every public name, lazy or not, as when they were all imported eagerly
+    assert set(namespace) - {"__builtins__"} == {name for name in dir(mathpad) if not name.startswith("_")}
+
+    # resolved lazily, but still part of the star-import
+    from IPython.display import display
+    assert namespace["display"] is display
+
+
+def test_headless_simulation_never_imports_display_modules():
+    code = """
+import os
+os.environ["MATHPAD_HEADLESS"] = "1"
+
+import sys
+from mathpad import *
+
+x = "x(t)" * m
+simulate_dynamic_system(
+    [diff(x, 2) == -x * (1 / s**2)],
+    x_final=1,
+    max_step=0.1,
+    initial_conditions={x: 1, diff(x): 0},
+    record=[x],
+    verbose=True,
+    explain=True,
+)
+assert sys.displayhook is sys.__displayhook__, "sympy printing should not be configured"
+"""
+    modules = imported_modules_after(code)
+
+    for display_module in ("IPython", "plotly", "tqdm"):
+        assert display_module not in modules, f"headless mode should not import {display_module}"
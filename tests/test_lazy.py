@@ -0,0 +1,59 @@
+import pytest
+
+from mathpad import *
+from mathpad.core.lazy import LazyExpr
+from mathpad.core.val import SumDimensionsMismatchError
+
+
+def test_lazy_defers_expr():
+    a = "a" * m
+    b = "b" * s
+
+    with global_options(lazy=True):
+        res = (a * b + 2 * a * b) / b
+
+    assert isinstance(res._expr, LazyExpr)
+    assert res.units == m.units
+    assert res.expr == 3 * a.expr
+    assert not isinstance(res._expr, LazyExpr)
+
+
+def test_lazy_matches_eager():
+    xs = [f"x{i}" * m for i in range(30)]
+
+    def build():
+        acc = xs[0]
+        for x in xs[1:]:
+            acc = acc * x / (x - 1 * mm) + 2 * xs[0]
+        return acc
+
+    eager = build()
+    with global_options(lazy=True):
+        lazy = build()
+
+    assert lazy.units == eager.units
+    assert lazy.expr == eager.expr
+
+
+def test_lazy_checks_dimensions_eagerly():
+    with global_options(lazy=True):
+        with pytest.raises(SumDimensionsMismatchError):
+            ("a" * m) + ("b" * s)
+
+
+def test_lazy_shared_subexpressions():
+    x = "x" * m
+
+    with global_options(lazy=True):
+        res = x
+        for _ in range(30):
+            res = res * res / res  # each node is used more than once
+
+    assert res.expr == x.expr
+
+
+def test_global_options_restored():
+    with global_options(lazy=True):
+        pass
+
+    assert isinstance((("a" * m) * 2)._expr, sympy.Expr)
@@ -0,0 +1,41 @@
+import numpy as np
+
+from mathpad import *
+
+
+def pendulum():
+    theta = "theta(t)" * radians
+    tau = "tau(t)" * N * m
+    mass = "m" * kg
+    l = "l" * m
+    g = "g" * m / s**2
+
+    dynamics = mass * l**2 * diff(theta, 2) + mass * g * l * sin(theta) == tau
+    params = {mass: 1, l: 0.5, g: 9.81}
+    return dynamics, theta, tau, params
+
+
+def test_linearize_pendulum():
+    dynamics, theta, tau, params = pendulum()
+
+    ss = linearize([dynamics], [theta], [tau], {theta: 0, diff(theta): 0, tau: 0}, substitute=params)
+
+    assert np.allclose(ss.A, [[0, 1], [-19.62, 0]])
+    assert np.allclose(ss.B, [[0], [4]])
+    assert np.allclose(ss.C, np.eye(2))
+    assert np.allclose(ss.D, [[0], [0]])
+
+    assert ss.state_units == [radians.units, (radians / s).units]
+    assert ss.input_units == [(N * m).units]
+
+
+def test_Linearization_batch_operating_points():
+    dynamics, theta, tau, params = pendulum()
+    lin = Linearization([dynamics], [theta], [tau], outputs=[theta], substitute=params)
+
+    thetas = np.linspace(0, np.pi, 5)
+    ss = lin.at({theta: thetas, diff(theta): 0, tau: 0})
+
+    assert ss.A.shape == (5, 2, 2)
+    assert np.allclose(ss.A[:, 1, 0], -19.62 * np.cos(thetas))
+    assert ss.C.shape == (5, 1, 2)
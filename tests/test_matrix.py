@@ -1,8 +1,10 @@
 
+import numpy
 from mathpad import *
 
 from _test_utils import expect_err
 from mathpad.core.val import DimensionError
+from sympy.matrices.common import NonInvertibleMatrixError
 
 def test_Matrix_construct_R2xR2():
 
@@ -300,3 +302,123 @@ def test_Matrix_symbolic():
     assert elements[2] == A[1, 0]
     assert elements[3] == A[1, 1]
 
+
+
+def test_Matrix_to_numpy():
+    a = "a" * m
+    L = R2("L")
+    O = R2("O") * m
+
+    A = Mat[L, O](
+        [a, 0],
+        [0, 1]
+    )
+
+    res, units = A.to_numpy({a: [1, 2]}, with_units=True)
+    assert res.shape == (2, 2, 2)
+    assert (res[1] == [[2, 0], [0, 1]]).all()
+    assert [[unit.units for unit in row] for row in units] == [[m.units, m.units], [m.units, m.units]]
+
+
+def test_Matrix_sparse():
+    k = "k" * N / m
+    Q = R3("Q") * m
+    F = R3("F") * N
+
+    K = Mat[Q, F].sparse({
+        (0, 0): 2 * k, (0, 1): -k,
+        (1, 0): -k, (1, 1): 2 * k, (1, 2): -k,
+        (2, 1): -k, (2, 2): 2 * k,
+    })
+
+    assert K.is_sparse
+    assert (K[0, 2] == 0 * N / m).eval()
+    assert (K[1, 2] == -k).eval()
+
+    # only the given elements are checked
+    with expect_err(DimensionError):
+        Mat[Q, F].sparse({(0, 0): 1 * s})
+
+    f = "f" @ F
+    assert (K @ f).frame == Q
+
+
+def test_Mat_reuses_unit_grid():
+    Q = R2("Q") * m
+    F = R2("F") * N
+
+    assert Mat[Q, F] is Mat[Q, F]
+    assert Mat[Q, F] is not Mat[F, Q]
+
+    grid = Mat[Q, F].unit_grid
+    assert (grid[1][0] == N / m).eval()
+
+    Mat[Q, F]([1 * N / m, 2 * N / km], [3 * N / mm, 4 * N / m])
+    assert Mat[Q, F].unit_grid is grid
+
+    # equivalent (but not identical) units are still accepted
+    Mat[Q, F]([1 * kg / s ** 2, 1 * N / m], [1 * N / m, 1 * N / m])
+
+    with expect_err(DimensionError):
+        Mat[Q, F]([1 * N / m, 1 * N], [1 * N / m, 1 * N / m])
+
+
+def test_Matrix_solve():
+    k = "k" * N / m
+    Q = R3("Q") * m
+    F = R3("F") * N
+
+    elements = {
+        (0, 0): 2 * k, (0, 1): -k,
+        (1, 0): -k, (1, 1): 2 * k, (1, 2): -k,
+        (2, 1): -k, (2, 2): 2 * k,
+    }
+    b = Q[1, 2, 3]
+
+    for K in (Mat[Q, F].sparse(elements), Mat[Q, F](*[[elements.get((i, j), 0) for j in range(3)] for i in range(3)])):
+        x = K.solve(b)
+        assert x.frame == F
+        assert (K @ x == b).eval()
+
+        K_inv = K.inv.to_numpy({k: 2})
+        assert abs(K_inv @ K.to_numpy({k: 2}) - numpy.eye(3)).max() < 1e-12
+
+
+def test_Matrix_solve_symbolic():
+    Q, F = R2("Q"), R2("F")
+    A = Mat[Q, F](["a", "b"], ["c", "d"])
+    a, b, c, d = A[0, 0], A[0, 1], A[1, 0], A[1, 1]
+    y = Q["y1", "y2"]
+
+    x = A.solve(y)
+    assert (simplify(A @ x) == y).eval()
+    # fraction-free elimination leaves the solution in its compact (cancelled) form
+    assert (x.i == (d * y.i - b * y.j) / (a * d - b * c)).eval()
+
+    values = {a: 1, b: 2, c: 3, d: 4}
+    assert abs(A.inv.to_numpy(values) @ A.to_numpy(values) - numpy.eye(2)).max() < 1e-12
+
+    with expect_err(NonInvertibleMatrixError):
+        Mat[Q, F](["a", "a"], ["a", "a"]).solve(y)
+
+
+def test_Matrix_solve_sparse_skips_unsimplified_zero_pivots():
+    Q, F = R3("Q"), R3("F")
+    x = "x" * dimensionless
+    c = sin(x) * cos(x) * x**5 + x**3 + cos(x)**2
+
+    # eliminating the first column leaves x**2 + 2*x + 1 - (x + 1)**2 where the sparsest pivot would be
+    K = Mat[Q, F].sparse({
+        (0, 0): 1, (0, 1): x + 1,
+        (1, 0): x + 1, (1, 1): x**2 + 2 * x + 1, (1, 2): 1,
+        (2, 1): c, (2, 2): 1,
+    })
+
+    values = {x: 0.5}
+    assert abs(K.inv.to_numpy(values) @ K.to_numpy(values) - numpy.eye(3)).max() < 1e-12
+
+    with expect_err(NonInvertibleMatrixError):
+        Mat[R2("Q"), R2("F")].sparse({
+            (0, 0): 1, (0, 1): x + 1,
+            (1, 0): x + 1, (1, 1): x**2 + 2 * x + 1,
+        }).inv
@@ -0,0 +1,83 @@
+from mathpad import *
+from mathpad.core.val import DimensionError
+
+
+def test_profile_counts_operations():
+    x = "x" * m
+    y = "y" * km
+
+    with profile() as p:
+        eqn = x + y == 3 * m
+        solve([eqn], [x])
+        simplify(eqn)
+
+    # one more is constructed by simplify()
+    assert p.calls["equation"] == 2
+    assert p.calls["sympy solve"] == 1
+    # simplify() recurses into both sides of the Equation, but is only counted once
+    assert p.calls["simplify"] == 1
+    assert p.calls["dimension check"] > 0
+    assert all(seconds >= 0 for seconds in p.seconds.values())
+    assert p.total_seconds >= p.seconds["sympy solve"]
+
+
+def test_profile_call_sites_are_outside_mathpad():
+    x = "x" * m
+
+    with profile() as p:
+        solve([x == 3 * m], [x])
+
+    op, site, seconds = p.hottest(1)[0]
+    assert __file__ in site
+    assert seconds > 0
+    assert "sympy solve" in p.report()
+
+
+def test_profile_only_collects_within_block():
+    x = "x" * m
+
+    with profile() as p:
+        pass
+
+    solve([x == 3 * m], [x])
+    assert not p.calls
+
+
+def test_profile_wraps_unit_functions_only_while_active():
+    import sympy.physics.units.util
+    import mathpad.core.val
+
+    x = "x" * m
+
+    with profile() as p:
+        (x * 5 * km).in_units(mm**2)
+        x + 1 * km == 3 * m
+
+    assert p.calls["unit conversion"] > 0
+    assert p.calls["unit simplification"] > 0
+    assert mathpad.core.val.convert_to is sympy.physics.units.util.convert_to
+    assert mathpad.core.val.quantity_simplify is sympy.physics.units.util.quantity_simplify
+
+    # as are the checks & constructors run by every Val operation
+    assert p.calls["dimension check"] > 0
+    assert p.calls["equation"] > 0
+    assert not hasattr(Equation.__init__, "__wrapped__")
+    assert not hasattr(DimensionError.check, "__wrapped__")
+
+
+def test_profile_depth_is_per_thread():
+    import threading
+    from mathpad._profiling import profiled
+
+    @profiled("threaded op")
+    def work(spawn: bool):
+        if spawn:
+            # runs to completion while this thread is still inside the op
+            worker = threading.Thread(target=work, args=(False,))
+            worker.start()
+            worker.join()
+
+    with profile() as p:
+        work(True)
+
+    assert p.calls["threaded op"] == 2
@@ -0,0 +1,96 @@
+import numpy
+from mathpad import *
+
+from _test_utils import expect_err
+from mathpad.core.val import DimensionError
+
+
+def test_rotation_same_axis_composes_in_closed_form():
+    A, B, C = R3("A") * m, R3("B") * m, R3("C") * m
+    a, b = "a" * rad, "b" * rad
+
+    composed = Mat[A, B].rotation(a, "k") @ Mat[B, C].rotation(b, "k")
+    assert isinstance(composed, RotationMatrix)
+    assert (composed == Mat[A, C].rotation(a + b, "k")).eval()
+
+
+def test_rotation_inv_is_transpose():
+    A, B = R2("A") * m, R2("B") * m
+    theta = "theta" * rad
+
+    rotation = Mat[A, B].rotation(theta)
+    inverse = rotation.inv
+    assert inverse.left_frame is B and inverse.right_frame is A
+    assert (inverse == Mat[B, A].rotation(-theta)).eval()
+
+    v = A[1 * m, 0]
+    assert (simplify(rotation @ rotation.solve(v)) == v).eval()
+
+
+def test_rotation_products_are_compact():
+    A, B, C, D = R3("A"), R3("B"), R3("C"), R3("D")
+    a, b, c = "a" * rad, "b" * rad, "c" * rad
+
+    composed = Mat[A, B].rotation(a, "k") @ Mat[B, C].rotation(b, "j") @ Mat[C, D].rotation(c, "j")
+    euler = Mat[A, D].euler("kjj", a, b, c)
+
+    values = {a: 0.1, b: 0.2, c: 0.3}
+    assert abs(composed.to_numpy(values) - euler.to_numpy(values)).max() < 1e-12
+    # the angles about j add up
+    assert "b + c" in str(composed.expr)
+
+
+def test_euler_and_quaternion():
+    A, B = R3("A"), R3("B")
+    yaw, pitch, roll = "yaw" * rad, "pitch" * rad, "roll" * rad
+
+    values = {yaw: 0.3, pitch: -0.2, roll: 1.1}
+    rotation = Mat[A, B].euler("kji", yaw, pitch, roll).to_numpy(values)
+    assert abs(rotation @ rotation.T - numpy.eye(3)).max() < 1e-12
+    assert abs(numpy.linalg.det(rotation) - 1) < 1e-12
+
+    half = numpy.sqrt(0.5)
+    quarter_turn = Mat[A, B].quaternion(half, 0, 0, half).to_numpy()
+    assert abs(quarter_turn - Mat[A, B].rotation(pi / 2, "k").to_numpy()).max() < 1e-12
+
+
+def test_rotation_requires_uniform_units():
+    A, B = R2("A") * m, R2("B") * s
+
+    with expect_err(DimensionError):
+        Mat[A, B].rotation("theta" * rad)
+
+
+def test_rotation_requires_angles():
+    A, B = R3("A"), R3("B")
+
+    with expect_err(DimensionError):
+        Mat[A, B].rotation(3 * m, "k")
+
+    with expect_err(DimensionError):
+        Mat[A, B].euler("kji", "yaw" * rad, 3 * s, 0)
+
+    with expect_err(DimensionError):
+        Mat[A, B].quaternion(1 * m, 0, 0, 0)
+
+    # plain numbers are taken as radians
+    assert abs(Mat[A, B].rotation(0.5, "k").to_numpy() - Mat[A, B].rotation(0.5 * rad, "k").to_numpy()).max() < 1e-12
+
+
+def test_rotation_converts_angles_to_radians():
+    A, B = R3("A"), R3("B")
+
+    quarter_turn = Mat[A, B].rotation(pi / 2, "k").to_numpy()
+    assert abs(Mat[A, B].rotation(90 * degrees, "k").to_numpy() - quarter_turn).max() < 1e-12
+    assert abs(Mat[A, B].euler("kji", 90 * degrees, 0, 0).to_numpy() - quarter_turn).max() < 1e-12
+
+
+def test_rotation_requires_identical_units():
+    with expect_err(AssertionError):
+        Mat[R2("A") * m, R2("B") * mm].rotation("theta" * rad)
+
+    with expect_err(AssertionError):
+        Mat[R3("A") * m, R3("B") * mm].euler("kji", "yaw" * rad, 0, 0)
+
+    # equivalent units are fine
+    Mat[R2("A") * N, R2("B") * kg * m / s**2].rotation("theta" * rad)
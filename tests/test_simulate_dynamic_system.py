@@ -0,0 +1,62 @@
+import math
+
+from mathpad import *
+
+
+def harmonic_oscillator(**kwargs):
+    x = "x(t)" * m
+    return simulate_dynamic_system(
+        [diff(x, 2) == -x * (1 / s**2)],
+        x_final=1,
+        max_step=0.01,
+        initial_conditions={x: 1, diff(x): 0},
+        record=[x],
+        verbose=False,
+        display_plots=False,
+        display_progress_bar=False,
+        **kwargs
+    )
+
+
+def test_simulate_harmonic_oscillator():
+    t_final, [x_final] = harmonic_oscillator()[-1]
+
+    assert t_final == 1
+    assert math.isclose(x_final, math.cos(1), rel_tol=1e-3)
+
+
+def test_simulate_timings():
+    timings = {}
+    harmonic_oscillator(timings=timings)
+
+    assert list(timings) == ["substitute", "simplify", "solve", "lambdify", "integrate"]
+    assert all(seconds >= 0 for seconds in timings.values())
+    assert timings["integrate"] > 0
+
+
+def test_simulate_simplifies_with_medium_by_default(monkeypatch):
+    from mathpad.maths.algebra import _SIMPLIFIERS
+
+    used = []
+
+    def recording(strategy, simplifier):
+        def simplify_expr(expr):
+            used.append(strategy)
+            return simplifier(expr)
+        return simplify_expr
+
+    for strategy, simplifier in list(_SIMPLIFIERS.items()):
+        monkeypatch.setitem(_SIMPLIFIERS, strategy, recording(strategy, simplifier))
+
+    harmonic_oscillator()
+    assert set(used) == {"medium"}
+
+    used.clear()
+    with global_options(simplify_strategy="fast"):
+        harmonic_oscillator()
+    assert set(used) == {"fast"}
+
+    # simplify() itself still defaults to "full"
+    used.clear()
+    simplify("x" * m + "x" * m)
+    assert set(used) == {"full"}
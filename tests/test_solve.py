@@ -1,3 +1,7 @@
+import time
+
+import sympy
+
 from mathpad import *
 
 
@@ -39,3 +43,30 @@ def test_solve1_meters_eq_meters_plus_kilometers():
     assert isinstance(sln, Solution)
     assert sln[c].expr == 2010
     assert sln[c].units == c.units
+
+
+def slow_solve(*args, **kwargs):
+    time.sleep(10)
+
+
+def test_solve_timeout_raises_with_partial(monkeypatch):
+    a, b = "a" * dimensionless, "b" * dimensionless
+    eqns = [a**5 + a * b == 3, b**3 - a**2 == 2]
+
+    monkeypatch.setattr(sympy, "solve", slow_solve)
+    try:
+        solve(eqns, [a, b], timeout=0.05)
+    except BudgetExceededError as e:
+        assert len(e.partial) == 2
+    else:
+        assert False, "Expected BudgetExceededError"
+
+
+def test_solve_timeout_numeric_fallback(monkeypatch):
+    a = "a" * dimensionless
+
+    monkeypatch.setattr(sympy, "solve", slow_solve)
+    sln, = solve([a**5 + a == 3], [a], timeout=0.05, numeric_guess={a: 1})
+
+    assert abs(float(sln[a].expr) - 1.1329975) < 1e-6
+
@@ -0,0 +1,29 @@
+from sympy.physics.units.quantities import Quantity
+
+import mathpad.core.units as units
+import mathpad.core.constants as constants
+from mathpad.core.val import Val, _canonical_unit_key, _unit_key, _is_dimensionless
+
+
+def test_precomputed_units_match_construction():
+    # the generated tables must agree with what Val.__init__ would compute; regenerate them if not
+    for module in (units, constants):
+        for name, unit in vars(module).items():
+            if not isinstance(unit, Val):
+                continue
+
+            constructed = unit.__class__(unit.units)
+
+            assert isinstance(unit.units, Quantity), name
+            assert unit.expr == 1, name
+            assert constructed.units == unit.units, name
+            assert constructed.dimension == unit.dimension, name
+            assert _unit_key(unit.units) == _canonical_unit_key(unit.units), name
+
+
+def test_precomputed_units_arithmetic():
+    speed = (36 * units.km / units.hour).in_units(units.meters / units.seconds)
+    assert speed.expr == 10
+
+    count = constants.avogadro_constant * (2 * units.mol)
+    assert _is_dimensionless(count.dimension)
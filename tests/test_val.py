@@ -303,4 +303,76 @@ def test_pow_int_meters_fails():
         assert False
 
     except DimensionalExponentError as e:
-        assert True
\ No newline at end of file
+        assert True
+
+
+def test_quantity_free_tracking():
+    import sympy.physics.units as su
+
+    x = "x" * meters
+    y = "y(t)" * seconds
+
+    assert x._quantity_free and y._quantity_free
+    assert (-(x * y / 2 + 3 * x * y) ** 2).in_units(mm**2 * s**2)._quantity_free
+
+    with_quantity = Val(meters.units, x.expr * su.meter)
+    assert not with_quantity._quantity_free
+    assert not (with_quantity * x)._quantity_free
+
+
+def test_vals_are_slotted():
+    import pickle
+
+    x = "x" * meters
+    speed = x / seconds
+    force = 5 * newtons
+
+    for val in (x, speed, force, Val(meters.units * ohms.units, 2)):
+        assert not hasattr(val, "__dict__")
+
+        roundtrip = pickle.loads(pickle.dumps(val))
+        assert roundtrip.expr == val.expr
+        assert roundtrip.units == val.units
+        assert roundtrip.dimension == val.dimension
+
+    # units are shared rather than copied
+    assert (x * 2).units is x.units
+
+
+def test_unit_caches_are_bounded():
+    from mathpad.core.val import _CACHE_SIZE, _intern, _computed_unit_entry, _unit_key, _units_dimension
+
+    assert _intern.cache_info().maxsize == _CACHE_SIZE
+    assert _computed_unit_entry.cache_info().maxsize == _CACHE_SIZE
+    assert _units_dimension.cache_info().maxsize == _CACHE_SIZE
+
+    # the generated units are always kept
+    assert _unit_key(newtons.units) == (1, (kg * meters / seconds**2).units)
+
+
+def test_canonical_unit_keys():
+    from mathpad.core.val import _unit_key
+
+    assert _unit_key(newtons.units) == _unit_key((kg * meters / seconds**2).units)
+    assert _unit_key((km / hour).units) == (sympy.Rational(5, 18), (meters / seconds).units)
+    # angles have no SI base unit form; they take the slow path
+    assert _unit_key(radians.units) is None
+
+    assert (5 * newtons + 2 * kg * meters / seconds**2).expr == 7
+    assert (1 * km + 1 * meters).in_units(mm).expr == 1001000
+    assert ((36 * km / hour).in_units(meters / seconds)).expr == 10
+
+
+def test_hash_includes_units():
+    assert hash(5 * meters) != hash(5 * seconds)
+    assert hash(5 * meters) == hash(5 * meters)
+    assert hash(5 * newtons) == hash(5 * kg * meters / seconds**2)
+
+    x = "x" * meters
+    lookup = {x: 1, "x" * seconds: 2}
+    assert lookup[x] == 1
+
+
+def test_in_units_irrational_factor():
+    assert (90 * degrees).in_units(radians).expr == sympy.pi / 2
+    assert (sympy.pi * radians).in_units(degrees).expr == 180
@@ -241,4 +241,84 @@ def test_R3_sym_func_diff_iter():
 
     assert str(x) == 'Derivative(\\vec{vec}_{i}(t), t) meters/second'
     assert str(y) == 'Derivative(\\vec{vec}_{j}(t), t) meters/second'
-    assert str(z) == 'Derivative(\\vec{vec}_{k}(t), t) meters/second'
\ No newline at end of file
+    assert str(z) == 'Derivative(\\vec{vec}_{k}(t), t) meters/second'
+
+
+def test_vector_hash():
+    O = R3("O") * m
+    T = R3("T") * s
+
+    assert hash(O[1, 2, 3]) == hash(O[1, 2, 3])
+    assert hash(O[1, 2, 3]) != hash(T[1, 2, 3])
+    assert hash("vec(t)" @ O) == hash("vec(t)" @ O)
+
+
+def test_vector_state_drops_caches():
+    import copy
+
+    O = R3("O") * m
+    vec = O[1, 2, 3]
+    hash(vec)
+    vec[0]
+
+    # the state used by pickle & copy. The cached hash isn't portable between processes
+    assert set(vec.__getstate__()) == {"frame", "expr"}
+
+    copied = copy.copy(vec)
+    assert not hasattr(copied, "_hash") and not hasattr(copied, "_elements")
+    assert copied.expr == vec.expr
+    assert hash(copied) == hash(vec)
+
+
+def test_Vector_to_numpy():
+    x = "x" * m
+    O = R2("O") * m
+
+    vec = O[x, 2 * x]
+    res = vec.to_numpy({x: [1, 2, 3]})
+    assert res.shape == (3, 2)
+    assert (res == [[1, 2], [2, 4], [3, 6]]).all()
+
+    # Vals are converted into the units of their key
+    res, units = vec.to_numpy({x: 300 * cm}, with_units=True)
+    assert (res == [3, 6]).all()
+    assert [unit.units for unit in units] == [m.units, m.units]
+
+    w = "w" @ O
+    assert ((w + vec).to_numpy({w: [[1, 1], [2, 2]], x: 0}) == [[1, 1], [2, 2]]).all()
+
+    with expect_err(AssertionError):
+        vec.to_numpy()
+
+
+def test_Vector_elements_are_cached():
+    O = R3("O") * m
+    vec = O["x" * m, 2, 3]
+
+    assert vec[0] is vec[0]
+    assert vec.i is vec[0]
+    assert list(vec) == [vec[0], vec[1], vec[2]]
+    assert vec[1].units == m.units
+    assert vec[1].dimension == Val(m.units, 2).dimension
+
+
+def test_R3_sym_dot_and_norm_stay_symbolic():
+    O = R3("O") * m
+    vec = "vec" @ O
+    vec2 = O[1, 2, 3]
+
+    # the MatrixSymbol isn't made explicit until evaluated
+    assert vec.dot(vec2).expr.has(vec.expr)
+    assert (vec.dot(vec) == vec.dot(vec)).eval()
+
+    x, y, z = vec2
+    assert (vec2.norm() == sqrt(x ** 2 + y ** 2 + z ** 2)).eval()
+
+
+def test_Vector_homogeneous():
+    O = R3("O") * m
+    v = O[1, 2, 3].homogeneous()
+
+    assert v.frame is O.homogeneous()
+    assert v.frame.space.base_names == ("i", "j", "k", "w")
+    assert list(v.expr) == [1, 2, 3, 1]
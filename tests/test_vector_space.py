@@ -101,6 +101,18 @@ def test_Val_mul_VectorSpace():
     for units in (m * O).space.base_units:
         assert units == m**2
 
+def test_derived_spaces_are_reused():
+    O = R3("O") * m
+
+    assert (O / s) is (O / s)
+    assert (O / s).space is (O.space / s)
+    assert (O * m) is (m * O)
+
+    # derivatives share their frame, so they can be added
+    x = "x(t)" * m
+    r = O[x, 2 * x, 0]
+    assert (diff(r) + diff(r)).frame is diff(r).frame
+
 def test_create_vector_symbolic_function():
     x = "x" * m
     s = "s(x)" @ R3("O") * m